@@ -0,0 +1,303 @@
+"""Benchmark the latency and the SQL queries of the read API endpoints under concurrent load.
+
+The database is seeded with the factories of the tests, by bulk inserts: repositories spread over owners,
+their issues, the comments of a share of the issues, long history chains of a few repositories, issues and
+comments, and a user following repositories. Seeding the default volumes takes a while, run the benchmark
+with `--keepdb` to seed them once and reuse them on the next runs.
+
+Each endpoint is then requested by concurrent clients, on objects picked at random, and its latency
+percentiles and queries per request are compared with the thresholds of `--thresholds`. The run fails if
+any of them is exceeded, so it can guard against regressions.
+
+Usage:
+    python -m benchmarks.api --keepdb --requests 1000 --concurrency 8
+"""
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from benchmarks.utils import QueryCounter, benchmark_database, get_peak_rss, report, setup_django
+
+DEFAULT_THRESHOLDS = Path(__file__).parent / "api_thresholds.json"
+SEED_BATCH_SIZE = 10_000
+SAMPLE_SIZE = 1_000
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repositories", type=int, default=10_000, help="The number of seeded repositories.")
+    parser.add_argument("--repositories-per-owner", type=int, default=100, help="The repositories of each owner.")
+    parser.add_argument("--issues", type=int, default=1_000_000, help="The number of seeded issues.")
+    parser.add_argument("--commented-issues", type=int, default=5_000, help="The number of issues with comments.")
+    parser.add_argument("--comments-per-issue", type=int, default=20, help="The comments of the commented issues.")
+    parser.add_argument("--history-chains", type=int, default=20, help="The objects of each model with a history.")
+    parser.add_argument("--history-length", type=int, default=500, help="The history records of each of them.")
+    parser.add_argument("--follows", type=int, default=500, help="The repositories followed by the user.")
+    parser.add_argument("--requests", type=int, default=500, help="The number of requests per endpoint.")
+    parser.add_argument("--concurrency", type=int, default=8, help="The number of concurrent clients.")
+    parser.add_argument("--cold", action="store_true", help="Invalidate the cached responses before every request.")
+    parser.add_argument(
+        "--thresholds",
+        default=str(DEFAULT_THRESHOLDS),
+        help="A JSON file of the `p50_ms`, `p99_ms` and `queries` thresholds per endpoint, `*` applies to all.",
+    )
+    parser.add_argument("--keepdb", action="store_true", help="Keep the seeded database for the next run.")
+    parser.add_argument("--json", help="Write the results to this JSON file.")
+    return parser.parse_args()
+
+
+def seed(args: argparse.Namespace) -> None:
+    """Seed the benchmark database with the factories, unless it was seeded by a previous run."""
+    from gissues.extensions.auth.models import UserRepositoryFollow
+    from gissues.extensions.github.models import Comments, Issue, Repository
+    from gissues.tests.factories import CommentsFactory, IssueFactory, RepositoryFactory, UserFactory
+
+    if Repository.objects.exists():
+        print("The database is already seeded, the seeding options are ignored.")
+        return None
+
+    started_at = time.perf_counter()
+
+    for start in range(0, args.repositories, SEED_BATCH_SIZE):
+        Repository.objects.bulk_create(
+            [
+                RepositoryFactory.build(owner_name=f"owner{index // args.repositories_per_owner}", name=f"repo-{index}")
+                for index in range(start, min(start + SEED_BATCH_SIZE, args.repositories))
+            ]
+        )
+    repositories = [Repository(pk=pk) for pk in Repository.objects.order_by("pk").values_list("pk", flat=True)]
+
+    # The objects are built and inserted in batches, so the memory doesn't grow with the volumes
+    issues_per_repository = -(-args.issues // args.repositories)
+    for start in range(0, args.issues, SEED_BATCH_SIZE):
+        Issue.objects.bulk_create(
+            [
+                IssueFactory.build(
+                    repository=repositories[index // issues_per_repository], number=index % issues_per_repository + 1
+                )
+                for index in range(start, min(start + SEED_BATCH_SIZE, args.issues))
+            ]
+        )
+
+    commented_issues = [
+        Issue(pk=pk) for pk in Issue.objects.order_by("pk").values_list("pk", flat=True)[: args.commented_issues]
+    ]
+    Issue.objects.filter(pk__in=[issue.pk for issue in commented_issues]).update(comment_count=args.comments_per_issue)
+    comments = (
+        CommentsFactory.build(issue=issue, comment_id=index * args.comments_per_issue + offset + 1)
+        for index, issue in enumerate(commented_issues)
+        for offset in range(args.comments_per_issue)
+    )
+    while batch := [comment for _, comment in zip(range(SEED_BATCH_SIZE), comments)]:
+        Comments.objects.bulk_create(batch)
+
+    for model in (Repository, Issue, Comments):
+        seed_history(model, list(model.objects.order_by("pk")[: args.history_chains]), args.history_length)
+
+    user = UserFactory.create(username="benchmark", is_active=True)
+    UserRepositoryFollow.objects.bulk_create(
+        [UserRepositoryFollow(user=user, repository=repository) for repository in repositories[: args.follows]]
+    )
+
+    print(f"Seeded the database in {time.perf_counter() - started_at:.2f} seconds.")
+
+
+def seed_history(model: Any, objs: list[Any], length: int) -> None:
+    """Create a chain of history records for the objects, changing a tracked field at every step."""
+    from django.utils import timezone
+
+    field_name = "description" if hasattr(model, "description") else "body"
+    started_at = timezone.now() - timezone.timedelta(days=length)
+    for step in range(length):
+        for obj in objs:
+            setattr(obj, field_name, f"{getattr(obj, field_name)[:200]} {step}")
+        model.history.bulk_history_create(
+            objs, update=step > 0, default_date=started_at + timezone.timedelta(days=step)
+        )
+
+
+@dataclass
+class Endpoint:
+    name: str
+    # Get the URL of a request and the scope of its cached response, if it is cached
+    get_request: Callable[[random.Random], tuple[str, Optional[tuple[Any, ...]]]]
+    latencies: list[float] = field(default_factory=list)
+    queries: list[int] = field(default_factory=list)
+    errors: int = 0
+
+
+def get_endpoints() -> list[Endpoint]:
+    """Get the benchmarked endpoints, requesting objects picked at random from the seeded ones."""
+    from django.urls import reverse
+
+    from gissues.extensions.github.models import Comments, Issue, Repository
+    from gissues.extensions.github_client.cache import issue_scope, owner_scope, repository_scope
+
+    repositories = list(Repository.objects.order_by("?").values_list("owner_name", "name")[:SAMPLE_SIZE])
+    issues = list(
+        Issue.objects.filter(comment_count__gt=0)
+        .order_by("?")
+        .values_list("repository__owner_name", "repository__name", "number")[:SAMPLE_SIZE]
+    )
+    comments = list(
+        Comments.objects.order_by("?").values_list(
+            "issue__repository__owner_name", "issue__repository__name", "issue__number", "comment_id"
+        )[:SAMPLE_SIZE]
+    )
+    # The history actions are requested on the objects with the longest history
+    history_repositories = list(Repository.history.values_list("owner_name", "name").distinct())
+    history_issues = list(Issue.history.values_list("repository__owner_name", "repository__name", "number").distinct())
+    history_comments = list(
+        Comments.history.values_list(
+            "issue__repository__owner_name", "issue__repository__name", "issue__number", "comment_id"
+        ).distinct()
+    )
+
+    def repository_request(url_name: str, objs: list[tuple[Any, ...]], detail: bool) -> Endpoint:
+        def get_request(rng: random.Random) -> tuple[str, Optional[tuple[Any, ...]]]:
+            owner_name, name = rng.choice(objs)
+            kwargs = {"repository_owner": owner_name, **({"name": name} if detail else {})}
+            return reverse(f"api:{url_name}", kwargs=kwargs), owner_scope(owner_name)
+
+        return Endpoint(url_name, get_request)
+
+    def issue_request(url_name: str, objs: list[tuple[Any, ...]], detail: bool) -> Endpoint:
+        def get_request(rng: random.Random) -> tuple[str, Optional[tuple[Any, ...]]]:
+            owner_name, repository_name, number = rng.choice(objs)
+            kwargs = {"repository_owner": owner_name, "repository_name": repository_name}
+            if detail:
+                kwargs["number"] = number
+            return reverse(f"api:{url_name}", kwargs=kwargs), repository_scope(owner_name, repository_name)
+
+        return Endpoint(url_name, get_request)
+
+    def comment_request(url_name: str, objs: list[tuple[Any, ...]], detail: bool) -> Endpoint:
+        def get_request(rng: random.Random) -> tuple[str, Optional[tuple[Any, ...]]]:
+            owner_name, repository_name, number, comment_id = rng.choice(objs)
+            kwargs = {"repository_owner": owner_name, "repository_name": repository_name, "issue_number": number}
+            if detail:
+                kwargs["comment_id"] = comment_id
+            return reverse(f"api:{url_name}", kwargs=kwargs), issue_scope(owner_name, repository_name, number)
+
+        return Endpoint(url_name, get_request)
+
+    return [
+        repository_request("repository-list", repositories, detail=False),
+        repository_request("repository-detail", repositories, detail=True),
+        repository_request("repository-history", history_repositories, detail=True),
+        issue_request("repository-issues-list", issues, detail=False),
+        issue_request("repository-issues-detail", issues, detail=True),
+        issue_request("repository-issues-history", history_issues, detail=True),
+        comment_request("issue-comments-list", comments, detail=False),
+        comment_request("issue-comments-detail", comments, detail=True),
+        comment_request("issue-comments-history", history_comments, detail=True),
+        Endpoint("following-repositories-list", lambda rng: (reverse("api:following-repositories-list"), None)),
+    ]
+
+
+def run_endpoint(endpoint: Endpoint, args: argparse.Namespace) -> float:
+    """Request an endpoint from concurrent clients, recording the latency and the queries of every request.
+
+    Returns:
+        float: The elapsed seconds.
+    """
+    from django.db import connection
+    from django.test import Client
+
+    from gissues.extensions.auth.models import User
+    from gissues.extensions.github_client.cache import response_cache
+
+    user = User.objects.get(username="benchmark")
+    lock = threading.Lock()
+
+    def run_client(client_index: int) -> None:
+        client = Client()
+        client.force_login(user)
+        try:
+            for index in range(client_index, args.requests, args.concurrency):
+                url, scope = endpoint.get_request(random.Random(index))
+                if args.cold and scope is not None:
+                    response_cache.invalidate(scope)
+
+                with QueryCounter().measure() as queries:
+                    started_at = time.perf_counter()
+                    response = client.get(url)
+                    latency = time.perf_counter() - started_at
+
+                with lock:
+                    endpoint.latencies.append(latency * 1000)
+                    endpoint.queries.append(queries.count)
+                    endpoint.errors += response.status_code != 200
+        finally:
+            # Every client thread has a database connection of its own
+            connection.close()
+
+    started_at = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        list(executor.map(run_client, range(args.concurrency)))
+    return time.perf_counter() - started_at
+
+
+def check_thresholds(rows: list[dict[str, Any]], thresholds: dict[str, dict[str, float]]) -> list[str]:
+    """Get the thresholds exceeded by the results, `*` applies to every endpoint unless it has its own."""
+    columns = {"p50_ms": "p50 (ms)", "p99_ms": "p99 (ms)", "queries": "max queries"}
+    failures = []
+    for row in rows:
+        if row["errors"]:
+            failures.append(f"{row['endpoint']}: {row['errors']} requests failed")
+
+        for name, threshold in {**thresholds.get("*", {}), **thresholds.get(row["endpoint"], {})}.items():
+            if row[columns[name]] > threshold:
+                failures.append(f"{row['endpoint']}: {columns[name]} is {row[columns[name]]:g}, over {threshold}")
+    return failures
+
+
+def main() -> None:
+    args = parse_args()
+    setup_django()
+
+    rows = []
+    with benchmark_database(keepdb=args.keepdb):
+        seed(args)
+
+        for endpoint in get_endpoints():
+            elapsed = run_endpoint(endpoint, args)
+            percentiles = statistics.quantiles(endpoint.latencies, n=100, method="inclusive")
+            rows.append(
+                {
+                    "endpoint": endpoint.name,
+                    "requests": len(endpoint.latencies),
+                    "errors": endpoint.errors,
+                    "requests/sec": len(endpoint.latencies) / elapsed,
+                    "p50 (ms)": percentiles[49],
+                    "p99 (ms)": percentiles[98],
+                    "max (ms)": max(endpoint.latencies),
+                    "mean queries": statistics.mean(endpoint.queries),
+                    "max queries": max(endpoint.queries),
+                }
+            )
+
+    report(
+        f"Read API with {args.concurrency} concurrent clients, {args.requests} requests per endpoint"
+        f"{', cold response cache' if args.cold else ''}, peak RSS {get_peak_rss():.2f} MiB",
+        rows,
+        args.json,
+    )
+
+    failures = check_thresholds(rows, json.loads(Path(args.thresholds).read_text()))
+    if failures:
+        print("\nThresholds exceeded:\n" + "\n".join(f"- {failure}" for failure in failures))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
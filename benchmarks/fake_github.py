@@ -0,0 +1,241 @@
+"""A local HTTP server that serves the GitHub REST API endpoints used by the issue sync.
+
+The repositories, issues and comments are generated on the fly from their numbers, so serving a
+repository with 50k issues doesn't hold them all in memory. The server paginates with `Link` headers,
+answers conditional requests with `304 Not Modified`, sends the `X-RateLimit-*` headers and can delay
+every response to simulate the network latency to GitHub.
+"""
+
+import datetime
+import hashlib
+import json
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import takewhile
+from typing import Any, Callable, Optional, Sequence
+from urllib.parse import parse_qs, urlencode, urlparse
+
+CREATED_AT = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def _format(value: datetime.datetime) -> str:
+    return value.isoformat().replace("+00:00", "Z")
+
+
+@dataclass
+class FakeRepository:
+    owner_name: str
+    name: str
+    issue_count: int
+    comments_per_issue: int
+    body_size: int
+    # Comment ids are unique across repositories
+    comment_id_offset: int = 0
+    # The number of times each issue was edited, an edit moves its `updated_at` after every other issue
+    edits: dict[int, int] = field(default_factory=dict)
+    edited_at: dict[int, datetime.datetime] = field(default_factory=dict)
+
+    def edit(self, issue_numbers: list[int]) -> None:
+        now = datetime.datetime.now(datetime.timezone.utc)
+        for issue_number in issue_numbers:
+            self.edits[issue_number] = self.edits.get(issue_number, 0) + 1
+            self.edited_at[issue_number] = now
+
+    def get_updated_at(self, issue_number: int) -> datetime.datetime:
+        return self.edited_at.get(issue_number, CREATED_AT + datetime.timedelta(seconds=issue_number))
+
+    def get_issue_numbers(self, since: Optional[datetime.datetime] = None) -> list[int]:
+        """Get the issue numbers, the most recently updated first, as the issues are requested by the sync."""
+        # The issues that were never edited are ordered by their numbers, only the edited ones need sorting
+        edited_numbers = sorted(self.edited_at, key=self.edited_at.__getitem__, reverse=True)
+        numbers = [
+            *edited_numbers,
+            *(number for number in range(self.issue_count, 0, -1) if number not in self.edited_at),
+        ]
+        if since is None:
+            return numbers
+
+        return list(takewhile(lambda number: self.get_updated_at(number) >= since, numbers))
+
+    def get_issue(self, issue_number: int) -> dict[str, Any]:
+        edits = self.edits.get(issue_number, 0)
+        return {
+            "number": issue_number,
+            "title": f"Issue {issue_number}" + (f" (edited {edits} times)" if edits else ""),
+            "body": ("Lorem ipsum dolor sit amet. " * (self.body_size // 28 + 1))[: self.body_size],
+            "state": "open",
+            "state_reason": None,
+            "closed_at": None,
+            "locked": False,
+            "active_lock_reason": None,
+            "comments": self.comments_per_issue,
+            "created_at": _format(CREATED_AT + datetime.timedelta(seconds=issue_number)),
+            "updated_at": _format(self.get_updated_at(issue_number)),
+        }
+
+    def get_comment(self, issue_number: int, index: int) -> dict[str, Any]:
+        return {
+            "id": self.comment_id_offset + issue_number * self.comments_per_issue + index,
+            "body": f"Comment {index} of issue {issue_number}.",
+            "created_at": _format(CREATED_AT + datetime.timedelta(seconds=issue_number, milliseconds=index)),
+            "updated_at": _format(CREATED_AT + datetime.timedelta(seconds=issue_number, milliseconds=index)),
+        }
+
+    def get_repository(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "owner": {"login": self.owner_name},
+            "description": f"A fake repository with {self.issue_count} issues.",
+            "private": False,
+            "fork": False,
+            "created_at": _format(CREATED_AT),
+            "updated_at": _format(CREATED_AT),
+            "pushed_at": _format(CREATED_AT),
+        }
+
+
+class FakeGitHub(ThreadingHTTPServer):
+    """The fake GitHub API server, counting the requests it serves per repository.
+
+    Args:
+        repositories (list[FakeRepository]): The repositories to serve.
+        latency (float): The seconds every response is delayed by. Defaults to 0.
+        rate_limit (int): The number of requests allowed per hour, 304 responses aren't counted.
+            Defaults to 1_000_000, so the benchmarks aren't blocked by it.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, repositories: list[FakeRepository], latency: float = 0, rate_limit: int = 1_000_000):
+        super().__init__(("127.0.0.1", 0), FakeGitHubHandler)
+        self.repositories = {(repository.owner_name, repository.name): repository for repository in repositories}
+        self.latency = latency
+        self.rate_limit = self.rate_limit_remaining = rate_limit
+        self.rate_limit_reset = int(time.time()) + 60 * 60
+        self.lock = threading.Lock()
+        self.requests: Counter[tuple[str, str]] = Counter()
+        self.not_modified: Counter[tuple[str, str]] = Counter()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def start(self) -> None:
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+    def reset_counters(self) -> None:
+        with self.lock:
+            self.requests.clear()
+            self.not_modified.clear()
+
+    def count(self, repository: tuple[str, str], is_not_modified: bool) -> int:
+        """Count a request and get the remaining rate limit."""
+        with self.lock:
+            self.requests[repository] += 1
+            if is_not_modified:
+                self.not_modified[repository] += 1
+            else:
+                self.rate_limit_remaining = max(self.rate_limit_remaining - 1, 0)
+            return self.rate_limit_remaining
+
+
+class FakeGitHubHandler(BaseHTTPRequestHandler):
+    server: FakeGitHub
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # Every request would be printed to stderr
+        pass
+
+    def do_GET(self) -> None:
+        time.sleep(self.server.latency)
+
+        url = urlparse(self.path)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        parts = url.path.strip("/").split("/")
+
+        repository = self.server.repositories.get(tuple(parts[1:3])) if len(parts) >= 3 else None
+        if parts[0] != "repos" or repository is None:
+            return self.send_json(HTTPStatus.NOT_FOUND, {"message": "Not Found"})
+
+        if len(parts) == 3:
+            return self.send_json(HTTPStatus.OK, repository.get_repository(), repository)
+
+        if len(parts) == 4 and parts[3] == "issues":
+            # The sync always requests the most recently updated issues first
+            since = datetime.datetime.fromisoformat(query["since"]) if "since" in query else None
+            return self.send_page(repository, query, repository.get_issue_numbers(since), repository.get_issue)
+
+        if len(parts) == 6 and parts[3] == "issues" and parts[5] == "comments":
+            issue_number = int(parts[4])
+            if not 0 < issue_number <= repository.issue_count:
+                return self.send_json(HTTPStatus.NOT_FOUND, {"message": "Not Found"})
+
+            # The comments are listed oldest first, only the ones updated since the last sync are requested
+            indexes = range(repository.comments_per_issue)
+            if "since" in query:
+                since = datetime.datetime.fromisoformat(query["since"])
+                indexes = [
+                    index
+                    for index in indexes
+                    if datetime.datetime.fromisoformat(repository.get_comment(issue_number, index)["updated_at"])
+                    >= since
+                ]
+            return self.send_page(repository, query, indexes, lambda index: repository.get_comment(issue_number, index))
+
+        return self.send_json(HTTPStatus.NOT_FOUND, {"message": "Not Found"})
+
+    def send_page(
+        self,
+        repository: FakeRepository,
+        query: dict[str, str],
+        items: Sequence[int],
+        get_item: Callable[[int], dict[str, Any]],
+    ) -> None:
+        per_page, page = int(query.get("per_page", 30)), int(query.get("page", 1))
+        content = [get_item(item) for item in items[(page - 1) * per_page : page * per_page]]
+
+        links = {}
+        if page * per_page < len(items):
+            links["next"] = f"{self.server.url}{urlparse(self.path).path}?{urlencode({**query, 'page': page + 1})}"
+
+        self.send_json(HTTPStatus.OK, content, repository, links)
+
+    def send_json(
+        self,
+        status: HTTPStatus,
+        content: Any,
+        repository: Optional[FakeRepository] = None,
+        links: Optional[dict[str, str]] = None,
+    ) -> None:
+        body = json.dumps(content).encode()
+        etag = f'"{hashlib.sha256(body).hexdigest()}"'
+
+        is_not_modified = status == HTTPStatus.OK and self.headers.get("If-None-Match") == etag
+        if repository is not None:
+            remaining = self.server.count((repository.owner_name, repository.name), is_not_modified)
+        else:
+            remaining = self.server.rate_limit_remaining
+
+        if is_not_modified:
+            status, body = HTTPStatus.NOT_MODIFIED, b""
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_header("X-RateLimit-Limit", str(self.server.rate_limit))
+        self.send_header("X-RateLimit-Remaining", str(remaining))
+        self.send_header("X-RateLimit-Reset", str(self.server.rate_limit_reset))
+        if links:
+            self.send_header("Link", ", ".join(f'<{url}>; rel="{rel}"' for rel, url in links.items()))
+        self.end_headers()
+        self.wfile.write(body)
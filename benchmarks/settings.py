@@ -0,0 +1,18 @@
+"""The settings of the benchmarks, the project settings with the tasks run eagerly in the benchmark process."""
+
+from gissues.settings import *  # noqa: F401, F403
+from gissues.settings import CACHES, LOGGING
+
+DEBUG = False
+
+# The benchmarks don't touch the cached data of the project, such as the GitHub rate limit budget
+CACHES["default"]["KEY_PREFIX"] = "benchmarks"
+
+# The tasks queued by the sync run in the same process, so their queries and memory are measured too
+CELERY_TASK_ALWAYS_EAGER = True
+CELERY_TASK_EAGER_PROPAGATES = True
+
+EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
+
+# Every GitHub request and response is logged at the INFO level, which would dominate the measurements
+LOGGING["root"]["level"] = "WARNING"
@@ -0,0 +1,105 @@
+"""Benchmark the issue sync against a local fake GitHub server.
+
+The sync pipeline runs as in production, `issue_adapter_task` with the comment tasks it queues, except
+that the tasks run eagerly in this process, so all of their queries and memory are measured. Each
+repository goes through three syncs:
+
+- initial: every issue and comment is new,
+- unchanged: nothing has changed since the initial sync,
+- edited: a share of the issues was edited since the previous sync.
+
+Usage:
+    python -m benchmarks.sync --issues 50000 --latency-ms 20
+"""
+
+import argparse
+import random
+import time
+
+from benchmarks.fake_github import FakeGitHub, FakeRepository
+from benchmarks.utils import QueryCounter, benchmark_database, get_peak_rss, report, setup_django
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repositories", type=int, default=1, help="The number of synced repositories.")
+    parser.add_argument("--issues", type=int, default=50_000, help="The number of issues per repository.")
+    parser.add_argument("--comments-per-issue", type=int, default=2, help="The number of comments per issue.")
+    parser.add_argument("--body-size", type=int, default=2_000, help="The size of the issue bodies, in characters.")
+    parser.add_argument("--latency-ms", type=float, default=20, help="The latency of the fake GitHub API.")
+    parser.add_argument("--edit-ratio", type=float, default=0.01, help="The share of issues edited between syncs.")
+    parser.add_argument("--keepdb", action="store_true", help="Keep the benchmark database for the next run.")
+    parser.add_argument("--json", help="Write the results to this JSON file.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+
+    repositories = [
+        FakeRepository(
+            owner_name="benchmarks",
+            name=f"repository-{index}",
+            issue_count=args.issues,
+            comments_per_issue=args.comments_per_issue,
+            body_size=args.body_size,
+            comment_id_offset=index * (args.issues + 1) * args.comments_per_issue,
+        )
+        for index in range(args.repositories)
+    ]
+    server = FakeGitHub(repositories, latency=args.latency_ms / 1000)
+    server.start()
+
+    setup_django(GITHUB_CLIENT_URL=server.url, GITHUB_CLIENT_AUTH_TOKEN="")
+
+    from gissues.extensions.github.models import Repository
+    from gissues.extensions.github.transformers import transform_repository
+    from gissues.extensions.github_client.tasks import issue_adapter_task
+
+    rows = []
+    with benchmark_database(keepdb=args.keepdb):
+        Repository.objects.filter(owner_name="benchmarks").delete()
+        Repository.objects.bulk_create(
+            [Repository(**transform_repository(repository.get_repository()).dict()) for repository in repositories]
+        )
+
+        # The same issues are edited on every run, so the runs can be compared
+        edit_random, edited_count = random.Random(0), int(args.issues * args.edit_ratio)
+        for phase, changed_count in (("initial", args.issues), ("unchanged", 0), ("edited", edited_count)):
+            if phase == "edited":
+                for repository in repositories:
+                    repository.edit(edit_random.sample(range(1, args.issues + 1), edited_count))
+
+            server.reset_counters()
+            with QueryCounter().measure() as queries:
+                started_at = time.perf_counter()
+                for repository in repositories:
+                    issue_adapter_task(repository.owner_name, repository.name)
+                elapsed = time.perf_counter() - started_at
+
+            changed_issues = changed_count * len(repositories)
+            rows.append(
+                {
+                    "phase": phase,
+                    "seconds": elapsed,
+                    "changed issues": changed_issues,
+                    "issues/sec": changed_issues / elapsed if changed_issues else None,
+                    "queries": queries.count,
+                    "queries/issue": queries.count / changed_issues if changed_issues else None,
+                    "github calls/repo": sum(server.requests.values()) / len(repositories),
+                    "304 responses/repo": sum(server.not_modified.values()) / len(repositories),
+                    "peak rss (MiB)": get_peak_rss(),
+                }
+            )
+
+    server.stop()
+    report(
+        f"Sync of {args.repositories} repositories with {args.issues} issues, "
+        f"{args.comments_per_issue} comments per issue and {args.latency_ms} ms GitHub latency",
+        rows,
+        args.json,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+import json
+import os
+import resource
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+import django
+
+
+def setup_django(**environ: str) -> None:
+    """Set up Django with the benchmark settings.
+
+    The project settings are read from the environment when they're imported, so the values that
+    depend on the benchmark, e.g. the URL of the fake GitHub server, must be set before.
+
+    Args:
+        **environ (str): The environment variables to set.
+    """
+    os.environ.update(environ)
+    os.environ["DJANGO_SETTINGS_MODULE"] = "benchmarks.settings"
+    django.setup()
+
+
+@contextmanager
+def benchmark_database(keepdb: bool = False) -> Iterator[None]:
+    """Run the benchmark against a test database, created next to the configured one.
+
+    Args:
+        keepdb (bool): Whether to keep the test database for the next run, it is destroyed otherwise.
+            Defaults to False.
+    """
+    from django.db import connection
+    from django.test.utils import setup_test_environment, teardown_test_environment
+
+    setup_test_environment()
+    old_name = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(verbosity=0, autoclobber=True, keepdb=keepdb)
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=keepdb)
+        teardown_test_environment()
+
+
+class QueryCounter:
+    """Count the SQL queries run on the default database while it is used as a context manager."""
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __call__(self, execute: Any, sql: str, params: Any, many: bool, context: dict[str, Any]) -> Any:
+        self.count += 1
+        return execute(sql, params, many, context)
+
+    @contextmanager
+    def measure(self) -> Iterator["QueryCounter"]:
+        from django.db import connection
+
+        with connection.execute_wrapper(self):
+            yield self
+
+
+def get_peak_rss() -> float:
+    """Get the peak resident set size of the process, in MiB."""
+    # Linux reports it in KiB
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def report(title: str, rows: list[dict[str, Any]], json_path: Optional[str] = None) -> None:
+    """Print the results of a benchmark as a table, and optionally write them to a JSON file.
+
+    Args:
+        title (str): The title of the benchmark.
+        rows (list[dict[str, Any]]): The results, one row per measured case.
+        json_path (Optional[str]): The JSON file to write the results to. Defaults to None.
+    """
+
+    def format_value(value: Any) -> str:
+        if value is None:
+            return "-"
+        return f"{value:.2f}" if isinstance(value, float) else str(value)
+
+    columns = list(rows[0]) if rows else []
+    widths = {column: max(len(column), *(len(format_value(row[column])) for row in rows)) for column in columns}
+
+    print(f"\n{title}\n")
+    print("  ".join(column.ljust(widths[column]) for column in columns))
+    print("  ".join("-" * widths[column] for column in columns))
+    for row in rows:
+        print("  ".join(format_value(row[column]).ljust(widths[column]) for column in columns))
+
+    if json_path:
+        with open(json_path, "w") as file:
+            json.dump({"title": title, "results": rows}, file, indent=2)
@@ -1,5 +1,6 @@
+import datetime
+
 from django.conf import settings
-from django.utils import timezone
 
 from celery import Celery
 
@@ -12,7 +13,15 @@ app.config_from_object("django.conf:settings", namespace="CELERY")
 ISSUE_SCHEDULE = {
     "issue-system": {
         "task": "gissues.extensions.github_client.tasks.check_for_new_issues",
-        "schedule": timezone.timedelta(minutes=settings.CHECK_FOR_NEW_ISSUES_INTERVAL_IN_MINUTES),
+        "schedule": datetime.timedelta(minutes=settings.ISSUE_SYNC_SCHEDULER_TICK_IN_MINUTES),
+    },
+    "notification-digest": {
+        "task": "gissues.extensions.github_client.tasks.send_notification_digests",
+        "schedule": datetime.timedelta(minutes=settings.NOTIFICATION_DIGEST_INTERVAL_IN_MINUTES),
+    },
+    "history-compaction": {
+        "task": "gissues.extensions.github.tasks.compact_history_task",
+        "schedule": datetime.timedelta(minutes=settings.HISTORY_COMPACTION_INTERVAL_IN_MINUTES),
     },
 }
 
@@ -0,0 +1,9 @@
+from rest_framework import serializers
+
+from gissues.extensions.auth.models import User
+
+
+class NotificationPreferenceSerializer(serializers.ModelSerializer[User]):
+    class Meta:
+        model = User
+        fields = ("notification_delivery",)
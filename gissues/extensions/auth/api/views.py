@@ -1,21 +1,24 @@
+from typing import cast
+
 from django.contrib.auth.base_user import AbstractBaseUser
 from django.db.models import QuerySet
 
-from rest_framework import mixins, permissions
+from rest_framework import generics, mixins, permissions
 from rest_framework.filters import OrderingFilter
 from rest_framework.viewsets import GenericViewSet
 
-from gissues.extensions.auth.models import UserRepositoryFollow
+from gissues.extensions.auth.api.serializers import NotificationPreferenceSerializer
+from gissues.extensions.auth.models import User, UserRepositoryFollow
 from gissues.extensions.github.api.serializers import RepositorySerializer
 from gissues.extensions.github.models import Repository
-from gissues.extensions.utils import pagination_factory
+from gissues.extensions.utils import switchable_pagination_factory
 
 
 class UserRepositoryFollowViewSet(mixins.ListModelMixin, GenericViewSet):
     queryset = UserRepositoryFollow.objects.all()
     serializer_class = RepositorySerializer
     permission_classes = [permissions.IsAuthenticated]
-    pagination_class = pagination_factory(page_size=10)
+    pagination_class = switchable_pagination_factory(page_size=10)
     filter_backends = [OrderingFilter]
     ordering = ["id"]
     http_method_names = ["head", "options", "get"]
@@ -25,3 +28,13 @@ class UserRepositoryFollowViewSet(mixins.ListModelMixin, GenericViewSet):
         return Repository.objects.filter(
             followers__user=request_user,
         )
+
+
+class NotificationPreferenceView(generics.RetrieveUpdateAPIView[User]):
+    serializer_class = NotificationPreferenceSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    http_method_names = ["head", "options", "get", "put", "patch"]
+
+    def get_object(self) -> User:
+        # Only authenticated users are permitted
+        return cast(User, self.request.user)
@@ -0,0 +1,54 @@
+# Generated by Django 5.0.4 on 2026-10-18 01:48
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("account", "0003_userrepositoryfollow_created_at_and_more"),
+        ("github", "0003_repository_issues_synced_at"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="notification_delivery",
+            field=models.CharField(
+                choices=[("immediate", "Immediate"), ("digest", "Digest")], default="immediate", max_length=9
+            ),
+        ),
+        migrations.CreateModel(
+            name="PendingNotification",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "issue",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="pending_notifications",
+                        to="github.issue",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="pending_notifications",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Pending notification",
+                "verbose_name_plural": "Pending notifications",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="pendingnotification",
+            constraint=models.UniqueConstraint(fields=("user", "issue"), name="unique_user_issue_pending_notification"),
+        ),
+    ]
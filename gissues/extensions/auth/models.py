@@ -4,6 +4,10 @@ from django.db.models.functions import Lower
 
 
 class User(AbstractUser):
+    class NotificationDelivery(models.TextChoices):
+        IMMEDIATE = "immediate", "Immediate"
+        DIGEST = "digest", "Digest"
+
     email = models.EmailField(
         "e-mail",
         unique=True,
@@ -12,6 +16,10 @@ class User(AbstractUser):
             "unique": "A user with that e-mail already exists.",
         },
     )
+    # Digest notifications are collected and sent together in a single email at the end of each window
+    notification_delivery = models.CharField(
+        max_length=9, choices=NotificationDelivery.choices, default=NotificationDelivery.IMMEDIATE
+    )
 
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = ["username"]
@@ -45,3 +53,21 @@ class UserRepositoryFollow(models.Model):
 
     def __str__(self) -> str:
         return f"{self.user} follows {self.repository}"
+
+
+class PendingNotification(models.Model):
+    user = models.ForeignKey(User, related_name="pending_notifications", on_delete=models.CASCADE)
+    issue = models.ForeignKey("github.Issue", related_name="pending_notifications", on_delete=models.CASCADE)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Pending notification"
+        verbose_name_plural = "Pending notifications"
+        constraints = [
+            # An issue changed several times within a window is listed once in the digest
+            models.UniqueConstraint(fields=["user", "issue"], name="unique_user_issue_pending_notification"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.issue} for {self.user}"
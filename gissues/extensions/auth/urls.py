@@ -1,9 +1,13 @@
+from django.urls import path
+
 from rest_framework.routers import SimpleRouter
 
-from gissues.extensions.auth.api.views import UserRepositoryFollowViewSet
+from gissues.extensions.auth.api.views import NotificationPreferenceView, UserRepositoryFollowViewSet
 
 router = SimpleRouter()
 
 router.register("following-repositories", UserRepositoryFollowViewSet, basename="following-repositories")
 
-urlpatterns = router.urls
+urlpatterns = router.urls + [
+    path("notification-preferences/", NotificationPreferenceView.as_view(), name="notification-preferences"),
+]
@@ -0,0 +1,61 @@
+import csv
+import json
+from typing import Any, Iterator
+
+from django.conf import settings
+from django.db.models import Prefetch, QuerySet
+
+from rest_framework.utils.encoders import JSONEncoder
+
+from gissues.extensions.github.api.serializers import CommentsSerializer, IssueSerializer
+from gissues.extensions.github.models import Comments, Issue
+
+CONTENT_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+class _Echo:
+    """A file-like object returning what is written to it, so the CSV rows can be streamed as they're written."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def iter_issues(queryset: QuerySet[Issue], include_comments: bool) -> Iterator[dict[str, Any]]:
+    """Iterate over the serialized issues with a server-side cursor, so the memory doesn't grow with their number.
+
+    Args:
+        queryset (QuerySet[Issue]): The exported issues.
+        include_comments (bool): Whether to embed the comments of every issue.
+
+    Yields:
+        dict[str, Any]: The serialized issues, in the order of their numbers.
+    """
+    queryset = queryset.order_by("number")
+    if include_comments:
+        # The comments are prefetched for every chunk of issues fetched from the cursor
+        comments = Comments.objects.order_by("created_at", "comment_id")
+        queryset = queryset.prefetch_related(Prefetch("comments", queryset=comments))
+
+    for issue in queryset.iterator(chunk_size=settings.API_EXPORT_CHUNK_SIZE):
+        data = IssueSerializer(issue).data
+        if include_comments:
+            data["comments"] = CommentsSerializer(issue.comments.all(), many=True).data
+        yield data
+
+
+def export_ndjson(issues: Iterator[dict[str, Any]]) -> Iterator[str]:
+    """Export the issues as newline delimited JSON, one issue per line."""
+    for issue in issues:
+        yield json.dumps(issue, cls=JSONEncoder) + "\n"
+
+
+def export_csv(issues: Iterator[dict[str, Any]], include_comments: bool) -> Iterator[str]:
+    """Export the issues as CSV, one issue per row, the embedded comments are a JSON encoded column."""
+    writer = csv.writer(_Echo())
+    fields = [*IssueSerializer.Meta.fields, *(["comments"] if include_comments else [])]
+
+    yield writer.writerow(fields)
+    for issue in issues:
+        if include_comments:
+            issue["comments"] = json.dumps(issue["comments"], cls=JSONEncoder)
+        yield writer.writerow([issue[field] for field in fields])
@@ -0,0 +1,113 @@
+from typing import Any, TypeVar
+
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import connections
+from django.db.models import Exists, F, FloatField, Model, OuterRef, Q, QuerySet, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+
+from rest_framework import exceptions
+from rest_framework.filters import BaseFilterBackend
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+
+from django_filters import rest_framework as filters
+
+from gissues.extensions.github.models import Comments, Issue
+from gissues.extensions.utils import SwitchablePagination
+
+# The filter backends take the queryset of any model, like DRF's `BaseFilterBackend`
+FilteredModel = TypeVar("FilteredModel", bound=Model)
+
+# Must match the configuration the search vectors are computed with, see the `0006_full_text_search` migration
+SEARCH_CONFIG = "english"
+
+
+class IssueFilterSet(filters.FilterSet):
+    """Filter the issues of a repository, e.g. `?is_closed=false&updated_at__gte=2024-01-01T00:00:00Z`.
+
+    The filters on the state and the update date are backed by the indexes of `Issue`.
+    """
+
+    class Meta:
+        model = Issue
+        fields = {
+            "is_closed": ["exact"],
+            "state_reason": ["exact"],
+            "is_locked": ["exact"],
+            "created_at": ["gte", "lte"],
+            "updated_at": ["gte", "lte"],
+            "comment_count": ["gte", "lte"],
+        }
+
+
+class CommentsFilterSet(filters.FilterSet):
+    """Filter the comments of an issue, e.g. `?updated_at__gte=2024-01-01T00:00:00Z`."""
+
+    class Meta:
+        model = Comments
+        fields = {
+            "created_at": ["gte", "lte"],
+            "updated_at": ["gte", "lte"],
+        }
+
+
+class IssueSearchFilter(BaseFilterBackend):
+    """Full-text search over the title and the body of the issues, and the body of their comments.
+
+    On PostgreSQL the search terms support the web search syntax, e.g. `"exact phrase" -excluded or other`,
+    and they're matched against the search vectors maintained by the database. Unless an ordering is requested,
+    the issues are ranked by their best match, a match in the title ranks above one in the body, which ranks
+    above one in the comments. The other databases match the terms as a substring, without ranking.
+
+    The cursor pagination can't follow the ranking, it's computed for every request, so the search is
+    rejected with it. The ranked results are paginated by page instead.
+    """
+
+    search_param = "search"
+
+    def filter_queryset(
+        self, request: Request, queryset: QuerySet[FilteredModel], view: Any
+    ) -> QuerySet[FilteredModel]:
+        terms = request.query_params.get(self.search_param, "").strip()
+        if not terms:
+            return queryset
+
+        paginator = getattr(view, "paginator", None)
+        if (
+            isinstance(paginator, SwitchablePagination)
+            and request.query_params.get(paginator.pagination_query_param) == "cursor"
+        ):
+            raise exceptions.ValidationError({self.search_param: ["Can't be combined with the cursor pagination."]})
+
+        if connections[queryset.db].vendor != "postgresql":
+            comments = Comments.objects.filter(issue=OuterRef("pk"), body__icontains=terms)
+            return queryset.filter(Q(title__icontains=terms) | Q(body__icontains=terms) | Exists(comments))
+
+        query = SearchQuery(terms, config=SEARCH_CONFIG, search_type="websearch")
+        comments = Comments.objects.filter(issue=OuterRef("pk"), search_vector=query)
+        comment_rank = comments.annotate(rank=SearchRank(F("search_vector"), query)).order_by("-rank").values("rank")
+        queryset = queryset.filter(Q(search_vector=query) | Exists(comments)).annotate(
+            search_rank=Greatest(
+                Coalesce(SearchRank(F("search_vector"), query), Value(0.0)),
+                Coalesce(Subquery(comment_rank[:1]), Value(0.0)),
+                output_field=FloatField(),
+            )
+        )
+        if api_settings.ORDERING_PARAM in request.query_params:
+            return queryset
+        # The number breaks the ties, so the pages are stable
+        return queryset.order_by("-search_rank", "number")
+
+    def get_schema_operation_parameters(self, view: Any) -> list[dict[str, Any]]:
+        return [
+            {
+                "name": self.search_param,
+                "required": False,
+                "in": "query",
+                "description": (
+                    "Search the title and the body of the issues, and their comments. "
+                    "Can't be combined with the cursor pagination."
+                ),
+                "schema": {"type": "string"},
+            }
+        ]
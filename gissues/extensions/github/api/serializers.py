@@ -1,16 +1,19 @@
-from typing import Any, Optional
+from typing import Any
+
+from django.db import models
 
 from rest_framework import serializers
 
 from drf_spectacular.utils import extend_schema_field
 
+from gissues.extensions.github.history import get_changes
 from gissues.extensions.github.models import Comments, Issue, Repository
 
 
 class RepositorySerializer(serializers.ModelSerializer[Repository]):
     class Meta:
         model = Repository
-        fields = "__all__"
+        exclude = ("issues_synced_at", "sync_interval", "next_sync_at")
 
 
 class IssueSerializer(serializers.ModelSerializer[Issue]):
@@ -44,35 +47,35 @@ class CommentsSerializer(serializers.ModelSerializer[Comments]):
         )
 
 
-class HistorySerializer(serializers.Serializer):
+class IssueExportSerializer(serializers.Serializer[Any]):
+    output = serializers.ChoiceField(choices=["ndjson", "csv"], default="ndjson")
+    include_comments = serializers.BooleanField(default=False)
+    updated_since = serializers.DateTimeField(required=False, help_text="Only export the issues updated since then.")
+
+
+class HistorySerializer(serializers.Serializer[models.Model]):
     history_id = serializers.IntegerField()
     history_date = serializers.DateTimeField()
     changes = serializers.SerializerMethodField()
 
     @extend_schema_field(serializers.DictField)
-    def get_changes(self, instance):
-        next_record = instance.next_record
-        return {change.field: change.old for change in next_record.diff_against(instance).changes}
+    def get_changes(self, instance: models.Model) -> dict[str, Any]:
+        # The history records are annotated with the values of their next record, see `history.with_changes`
+        return get_changes(instance)
 
 
-class BaseHistorySerializer(serializers.Serializer):
+class BaseHistorySerializer(serializers.Serializer[dict[str, Any]]):
     original = serializers.SerializerMethodField()
-    history = serializers.SerializerMethodField()
+    history = HistorySerializer(many=True)
 
-    instance_serializer_mapping = {
+    instance_serializer_mapping: dict[type[models.Model], type[serializers.ModelSerializer[Any]]] = {
         Issue: IssueSerializer,
         Repository: RepositorySerializer,
         Comments: CommentsSerializer,
     }
 
     @extend_schema_field(serializers.DictField)
-    def get_original(self, instance) -> dict[str, Any]:
-        serializer = self.instance_serializer_mapping.get(instance.__class__)
-        return serializer(instance, context=self.context).data
-
-    @extend_schema_field(HistorySerializer(many=True))
-    def get_history(self, instance) -> Optional[list[dict[str, Any]]]:
-        # Exclude the latest history entry
-        # Because the latest history entry is the current state of the object
-        history = instance.history.exclude(history_id=instance.history.latest("history_id").history_id)
-        return HistorySerializer(history, context=self.context, many=True).data
+    def get_original(self, instance: dict[str, Any]) -> dict[str, Any]:
+        original = instance["original"]
+        serializer = self.instance_serializer_mapping[original.__class__]
+        return serializer(original, context=self.context).data
@@ -1,16 +1,29 @@
 from django.db.models import QuerySet
+from django.http import StreamingHttpResponse
 
 from rest_framework import permissions, serializers, status
 from rest_framework.decorators import action
-from rest_framework.generics import get_object_or_404
+from rest_framework.filters import OrderingFilter
 from rest_framework.request import Request
 from rest_framework.response import Response
 
+from django_filters.rest_framework import DjangoFilterBackend
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema
+
 from gissues.extensions.auth.models import UserRepositoryFollow
-from gissues.extensions.github.api.serializers import CommentsSerializer, IssueSerializer, RepositorySerializer
+from gissues.extensions.github.api.exports import CONTENT_TYPES, export_csv, export_ndjson, iter_issues
+from gissues.extensions.github.api.filters import CommentsFilterSet, IssueFilterSet, IssueSearchFilter
+from gissues.extensions.github.api.serializers import (
+    CommentsSerializer,
+    IssueExportSerializer,
+    IssueSerializer,
+    RepositorySerializer,
+)
 from gissues.extensions.github.models import Comments, Issue, Repository
 from gissues.extensions.github.transformers import transform_comments, transform_issue, transform_repository
 from gissues.extensions.github_client.api.views import BaseGitHubClientViewSet
+from gissues.extensions.github_client.cache import Scope, issue_scope, owner_scope, repository_scope
 from gissues.extensions.github_client.client import github_client
 
 
@@ -28,6 +41,9 @@ class RepositoryViewSet(BaseGitHubClientViewSet):
         qs = super().get_queryset()
         return qs.filter(owner_name=self.kwargs["repository_owner"])
 
+    def get_cache_scope(self) -> Scope:
+        return owner_scope(self.kwargs["repository_owner"])
+
     def get_object(self) -> Repository:
         return self.get_object_or_sync(
             {
@@ -77,14 +93,17 @@ class IssueViewSet(BaseGitHubClientViewSet):
     client_detail_function = github_client.issues.detail
     lookup_field = "number"
     ordering = ["number"]
+    filter_backends = [DjangoFilterBackend, OrderingFilter, IssueSearchFilter]
+    filterset_class = IssueFilterSet
 
     def get_queryset(self) -> QuerySet[Issue]:
         qs = super().get_queryset()
-
-        repository = Repository.objects.get(
-            name=self.kwargs["repository_name"], owner_name=self.kwargs["repository_owner"]
+        return qs.filter(
+            repository__name=self.kwargs["repository_name"], repository__owner_name=self.kwargs["repository_owner"]
         )
-        return qs.filter(repository=repository)
+
+    def get_cache_scope(self) -> Scope:
+        return repository_scope(self.kwargs["repository_owner"], self.kwargs["repository_name"])
 
     def get_object(self) -> Issue:
         repository_name = self.kwargs["repository_name"]
@@ -98,6 +117,29 @@ class IssueViewSet(BaseGitHubClientViewSet):
             {"repository_name": repository_name, "owner_name": owner_name},
         )
 
+    @extend_schema(
+        parameters=[IssueExportSerializer],
+        responses={(200, content_type): OpenApiTypes.STR for content_type in CONTENT_TYPES.values()},
+    )
+    @action(detail=False, methods=["GET"], pagination_class=None)
+    def export(self, request: Request, repository_owner: str, repository_name: str) -> StreamingHttpResponse:
+        """Stream all the issues of a repository, optionally with their comments, as NDJSON or CSV."""
+        serializer = IssueExportSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        output, include_comments = serializer.validated_data["output"], serializer.validated_data["include_comments"]
+
+        queryset = self.get_queryset()
+        if updated_since := serializer.validated_data.get("updated_since"):
+            queryset = queryset.filter(updated_at__gte=updated_since)
+
+        issues = iter_issues(queryset, include_comments)
+        content = export_csv(issues, include_comments) if output == "csv" else export_ndjson(issues)
+        response = StreamingHttpResponse(content, content_type=CONTENT_TYPES[output])
+        response.headers["Content-Disposition"] = (
+            f'attachment; filename="{repository_owner}-{repository_name}-issues.{output}"'
+        )
+        return response
+
 
 class CommentsViewSet(BaseGitHubClientViewSet):
     serializer_class = CommentsSerializer
@@ -106,20 +148,30 @@ class CommentsViewSet(BaseGitHubClientViewSet):
     transform_function = staticmethod(transform_comments)
     client_detail_function = github_client.comments.detail
     lookup_field = "comment_id"
-    ordering = ["created_at"]
+    # The comment id breaks the ties between the comments created at the same time
+    ordering = ["created_at", "comment_id"]
+    filter_backends = [DjangoFilterBackend, OrderingFilter]
+    filterset_class = CommentsFilterSet
 
     def get_queryset(self) -> QuerySet[Comments]:
         qs = super().get_queryset()
-        issue = get_object_or_404(Issue, number=self.kwargs["issue_number"])
-        return qs.filter(issue=issue)
+        return qs.filter(
+            issue__number=self.kwargs["issue_number"],
+            issue__repository__name=self.kwargs["repository_name"],
+            issue__repository__owner_name=self.kwargs["repository_owner"],
+        )
+
+    def get_cache_scope(self) -> Scope:
+        return issue_scope(self.kwargs["repository_owner"], self.kwargs["repository_name"], self.kwargs["issue_number"])
 
     def get_object(self) -> Comments:
-        issue_number = self.kwargs["issue_number"]
+        owner_name = self.kwargs["repository_owner"]
+        repository_name = self.kwargs["repository_name"]
         return self.get_object_or_sync(
             {
-                "owner_name": self.kwargs["repository_owner"],
-                "repository_name": self.kwargs["repository_name"],
+                "owner_name": owner_name,
+                "repository_name": repository_name,
                 "comment_id": self.kwargs["comment_id"],
             },
-            {"issue_number": issue_number},
+            {"issue_number": self.kwargs["issue_number"], "repository_name": repository_name, "owner_name": owner_name},
         )
@@ -0,0 +1,148 @@
+import datetime
+import gzip
+import json
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models, transaction
+from django.db.models import Exists, F, OuterRef, QuerySet, Window
+from django.db.models.functions import Lead
+from django.utils import timezone
+
+from gissues.extensions.github_client.cache import Scope, response_cache
+
+NEXT_PREFIX = "next_"
+
+
+def get_tracked_fields(history_model: type[models.Model]) -> list["models.Field[Any, Any]"]:
+    """Get the fields of a historical model whose changes are reported.
+
+    Args:
+        history_model (type[models.Model]): The historical model.
+
+    Returns:
+        list[models.Field[Any, Any]]: The tracked fields, as compared by `diff_against`.
+    """
+    # Set on the historical models by `simple_history`, which isn't typed
+    tracked_fields: list[models.Field[Any, Any]] = getattr(history_model, "tracked_fields")
+    return [field for field in tracked_fields if field.editable]
+
+
+def with_changes(history: QuerySet[Any]) -> QuerySet[Any]:
+    """Annotate the history records of an object with the tracked field values of the record that follows each.
+
+    The values are read with a window function in the same query as the records, so the changes of any
+    number of records are computed without a query per record. The latest record, the current state of
+    the object, is left out as nothing follows it.
+
+    Args:
+        history (QuerySet): The history records of a single object.
+
+    Returns:
+        QuerySet: The annotated history records, the most recent first.
+    """
+    order_by = [F("history_date").asc(), F("history_id").asc()]
+    annotations = {
+        f"{NEXT_PREFIX}{field.attname}": Window(Lead(field.attname), order_by=order_by)
+        for field in get_tracked_fields(history.model)
+    }
+    records: QuerySet[Any] = (
+        history.annotate(**{f"{NEXT_PREFIX}history_id": Window(Lead("history_id"), order_by=order_by)}, **annotations)
+        .filter(**{f"{NEXT_PREFIX}history_id__isnull": False})
+        .order_by("-history_date", "-history_id")
+    )
+    return records
+
+
+def get_changes(record: models.Model) -> dict[str, Any]:
+    """Get the values of the fields that were changed by the record following an annotated history record.
+
+    Args:
+        record (models.Model): A history record annotated by `with_changes`.
+
+    Returns:
+        dict[str, Any]: The changed fields and their values before the change.
+    """
+    return {
+        field.name: getattr(record, field.attname)
+        for field in get_tracked_fields(type(record))
+        if getattr(record, field.attname) != getattr(record, f"{NEXT_PREFIX}{field.attname}")
+    }
+
+
+def get_expired_history(history_model: type[models.Model], before: datetime.datetime) -> QuerySet[Any]:
+    """Get the history records created before a date, except the latest record of each object.
+
+    The latest record holds the current state of its object, so it is kept however old it is.
+
+    Args:
+        history_model (type[models.Model]): The historical model.
+        before (datetime.datetime): The records created before this date are expired.
+
+    Returns:
+        QuerySet: The expired history records, the oldest first.
+    """
+    newer_records = history_model._default_manager.filter(id=OuterRef("id"), history_id__gt=OuterRef("history_id"))
+    return history_model._default_manager.filter(Exists(newer_records), history_date__lt=before).order_by("history_id")
+
+
+def archive_history(history: QuerySet[Any], path: Path) -> None:
+    """Append history records to a gzip compressed file, one JSON object per line.
+
+    Args:
+        history (QuerySet): The history records.
+        path (Path): The archive file, created if it doesn't exist.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with gzip.open(path, "at", encoding="utf-8") as archive:
+        for record in history.values().iterator():
+            archive.write(json.dumps(record, cls=DjangoJSONEncoder) + "\n")
+
+
+def compact_history(
+    history_model: type[models.Model],
+    before: datetime.datetime,
+    batch_size: int,
+    archive_dir: Optional[str | Path] = None,
+    get_scopes: Optional[Callable[[QuerySet[Any]], Iterable[Scope]]] = None,
+) -> int:
+    """Delete the expired history records of a historical model, in batches.
+
+    Every batch is archived and deleted in its own transaction, so the tables are never locked for long
+    and the command can run on a live system.
+
+    Args:
+        history_model (type[models.Model]): The historical model.
+        before (datetime.datetime): The records created before this date are expired, see `get_expired_history`.
+        batch_size (int): The number of records deleted at once.
+        archive_dir (Optional[str | Path]): The directory the records are archived to before they're deleted,
+            they aren't archived if it isn't set. Defaults to None.
+        get_scopes (Optional[Callable[[QuerySet], Iterable[Scope]]]): Get the cache scopes of the API responses
+            that show the records of a batch, they're invalidated once it is deleted. Defaults to None.
+
+    Returns:
+        int: The number of deleted records.
+    """
+    archive_path = None
+    if archive_dir:
+        archive_path = Path(archive_dir) / f"{history_model._meta.db_table}-{timezone.now():%Y%m%dT%H%M%S}.ndjson.gz"
+
+    deleted = 0
+    while True:
+        scopes: set[Scope] = set()
+        with transaction.atomic():
+            history_ids = list(
+                get_expired_history(history_model, before).values_list("history_id", flat=True)[:batch_size]
+            )
+            if not history_ids:
+                return deleted
+
+            batch = history_model._default_manager.filter(history_id__in=history_ids).order_by("history_id")
+            if archive_path is not None:
+                archive_history(batch, archive_path)
+            if get_scopes is not None:
+                scopes.update(get_scopes(batch))
+            deleted += batch.delete()[0]
+        # Only once the batch is committed, or a response cached meanwhile would still show its records
+        response_cache.invalidate(*scopes)
@@ -0,0 +1,35 @@
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+
+from gissues.extensions.github.tasks import compact_history_task
+
+
+class Command(BaseCommand):
+    help = "Delete the history records older than the retention period, keeping the latest record of each object."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.HISTORY_RETENTION_DAYS,
+            help="The number of days the history is kept.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.HISTORY_COMPACTION_BATCH_SIZE,
+            help="The number of records deleted at once.",
+        )
+        parser.add_argument(
+            "--archive-dir",
+            default=settings.HISTORY_ARCHIVE_DIR,
+            help="The directory the records are archived to, as gzip compressed JSON lines, before they're deleted.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        deleted = compact_history_task(options["days"], options["batch_size"], options["archive_dir"])
+
+        for label, count in deleted.items():
+            self.stdout.write(f"Deleted {count} {label} records")
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.4 on 2026-10-18 01:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("github", "0002_alter_historicalissue_number_alter_issue_number_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="repository",
+            name="issues_synced_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.0.4 on 2026-10-18 01:50
+
+from django.db import migrations, models
+
+from gissues.extensions.github.operations import AddIndexConcurrently, AlterUniqueConstraintConcurrently
+
+
+class Migration(migrations.Migration):
+    # The indexes are built concurrently, which can't run in a transaction
+    atomic = False
+
+    dependencies = [
+        ("github", "0003_repository_issues_synced_at"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="comments",
+            index=models.Index(fields=["issue", "created_at", "comment_id"], name="comment_issue_created_idx"),
+        ),
+        # The unique constraints lead with the parent column of the listings, so their indexes serve the pagination
+        AlterUniqueConstraintConcurrently(
+            model_name="issue",
+            constraint=models.UniqueConstraint(fields=("repository", "number"), name="unique_issue"),
+        ),
+        AlterUniqueConstraintConcurrently(
+            model_name="repository",
+            constraint=models.UniqueConstraint(fields=("owner_name", "name"), name="unique_repository"),
+        ),
+    ]
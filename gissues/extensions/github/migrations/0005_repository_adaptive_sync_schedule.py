@@ -0,0 +1,23 @@
+# Generated by Django 5.0.4 on 2026-10-18 02:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("github", "0004_keyset_pagination_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="repository",
+            name="next_sync_at",
+            field=models.DateTimeField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="repository",
+            name="sync_interval",
+            field=models.DurationField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,126 @@
+# Generated by Django 5.0.4 on 2026-10-18 02:22
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.migrations.state import ProjectState, StateApps
+
+# The search vectors are computed by triggers, so they're kept current by every write, including the bulk
+# upserts of the sync tasks. The text search configuration must match `api.filters.SEARCH_CONFIG`.
+SEARCH_VECTORS = {
+    "github_issue": (
+        "setweight(to_tsvector('english', coalesce({row}.title, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce({row}.body, '')), 'B')",
+        "title, body",
+    ),
+    "github_comments": (
+        "setweight(to_tsvector('english', coalesce({row}.body, '')), 'C')",
+        "body",
+    ),
+}
+# The existing rows are filled in batches, each committed on its own, so the table isn't locked for the whole
+# backfill and the syncs can go on meanwhile
+BACKFILL_BATCH_SIZE = 10000
+
+
+class AddSearchIndexConcurrently(AddIndexConcurrently):
+    """Create the GIN index of the search vectors without locking the table, on PostgreSQL only."""
+
+    def database_forwards(
+        self, app_label: str, schema_editor: BaseDatabaseSchemaEditor, from_state: ProjectState, to_state: ProjectState
+    ) -> None:
+        # SQLite, used by the tests, has no full-text search, the search falls back to substring matching
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(
+        self, app_label: str, schema_editor: BaseDatabaseSchemaEditor, from_state: ProjectState, to_state: ProjectState
+    ) -> None:
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+
+
+def create_search_triggers(apps: StateApps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    for table, (search_vector, columns) in SEARCH_VECTORS.items():
+        schema_editor.execute(
+            f"""
+            CREATE FUNCTION {table}_search_vector_update() RETURNS trigger AS $$
+            BEGIN
+                NEW.search_vector := {search_vector.format(row="NEW")};
+                RETURN NEW;
+            END
+            $$ LANGUAGE plpgsql
+            """
+        )
+        schema_editor.execute(
+            f"""
+            CREATE TRIGGER {table}_search_vector_trigger
+            BEFORE INSERT OR UPDATE OF {columns} ON {table}
+            FOR EACH ROW EXECUTE FUNCTION {table}_search_vector_update()
+            """
+        )
+
+
+def drop_search_triggers(apps: StateApps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    for table in SEARCH_VECTORS:
+        schema_editor.execute(f"DROP TRIGGER IF EXISTS {table}_search_vector_trigger ON {table}")
+        schema_editor.execute(f"DROP FUNCTION IF EXISTS {table}_search_vector_update()")
+
+
+def backfill_search_vectors(apps: StateApps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    # The rows written since the triggers were created already have their search vector
+    with schema_editor.connection.cursor() as cursor:
+        for table, (search_vector, _) in SEARCH_VECTORS.items():
+            updated = BACKFILL_BATCH_SIZE
+            while updated == BACKFILL_BATCH_SIZE:
+                cursor.execute(
+                    f"""
+                    UPDATE {table} SET search_vector = {search_vector.format(row=table)}
+                    WHERE id IN (SELECT id FROM {table} WHERE search_vector IS NULL LIMIT %s)
+                    """,
+                    [BACKFILL_BATCH_SIZE],
+                )
+                updated = cursor.rowcount
+
+
+class Migration(migrations.Migration):
+    # The backfill and the concurrent index creation can't run in a transaction
+    atomic = False
+
+    dependencies = [
+        ("github", "0005_repository_adaptive_sync_schedule"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="comments",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="issue",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(create_search_triggers, drop_search_triggers, atomic=True),
+        migrations.RunPython(backfill_search_vectors, migrations.RunPython.noop),
+        AddSearchIndexConcurrently(
+            model_name="comments",
+            index=django.contrib.postgres.indexes.GinIndex(fields=["search_vector"], name="comment_search_idx"),
+        ),
+        AddSearchIndexConcurrently(
+            model_name="issue",
+            index=django.contrib.postgres.indexes.GinIndex(fields=["search_vector"], name="issue_search_idx"),
+        ),
+    ]
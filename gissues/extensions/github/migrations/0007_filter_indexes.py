@@ -0,0 +1,33 @@
+# Generated by Django 5.0.4 on 2026-10-18 02:23
+
+from django.db import migrations, models
+
+from gissues.extensions.github.operations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+    # The indexes are built concurrently, which can't run in a transaction
+    atomic = False
+
+    dependencies = [
+        ("github", "0006_full_text_search"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="comments",
+            index=models.Index(fields=["issue", "updated_at"], name="comment_issue_updated_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="issue",
+            index=models.Index(fields=["repository", "is_closed", "updated_at"], name="issue_repository_state_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="issue",
+            index=models.Index(
+                condition=models.Q(("is_closed", False)),
+                fields=["repository", "number"],
+                name="issue_repository_open_idx",
+            ),
+        ),
+    ]
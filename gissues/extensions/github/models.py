@@ -1,3 +1,5 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 
 from simple_history.models import HistoricalRecords
@@ -7,15 +9,25 @@ class Comments(models.Model):
     comment_id = models.PositiveIntegerField(unique=True)
     body = models.TextField(max_length=65536)
     issue = models.ForeignKey("Issue", related_name="comments", on_delete=models.CASCADE)
+    # Maintained by a database trigger on PostgreSQL, see the `0006_full_text_search` migration
+    search_vector = SearchVectorField(null=True, editable=False)
 
     created_at = models.DateTimeField()
     updated_at = models.DateTimeField()
 
-    history = HistoricalRecords()
+    history = HistoricalRecords(excluded_fields=["search_vector"])
 
     class Meta:
         verbose_name = "comment"
         verbose_name_plural = "comments"
+        indexes = [
+            # Matches the ordering of the comments of an issue, for keyset pagination
+            models.Index(fields=["issue", "created_at", "comment_id"], name="comment_issue_created_idx"),
+            # Backs the filters on the update date of the comments of an issue
+            models.Index(fields=["issue", "updated_at"], name="comment_issue_updated_idx"),
+            # Backs the full-text search, created on PostgreSQL only
+            GinIndex(fields=["search_vector"], name="comment_search_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"C{self.comment_id}"
@@ -45,16 +57,33 @@ class Issue(models.Model):
     lock_reason = models.CharField(max_length=10, choices=LockReason.choices, null=True)
     repository = models.ForeignKey("Repository", related_name="issues", on_delete=models.CASCADE)
     comment_count = models.PositiveIntegerField(default=0)
+    # Maintained by a database trigger on PostgreSQL, see the `0006_full_text_search` migration
+    search_vector = SearchVectorField(null=True, editable=False)
 
     created_at = models.DateTimeField()
     updated_at = models.DateTimeField()
 
-    history = HistoricalRecords()
+    history = HistoricalRecords(excluded_fields=["search_vector"])
 
     class Meta:
         verbose_name = "issue"
         verbose_name_plural = "issues"
-        constraints = [models.UniqueConstraint(fields=["number", "repository"], name="unique_issue")]
+        constraints = [
+            # Its index also matches the ordering of the issues of a repository, for keyset pagination
+            models.UniqueConstraint(fields=["repository", "number"], name="unique_issue"),
+        ]
+        indexes = [
+            # Back the filters on the state and the update date of the issues of a repository
+            models.Index(fields=["repository", "is_closed", "updated_at"], name="issue_repository_state_idx"),
+            # Most clients only list the open issues, in the default ordering, apart from the many closed ones
+            models.Index(
+                fields=["repository", "number"],
+                condition=models.Q(is_closed=False),
+                name="issue_repository_open_idx",
+            ),
+            # Backs the full-text search, created on PostgreSQL only
+            GinIndex(fields=["search_vector"], name="issue_search_idx"),
+        ]
 
     def __str__(self) -> str:
         return self.title
@@ -71,12 +100,21 @@ class Repository(models.Model):
     updated_at = models.DateTimeField()
     pushed_at = models.DateTimeField()
 
-    history = HistoricalRecords()
+    # The latest `updated_at` of the synced issues, used to fetch only the issues changed since then
+    issues_synced_at = models.DateTimeField(null=True, blank=True)
+    # The issues are synced again after an interval that adapts to how often they change, see `check_for_new_issues`
+    sync_interval = models.DurationField(null=True, blank=True)
+    next_sync_at = models.DateTimeField(null=True, blank=True, db_index=True)
+
+    history = HistoricalRecords(excluded_fields=["issues_synced_at", "sync_interval", "next_sync_at"])
 
     class Meta:
         verbose_name = "repository"
         verbose_name_plural = "repositories"
-        constraints = [models.UniqueConstraint(fields=["name", "owner_name"], name="unique_repository")]
+        constraints = [
+            # Its index also matches the ordering of the repositories of an owner, for keyset pagination
+            models.UniqueConstraint(fields=["owner_name", "name"], name="unique_repository"),
+        ]
 
     def __str__(self) -> str:
         return self.name
@@ -0,0 +1,106 @@
+from django.contrib.postgres import operations as postgres_operations
+from django.db import models
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.migrations.operations.models import AddIndex, IndexOperation
+from django.db.migrations.state import ProjectState
+
+
+class AddIndexConcurrently(postgres_operations.AddIndexConcurrently):
+    """Create an index without locking the table on PostgreSQL, and as usual on the other databases.
+
+    The migration using it must not be atomic.
+    """
+
+    def database_forwards(
+        self, app_label: str, schema_editor: BaseDatabaseSchemaEditor, from_state: ProjectState, to_state: ProjectState
+    ) -> None:
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+        else:
+            AddIndex.database_forwards(self, app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(
+        self, app_label: str, schema_editor: BaseDatabaseSchemaEditor, from_state: ProjectState, to_state: ProjectState
+    ) -> None:
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+        else:
+            AddIndex.database_backwards(self, app_label, schema_editor, from_state, to_state)
+
+
+class AlterUniqueConstraintConcurrently(postgres_operations.NotInTransactionMixin, IndexOperation):
+    """Replace a unique constraint with one of the same name over other fields, or in another order.
+
+    On PostgreSQL the index of the new constraint is built without locking the table, then the old constraint
+    is swapped for it in a single statement. The table is only locked for the swap, and the upserts always have
+    a constraint to conflict on. The other databases drop the old constraint and add the new one.
+    The migration using it must not be atomic.
+    """
+
+    option_name = "constraints"
+    atomic = False
+
+    def __init__(self, model_name: str, constraint: models.UniqueConstraint) -> None:
+        self.model_name = model_name
+        self.constraint = constraint
+
+    def state_forwards(self, app_label: str, state: ProjectState) -> None:
+        state.remove_constraint(app_label, self.model_name_lower, self.constraint.name)
+        state.add_constraint(app_label, self.model_name_lower, self.constraint)
+
+    def database_forwards(
+        self, app_label: str, schema_editor: BaseDatabaseSchemaEditor, from_state: ProjectState, to_state: ProjectState
+    ) -> None:
+        self._alter_constraint(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(
+        self, app_label: str, schema_editor: BaseDatabaseSchemaEditor, from_state: ProjectState, to_state: ProjectState
+    ) -> None:
+        self._alter_constraint(app_label, schema_editor, from_state, to_state)
+
+    def _alter_constraint(
+        self, app_label: str, schema_editor: BaseDatabaseSchemaEditor, from_state: ProjectState, to_state: ProjectState
+    ) -> None:
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if not self.allow_migrate_model(schema_editor.connection.alias, model):
+            return
+
+        old_constraint = from_state.models[app_label, self.model_name_lower].get_constraint_by_name(
+            self.constraint.name
+        )
+        new_constraint = to_state.models[app_label, self.model_name_lower].get_constraint_by_name(self.constraint.name)
+        if schema_editor.connection.vendor != "postgresql":
+            schema_editor.remove_constraint(model, old_constraint)
+            schema_editor.add_constraint(model, new_constraint)
+            return
+
+        self._ensure_not_in_transaction(schema_editor)
+        quote_name = schema_editor.quote_name
+        table = quote_name(model._meta.db_table)
+        index = quote_name(f"{new_constraint.name}_new")
+        columns = ", ".join(quote_name(model._meta.get_field(field).column) for field in new_constraint.fields)
+        # A concurrent build that failed leaves an invalid index behind, it's dropped so the migration can be retried
+        schema_editor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index}")
+        schema_editor.execute(f"CREATE UNIQUE INDEX CONCURRENTLY {index} ON {table} ({columns})")
+        # The index is renamed after the constraint it backs
+        schema_editor.execute(
+            f"ALTER TABLE {table} DROP CONSTRAINT {quote_name(old_constraint.name)}, "
+            f"ADD CONSTRAINT {quote_name(new_constraint.name)} UNIQUE USING INDEX {index}"
+        )
+
+    def deconstruct(self) -> tuple[str, list[str], dict[str, str | models.UniqueConstraint]]:
+        return (
+            self.__class__.__name__,
+            [],
+            {
+                "model_name": self.model_name,
+                "constraint": self.constraint,
+            },
+        )
+
+    def describe(self) -> str:
+        return f"Concurrently alter unique constraint {self.constraint.name} on model {self.model_name}"
+
+    @property
+    def migration_name_fragment(self) -> str:
+        return f"alter_{self.model_name_lower}_{self.constraint.name.lower()}"
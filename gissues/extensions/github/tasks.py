@@ -0,0 +1,73 @@
+import datetime
+import logging
+from typing import Any, Callable, Optional
+
+from django.conf import settings
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from gissues.celery import app
+from gissues.extensions.github.history import compact_history
+from gissues.extensions.github.models import Comments, Issue, Repository
+from gissues.extensions.github_client.cache import Scope, issue_scope, owner_scope, repository_scope
+
+logger = logging.getLogger(__name__)
+
+
+def _get_repository_history_scopes(history: QuerySet[Any]) -> list[Scope]:
+    # The history of a repository is served with the repositories of its owner
+    return [owner_scope(owner_name) for owner_name in history.values_list("owner_name", flat=True).distinct()]
+
+
+def _get_issue_history_scopes(history: QuerySet[Any]) -> list[Scope]:
+    repositories = Repository.objects.filter(id__in=history.values("repository_id"))
+    return [repository_scope(*names) for names in repositories.values_list("owner_name", "name")]
+
+
+def _get_comment_history_scopes(history: QuerySet[Any]) -> list[Scope]:
+    issues = Issue.objects.filter(id__in=history.values("issue_id"))
+    return [issue_scope(*names) for names in issues.values_list("repository__owner_name", "repository__name", "number")]
+
+
+HISTORY_SCOPES: dict[type[Repository] | type[Issue] | type[Comments], Callable[[QuerySet[Any]], list[Scope]]] = {
+    Repository: _get_repository_history_scopes,
+    Issue: _get_issue_history_scopes,
+    Comments: _get_comment_history_scopes,
+}
+
+
+@app.task(name="gissues.extensions.github.tasks.compact_history_task")
+def compact_history_task(
+    retention_days: Optional[int] = None, batch_size: Optional[int] = None, archive_dir: Optional[str] = None
+) -> dict[str, int]:
+    """Delete the history records older than the retention period, keeping the latest record of each object.
+
+    The cached API responses of the objects whose history is deleted are invalidated after every batch.
+
+    Args:
+        retention_days (Optional[int]): The number of days the history is kept.
+            Defaults to `HISTORY_RETENTION_DAYS`.
+        batch_size (Optional[int]): The number of records deleted at once.
+            Defaults to `HISTORY_COMPACTION_BATCH_SIZE`.
+        archive_dir (Optional[str]): The directory the records are archived to before they're deleted.
+            Defaults to `HISTORY_ARCHIVE_DIR`.
+
+    Returns:
+        dict[str, int]: The number of deleted records per historical model.
+    """
+    retention_days = retention_days if retention_days is not None else settings.HISTORY_RETENTION_DAYS
+    before = timezone.now() - datetime.timedelta(days=retention_days)
+
+    deleted = {}
+    for model, get_scopes in HISTORY_SCOPES.items():
+        history_model = model.history.model
+        deleted[history_model._meta.label] = compact_history(
+            history_model,
+            before,
+            batch_size or settings.HISTORY_COMPACTION_BATCH_SIZE,
+            archive_dir if archive_dir is not None else settings.HISTORY_ARCHIVE_DIR,
+            get_scopes,
+        )
+        logger.info(f"Deleted {deleted[history_model._meta.label]} {history_model._meta.label} records")
+
+    return deleted
@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Iterable
 
 from rest_framework.generics import get_object_or_404
 
@@ -27,20 +27,7 @@ def transform_repository(repository: dict[str, Any]) -> RepositoryDataclass:
     )
 
 
-def transform_issue(issue: dict[str, Any], repository_name: str, owner_name: str) -> IssueDataclass:
-    """Transforms a GitHub issue to a dictionary with the required fields.
-
-    Args:
-        issue (dict[str, Any]): The GitHub issue to transform.
-        repository_name (str): The repository name where the issue belongs.
-        owner_name (str): The owner name of the repository.
-
-    Returns:
-        IssueDataclass: The transformed GitHub issue.
-    """
-
-    repository = get_object_or_404(Repository, name=repository_name, owner_name=owner_name)
-
+def _build_issue(issue: dict[str, Any], repository: Repository) -> IssueDataclass:
     return IssueDataclass(
         title=issue["title"],
         number=issue["number"],
@@ -57,23 +44,76 @@ def transform_issue(issue: dict[str, Any], repository_name: str, owner_name: str
     )
 
 
-def transform_comments(comment: dict[str, Any], issue_number: int) -> CommentsDataclass:
+def _build_comment(comment: dict[str, Any], issue: Issue) -> CommentsDataclass:
+    return CommentsDataclass(
+        comment_id=comment["id"],
+        body=comment["body"],
+        issue=issue,
+        created_at=comment["created_at"],
+        updated_at=comment["updated_at"],
+    )
+
+
+def transform_issue(issue: dict[str, Any], repository_name: str, owner_name: str) -> IssueDataclass:
+    """Transforms a GitHub issue to a dictionary with the required fields.
+
+    Args:
+        issue (dict[str, Any]): The GitHub issue to transform.
+        repository_name (str): The repository name where the issue belongs.
+        owner_name (str): The owner name of the repository.
+
+    Returns:
+        IssueDataclass: The transformed GitHub issue.
+    """
+
+    repository = get_object_or_404(Repository, name=repository_name, owner_name=owner_name)
+
+    return _build_issue(issue, repository)
+
+
+def transform_comments(
+    comment: dict[str, Any], issue_number: int, repository_name: str, owner_name: str
+) -> CommentsDataclass:
     """Transforms a GitHub comment to a dictionary with the required fields.
 
     Args:
         comment (dict[str, Any]): The GitHub comment to transform.
         issue_number (int): The issue number where the comment belongs.
+        repository_name (str): The repository name where the issue belongs.
+        owner_name (str): The owner name of the repository.
 
     Returns:
         CommentsDataclass: The transformed GitHub comment.
     """
 
-    issue = get_object_or_404(Issue, number=issue_number)
-
-    return CommentsDataclass(
-        comment_id=comment["id"],
-        body=comment["body"],
-        issue=issue,
-        created_at=comment["created_at"],
-        updated_at=comment["updated_at"],
+    issue = get_object_or_404(
+        Issue, number=issue_number, repository__name=repository_name, repository__owner_name=owner_name
     )
+
+    return _build_comment(comment, issue)
+
+
+def bulk_transform_issues(issues: Iterable[dict[str, Any]], repository: Repository) -> list[IssueDataclass]:
+    """Transforms a page of GitHub issues of an already resolved repository, without querying the database.
+
+    Args:
+        issues (Iterable[dict[str, Any]]): The GitHub issues to transform.
+        repository (Repository): The repository where the issues belong.
+
+    Returns:
+        list[IssueDataclass]: The transformed GitHub issues.
+    """
+    return [_build_issue(issue, repository) for issue in issues]
+
+
+def bulk_transform_comments(comments: Iterable[dict[str, Any]], issue: Issue) -> list[CommentsDataclass]:
+    """Transforms a page of GitHub comments of an already resolved issue, without querying the database.
+
+    Args:
+        comments (Iterable[dict[str, Any]]): The GitHub comments to transform.
+        issue (Issue): The issue where the comments belong.
+
+    Returns:
+        list[CommentsDataclass]: The transformed GitHub comments.
+    """
+    return [_build_comment(comment, issue) for comment in comments]
@@ -1,27 +1,77 @@
+import time
 from typing import Any, Callable, Optional, Union
 
 from django.db import models
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
 
-from rest_framework import serializers
+from rest_framework import serializers, status
 from rest_framework.decorators import action
 from rest_framework.filters import OrderingFilter
+from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.viewsets import ReadOnlyModelViewSet
 
 from gissues.extensions.github.api.serializers import BaseHistorySerializer
+from gissues.extensions.github.history import with_changes
+from gissues.extensions.github_client.cache import Scope, response_cache
 from gissues.extensions.github_client.client import GitHubResponse
-from gissues.extensions.utils import pagination_factory
+from gissues.extensions.utils import pagination_factory, switchable_pagination_factory
 
 
 class BaseGitHubClientViewSet(ReadOnlyModelViewSet):
     serializer_classes: dict[str, type[serializers.BaseSerializer[Any]]] = {}
-    pagination_class = pagination_factory(page_size=10)
+    pagination_class = switchable_pagination_factory(page_size=10)
+    history_pagination_class = pagination_factory(page_size=10)
     filter_backends = [OrderingFilter]
     model: models.Model
     transform_function: Callable[[dict[str, Any]], Any]
     client_detail_function: Callable[..., ...]
     http_method_names = ["head", "options", "get"]
 
+    def get_cache_scope(self) -> Scope:
+        """Get the scope of the data the viewset serves, the sync tasks invalidate its cached responses."""
+        raise NotImplementedError("You must define a 'get_cache_scope' method in your viewset.")
+
+    def get_cached_response(
+        self, handler: Callable[..., Response], request: Request, *args: Any, **kwargs: Any
+    ) -> Response:
+        scope = self.get_cache_scope()
+        version = response_cache.get_version(scope)
+        cache_key = response_cache.get_key(scope, request, version)
+
+        # The validators only depend on the version of the scope, so an unchanged response is
+        # confirmed without querying the database nor reading the cached response.
+        etag = response_cache.get_etag(cache_key)
+        last_modified: Optional[int] = version // 1_000_000_000
+        # Last-Modified only has a one second precision, another invalidation can still fall within the second
+        # of the version, and a client validating with it would be answered as not modified. Until that second
+        # is over the responses are only validated by their ETag.
+        if version // 1_000_000_000 >= int(time.time()):
+            last_modified = None
+        if not_modified := get_conditional_response(request, etag=etag, last_modified=last_modified):
+            response = Response(status=not_modified.status_code)
+        else:
+            if (data := response_cache.get(cache_key)) is not None:
+                response = Response(data)
+            else:
+                response = handler(request, *args, **kwargs)
+                if response.status_code != status.HTTP_200_OK:
+                    return response
+
+                response_cache.set(cache_key, response.data)
+
+        response.headers["ETag"] = etag
+        if last_modified is not None:
+            response.headers["Last-Modified"] = http_date(last_modified)
+        return response
+
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        return self.get_cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        return self.get_cached_response(super().retrieve, request, *args, **kwargs)
+
     def get_serializer_class(self) -> type[serializers.BaseSerializer[Any]]:
         serializer = self.serializer_classes.get(self.action, self.serializer_class)
         assert serializer is not None
@@ -33,7 +83,8 @@ class BaseGitHubClientViewSet(ReadOnlyModelViewSet):
                 "You must define a 'client_detail_function' method in your viewset to use the 'get_object_from_github' method."
             )
 
-        obj: GitHubResponse = self.client_detail_function(**kwargs)
+        # The request is made on behalf of an API client, it can spend the reserve the syncs leave to it
+        obj: GitHubResponse = self.client_detail_function(**kwargs, use_reserve=True)
         if not obj.is_ok:
             raise obj.exception_handler()
 
@@ -64,10 +115,23 @@ class BaseGitHubClientViewSet(ReadOnlyModelViewSet):
         transform_kwargs = transform_kwargs or {}
         transformed_data = self.transform_function(obj, **transform_kwargs)
 
-        return self.model.objects.create(**transformed_data.dict())
+        obj = self.model.objects.create(**transformed_data.dict())
+        response_cache.invalidate(self.get_cache_scope())
+        return obj
 
     @action(detail=True, methods=["GET"], serializer_class=BaseHistorySerializer)
-    def history(self, request, **kwargs):
+    def history(self, request: Request, **kwargs: Any) -> Response:
+        return self.get_cached_response(self._history, request, **kwargs)
+
+    def _history(self, request: Request, **kwargs: Any) -> Response:
         obj = self.get_object()
-        serializer = self.get_serializer(obj)
-        return Response(serializer.data)
+
+        paginator = self.history_pagination_class()
+        records = paginator.paginate_queryset(with_changes(obj.history.all()), request, view=self)
+        serializer = self.get_serializer({"original": obj, "history": records})
+        return Response(
+            {
+                "original": serializer.data["original"],
+                "history": paginator.get_paginated_response(serializer.data["history"]).data,
+            }
+        )
@@ -0,0 +1,151 @@
+import hashlib
+import time
+from typing import Any, Optional, cast
+
+from django.conf import settings
+from django.core.cache import cache
+
+from rest_framework.request import Request
+
+Scope = tuple[str | int, ...]
+
+
+def owner_scope(owner_name: str) -> Scope:
+    """The repositories of an owner."""
+    return ("owner", owner_name)
+
+
+def repository_scope(owner_name: str, repository_name: str) -> Scope:
+    """The issues of a repository."""
+    return ("repository", owner_name, repository_name)
+
+
+def issue_scope(owner_name: str, repository_name: str, issue_number: int | str) -> Scope:
+    """The comments of an issue."""
+    return ("issue", owner_name, repository_name, str(issue_number))
+
+
+class ResponseCache:
+    """A cache of the API responses, invalidated per scope.
+
+    Every scope has a version, and the responses are cached under keys that contain the version of
+    their scope. Invalidating a scope only replaces its version, the responses cached under the previous
+    one are never read again and expire on their own.
+    """
+
+    key_prefix = "github-api:response-cache"
+
+    def __init__(self, timeout: int):
+        self.timeout = timeout
+
+    def _get_version_key(self, scope: Scope) -> str:
+        return f"{self.key_prefix}:version:{':'.join(map(str, scope))}"
+
+    def get_version(self, scope: Scope) -> int:
+        """Get the current version of a scope.
+
+        Args:
+            scope (Scope): The scope.
+
+        Returns:
+            int: The version, the time of the latest invalidation in nanoseconds.
+
+        """
+        # A version evicted from the cache is replaced by a newer one, so the stale responses stay unreachable
+        return cast(int, cache.get_or_set(self._get_version_key(scope), time.time_ns, None))
+
+    def invalidate(self, *scopes: Scope) -> None:
+        """Invalidate the cached responses of the scopes.
+
+        Args:
+            *scopes (Scope): The scopes whose data has changed.
+
+        """
+        if scopes:
+            cache.set_many({self._get_version_key(scope): time.time_ns() for scope in scopes}, None)
+
+    def get_key(self, scope: Scope, request: Request, version: Optional[int] = None) -> str:
+        """Get the cache key of the response to a request.
+
+        Args:
+            scope (Scope): The scope of the requested data.
+            request (Request): The request.
+            version (Optional[int]): The version of the scope, if it is already known. Defaults to None.
+
+        Returns:
+            str: The cache key.
+
+        """
+        key = "|".join(
+            [
+                ":".join(map(str, scope)),
+                str(version if version is not None else self.get_version(scope)),
+                request.get_full_path(),
+                str(request.version),
+            ]
+        )
+        return f"{self.key_prefix}:response:{hashlib.sha256(key.encode()).hexdigest()}"
+
+    @staticmethod
+    def get_etag(key: str) -> str:
+        """Get the entity tag of the response cached under a key.
+
+        The key changes whenever the scope is invalidated, so it validates the response without reading it.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            str: The quoted entity tag.
+
+        """
+        return f'"{key.rsplit(":", 1)[-1]}"'
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a cached response data, counting the hits and misses.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[Any]: The response data, or None if it isn't cached.
+
+        """
+        data = cache.get(key)
+        self._increment("hits" if data is not None else "misses")
+        return data
+
+    def set(self, key: str, data: Any) -> None:
+        """Cache a response data.
+
+        Args:
+            key (str): The cache key.
+            data (Any): The response data.
+
+        """
+        cache.set(key, data, self.timeout)
+
+    def _increment(self, counter: str) -> None:
+        key = f"{self.key_prefix}:{counter}"
+        # `incr` fails on a missing key, and `add` doesn't overwrite a counter created in the meantime
+        cache.add(key, 0, None)
+        try:
+            cache.incr(key)
+        except ValueError:
+            pass
+
+    def stats(self) -> dict[str, int]:
+        """Get the hit and miss counters of the cache.
+
+        Returns:
+            dict[str, int]: The number of hits and misses.
+
+        """
+        values = cache.get_many([f"{self.key_prefix}:hits", f"{self.key_prefix}:misses"])
+        return {
+            "hits": values.get(f"{self.key_prefix}:hits", 0),
+            "misses": values.get(f"{self.key_prefix}:misses", 0),
+        }
+
+
+response_cache = ResponseCache(timeout=settings.API_RESPONSE_CACHE_TIMEOUT)
@@ -1,16 +1,29 @@
+import asyncio
+import hashlib
 import json
 import logging
-from dataclasses import dataclass
-from typing import Any, MutableMapping, Optional
+import math
+import os
+import socket
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Iterator, MutableMapping, Optional, TypeVar, cast
 
 from django.conf import settings
+from django.core.cache import cache
 
 from rest_framework import exceptions, serializers, status
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+from gissues.extensions.github_client import graphql
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class ServiceUnavailable(exceptions.APIException):
     status_code = status.HTTP_503_SERVICE_UNAVAILABLE
@@ -21,11 +34,141 @@ class ServiceUnavailable(exceptions.APIException):
     )
 
 
+class RateLimitExceeded(exceptions.Throttled):
+    default_detail = "GitHub API rate limit is exceeded."
+    default_code = "github_rate_limit_exceeded"
+    # The seconds until the quota is reset, it's always given
+    wait: int
+
+
+class RateLimitBudget:
+    """The GitHub API rate limit budget shared by every process through the cache.
+
+    The budget is updated from the `X-RateLimit-*` headers of every response, and each request
+    reserves a unit of it beforehand, so concurrent workers don't spend the same quota twice.
+    Requests are refused once the remaining quota drops to the reserve, or while GitHub asked to
+    back off with a `Retry-After` header (secondary rate limits). The reserve is left to the requests
+    made on behalf of an API client, which can spend it, so the background syncs can't starve them.
+    """
+
+    cache_key_prefix = "github-client:rate-limit"
+    # GitHub asks to wait at least a minute when a secondary rate limit is hit without `Retry-After`
+    default_backoff = 60
+
+    def __init__(self, reserve: int):
+        self.reserve = reserve
+
+    def _get_cache_key(self, name: str, resource: Optional[str] = None) -> str:
+        if resource is None:
+            return f"{self.cache_key_prefix}:{name}"
+
+        return f"{self.cache_key_prefix}:{resource}:{name}"
+
+    def acquire(self, resource: str = "core", use_reserve: bool = False) -> None:
+        """Reserve a request from the budget.
+
+        Args:
+            resource (str): The GitHub rate limit resource of the request. Defaults to "core".
+            use_reserve (bool): Whether the request can spend the reserve, only the requests made on behalf
+                of an API client should. Defaults to False.
+
+        Raises:
+            RateLimitExceeded: If the budget is exhausted, with the seconds to wait until it is available.
+
+        """
+        now = time.time()
+        remaining_key = self._get_cache_key("remaining", resource)
+        reset_key = self._get_cache_key("reset", resource)
+        blocked_until_key = self._get_cache_key("blocked-until")
+
+        values = cache.get_many([remaining_key, reset_key, blocked_until_key])
+
+        blocked_until = values.get(blocked_until_key)
+        if blocked_until is not None and blocked_until > now:
+            raise RateLimitExceeded(wait=math.ceil(blocked_until - now))
+
+        remaining, reset = values.get(remaining_key), values.get(reset_key)
+        if remaining is None or reset is None or reset <= now:
+            return None
+
+        if remaining <= (0 if use_reserve else self.reserve):
+            raise RateLimitExceeded(wait=math.ceil(reset - now))
+
+        try:
+            cache.decr(remaining_key)
+        except ValueError:
+            # The budget expired in the meantime
+            pass
+
+    def update(self, status_code: int, headers: MutableMapping[str, str], resource: str = "core") -> None:
+        """Update the budget from the headers of a GitHub API response.
+
+        Args:
+            status_code (int): The status code of the response.
+            headers (MutableMapping[str, str]): The headers of the response.
+            resource (str): The GitHub rate limit resource of the request. Defaults to "core".
+
+        """
+        now = time.time()
+        remaining, reset = headers.get("X-RateLimit-Remaining"), headers.get("X-RateLimit-Reset")
+
+        if remaining is not None and reset is not None:
+            cache.set_many(
+                {
+                    self._get_cache_key("remaining", resource): int(remaining),
+                    self._get_cache_key("reset", resource): int(reset),
+                },
+                max(math.ceil(int(reset) - now), 1),
+            )
+
+        if status_code not in (status.HTTP_403_FORBIDDEN, status.HTTP_429_TOO_MANY_REQUESTS):
+            return None
+
+        if retry_after := headers.get("Retry-After"):
+            blocked_until = now + int(retry_after)
+        elif remaining == "0" and reset is not None:
+            blocked_until = int(reset)
+        elif status_code == status.HTTP_429_TOO_MANY_REQUESTS:
+            blocked_until = now + self.default_backoff
+        else:
+            # A plain permission error
+            return None
+
+        logger.warning("GitHub API rate limit is exceeded, requests are blocked for %d seconds.", blocked_until - now)
+        cache.set(self._get_cache_key("blocked-until"), blocked_until, max(math.ceil(blocked_until - now), 1))
+
+    def status(self, resource: str = "core") -> dict[str, Optional[int | float]]:
+        """Get the current state of the budget.
+
+        Args:
+            resource (str): The GitHub rate limit resource. Defaults to "core".
+
+        Returns:
+            dict[str, Optional[int | float]]: The remaining requests, the reset time and the time until
+                the requests are blocked, as epoch seconds.
+
+        """
+        keys = {
+            "remaining": self._get_cache_key("remaining", resource),
+            "reset": self._get_cache_key("reset", resource),
+            "blocked_until": self._get_cache_key("blocked-until"),
+        }
+        values = cache.get_many(keys.values())
+        return {name: values.get(key) for name, key in keys.items()}
+
+
 @dataclass
 class GitHubResponse:
     status_code: int
-    content: dict[str, Any]
+    # The decoded JSON body, an object or, for the list endpoints, an array of objects
+    content: Any
     is_ok: bool
+    links: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def is_not_modified(self) -> bool:
+        """Whether the resource didn't change since the cached validators were stored."""
+        return self.status_code == status.HTTP_304_NOT_MODIFIED
 
     def exception_handler(self) -> None:
         assert not self.is_ok
@@ -39,13 +182,73 @@ class GitHubResponse:
         raise serializers.ValidationError(self.content, code="1000")
 
 
+class GitHubHTTPAdapter(HTTPAdapter):
+    __attrs__ = HTTPAdapter.__attrs__ + ["keep_alive"]
+
+    def __init__(self, keep_alive: bool = True, **kwargs: Any):
+        self.keep_alive = keep_alive
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, connections: int, maxsize: int, block: bool = False, **pool_kwargs: Any) -> None:
+        if self.keep_alive:
+            pool_kwargs.setdefault(
+                "socket_options",
+                [*HTTPConnection.default_socket_options, (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)],
+            )
+        # The method isn't annotated by the requests stubs
+        super().init_poolmanager(connections, maxsize, block, **pool_kwargs)  # type: ignore[no-untyped-call]
+
+    def pool_stats(self) -> dict[str, int]:
+        """Get the connection reuse counters of the host pools.
+
+        Every request served by an already open connection is a hit, every newly opened connection is a miss.
+
+        Returns:
+            dict[str, int]: The number of hits and misses.
+
+        """
+        pools = [self.poolmanager.pools[key] for key in self.poolmanager.pools.keys()]
+        num_requests = sum(pool.num_requests for pool in pools)
+        num_connections = sum(pool.num_connections for pool in pools)
+        return {"hits": num_requests - num_connections, "misses": num_connections}
+
+
 class GitHubClient:
     client_url = settings.GITHUB_CLIENT_URL
     client_token = settings.GITHUB_CLIENT_AUTH_TOKEN
+    pool_connections = settings.GITHUB_CLIENT_POOL_CONNECTIONS
+    pool_maxsize = settings.GITHUB_CLIENT_POOL_MAXSIZE
+    pool_block = settings.GITHUB_CLIENT_POOL_BLOCK
+    keep_alive = settings.GITHUB_CLIENT_KEEP_ALIVE
+    per_page = 100  # The maximum page size allowed by GitHub
+    validators_cache_timeout = settings.GITHUB_CLIENT_VALIDATORS_CACHE_TIMEOUT
+
+    def __init__(self) -> None:
+        self._session: Optional[requests.Session] = None
+        self._session_pid: Optional[int] = None
+        self.rate_limit = RateLimitBudget(reserve=settings.GITHUB_CLIENT_RATE_LIMIT_RESERVE)
 
     @property
     def session(self) -> requests.Session:
+        # The session is bound to the process that created it, forked children (e.g. celery prefork
+        # workers) must not share the sockets of their parent, so they get a pool of their own.
+        if self._session is None or self._session_pid != os.getpid():
+            self._session = self._build_session()
+            self._session_pid = os.getpid()
+
+        return self._session
+
+    def _build_session(self) -> requests.Session:
+        adapter = GitHubHTTPAdapter(
+            keep_alive=self.keep_alive,
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+
         session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
         session.headers.update(
             {
                 "Accept": "application/vnd.github+json",
@@ -58,6 +261,24 @@ class GitHubClient:
 
         return session
 
+    def close(self) -> None:
+        """Close the session and release the pooled connections."""
+        if self._session is not None:
+            self._session.close()
+
+        self._session = None
+        self._session_pid = None
+
+    def pool_stats(self) -> dict[str, int]:
+        """Get the connection pool hit/miss counters of the current process.
+
+        Returns:
+            dict[str, int]: The number of hits and misses.
+
+        """
+        adapter = cast(GitHubHTTPAdapter, self.session.get_adapter(self.client_url))
+        return adapter.pool_stats()
+
     @staticmethod
     def _mask_secret_info(
         data: Optional[dict[str, Any] | MutableMapping[str, Any]],
@@ -106,40 +327,118 @@ class GitHubClient:
             response_status,
         )
 
-    def make_request(self, method: str, endpoint: str, **kwargs: Any) -> GitHubResponse:
+    @staticmethod
+    def _get_validators_cache_key(url: str, params: Optional[dict[str, Any]] = None) -> str:
+        prepared_url = requests.Request("GET", url, params=params).prepare().url or url
+        return "github-client:validators:%s" % hashlib.sha256(prepared_url.encode()).hexdigest()
+
+    def make_request(
+        self,
+        method: str,
+        endpoint: str,
+        conditional: bool = False,
+        resource: str = "core",
+        use_reserve: bool = False,
+        **kwargs: Any,
+    ) -> GitHubResponse:
         """Make a request to the GitHub API.
 
+        Conditional requests send the `ETag`/`Last-Modified` validators stored from the previous response
+        of the same URL, if the resource didn't change GitHub answers with an empty `304 Not Modified`
+        response which doesn't count against the rate limit.
+
         Args:
             method (str): The HTTP method to use.
-            endpoint (str): The URL to request.
+            endpoint (str): The URL to request, either relative to the client URL or an absolute one
+                pointing to the client URL (e.g. a pagination link).
+            conditional (bool): Whether to make a conditional request. Only the callers that can handle
+                a `304 Not Modified` response without content should enable it. Defaults to False.
+            resource (str): The GitHub rate limit resource the request is counted against. Defaults to "core".
+            use_reserve (bool): Whether the request can spend the rate limit reserve, see `RateLimitBudget`.
+                Defaults to False.
             **kwargs: Additional keyword arguments to pass to `requests.Session.request`.
 
         Returns:
             GitHubResponse: The response from the GitHub API.
 
+        Raises:
+            ServiceUnavailable: If GitHub API can't be reached.
+            RateLimitExceeded: If the rate limit budget is exhausted.
+
         """
-        url = self.client_url + endpoint
+        url = endpoint if endpoint.startswith(self.client_url) else self.client_url + endpoint
+
+        validators_cache_key = None
+        if conditional and method == "GET":
+            validators_cache_key = self._get_validators_cache_key(url, kwargs.get("params"))
+
+            if validators := cache.get(validators_cache_key):
+                kwargs["headers"] = {**validators, **kwargs.get("headers", {})}
+
+        self.rate_limit.acquire(resource, use_reserve=use_reserve)
+
         try:
             response = self.session.request(method, url, **kwargs)
         except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
             raise ServiceUnavailable()
 
+        self.rate_limit.update(response.status_code, response.headers, resource)
+
         github_response = GitHubResponse(
             status_code=response.status_code,
-            content=response.json(),
+            content=response.json() if response.content else {},
             is_ok=response.ok,
+            links={rel: link["url"] for rel, link in response.links.items()},
         )
 
+        if validators_cache_key and response.status_code == status.HTTP_200_OK:
+            validators = {
+                header: response.headers[validator]
+                for header, validator in (("If-None-Match", "ETag"), ("If-Modified-Since", "Last-Modified"))
+                if validator in response.headers
+            }
+            if validators:
+                cache.set(validators_cache_key, validators, self.validators_cache_timeout)
+
         self._log_request(
             method,
             url,
-            self.session.headers,
+            # Masking works in place, the headers of the shared session must not be altered
+            dict(self.session.headers),
             json.loads(response.request.body) if response.request.body else None,
             github_response.content,
             github_response.status_code,
         )
         return github_response
 
+    def paginate(
+        self, method: str, endpoint: str, conditional: bool = False, **kwargs: Any
+    ) -> Iterator[GitHubResponse]:
+        """Iterate over the pages of an endpoint by following the `Link: rel="next"` headers.
+
+        Pages are requested lazily, one at a time, so the caller can stop iterating at any point.
+        A failed response is yielded as is and ends the iteration.
+
+        Args:
+            method (str): The HTTP method to use.
+            endpoint (str): The URL of the first page.
+            conditional (bool): Whether to request the first page conditionally, a `304 Not Modified`
+                first page ends the iteration. Defaults to False.
+            **kwargs: Additional keyword arguments to pass to `requests.Session.request`.
+
+        Yields:
+            GitHubResponse: The response of each page from the GitHub API.
+
+        """
+        params = {"per_page": self.per_page, **kwargs.pop("params", {})}
+        response = self.make_request(method, endpoint, conditional=conditional, params=params, **kwargs)
+        yield response
+
+        # The next links already carry the query parameters of the first request
+        while response.is_ok and "next" in response.links:
+            response = self.make_request(method, response.links["next"], **kwargs)
+            yield response
+
     @property
     def issues(self) -> "GitHubIssues":
         """Get the GitHub issues client."""
@@ -155,6 +454,114 @@ class GitHubClient:
         """Get the GitHub comments client."""
         return GitHubComments(self)
 
+    @property
+    def graphql(self) -> "GitHubGraphQL":
+        """Get the GitHub GraphQL client."""
+        return GitHubGraphQL(self)
+
+
+class AsyncGitHubClient:
+    """The asynchronous counterpart of `GitHubClient`.
+
+    The requests are made by the wrapped client in worker threads, so they share its connection pool
+    and rate limit budget, while at most `concurrency` of them are in flight at the same time.
+    """
+
+    def __init__(self, base_client: GitHubClient, concurrency: int) -> None:
+        self.base_client = base_client
+        self.concurrency = concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        # Each `run` call has an event loop of its own, a semaphore can't be shared between them
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+            self._semaphore_loop = loop
+
+        return self._semaphore
+
+    @staticmethod
+    def run(awaitable: Awaitable[T]) -> T:
+        """Run an awaitable to completion from synchronous code, e.g. a celery task.
+
+        Args:
+            awaitable (Awaitable[T]): The awaitable to run.
+
+        Returns:
+            T: The result of the awaitable.
+
+        """
+
+        async def main() -> T:
+            return await awaitable
+
+        return asyncio.run(main())
+
+    async def make_request(
+        self, method: str, endpoint: str, conditional: bool = False, **kwargs: Any
+    ) -> GitHubResponse:
+        """Make a request to the GitHub API without blocking the event loop.
+
+        Args:
+            method (str): The HTTP method to use.
+            endpoint (str): The endpoint to make the request to, or an absolute URL of the GitHub API.
+            conditional (bool): Whether to make a conditional request. Defaults to False.
+            **kwargs: Additional keyword arguments to pass to `requests.Session.request`.
+
+        Returns:
+            GitHubResponse: The response from the GitHub API.
+
+        Raises:
+            ServiceUnavailable: If the GitHub API is unavailable.
+            RateLimitExceeded: If the GitHub API rate limit budget is exhausted.
+
+        """
+        async with self.semaphore:
+            return await asyncio.to_thread(self.base_client.make_request, method, endpoint, conditional, **kwargs)
+
+    async def paginate(
+        self, method: str, endpoint: str, conditional: bool = False, **kwargs: Any
+    ) -> AsyncIterator[GitHubResponse]:
+        """Iterate over the pages of an endpoint by following the `Link: rel="next"` headers.
+
+        Args:
+            method (str): The HTTP method to use.
+            endpoint (str): The URL of the first page.
+            conditional (bool): Whether to request the first page conditionally, a `304 Not Modified`
+                first page ends the iteration. Defaults to False.
+            **kwargs: Additional keyword arguments to pass to `requests.Session.request`.
+
+        Yields:
+            GitHubResponse: The response of each page from the GitHub API.
+
+        """
+        params = {"per_page": self.base_client.per_page, **kwargs.pop("params", {})}
+        response = await self.make_request(method, endpoint, conditional=conditional, params=params, **kwargs)
+        yield response
+
+        # The pages of an endpoint are chained, only different endpoints are fetched concurrently
+        while response.is_ok and "next" in response.links:
+            response = await self.make_request(method, response.links["next"], **kwargs)
+            yield response
+
+    @property
+    def issues(self) -> "AsyncGitHubIssues":
+        """Get the asynchronous GitHub issues client."""
+        return AsyncGitHubIssues(self)
+
+    @property
+    def repositories(self) -> "AsyncGitHubRepositories":
+        """Get the asynchronous GitHub repositories client."""
+        return AsyncGitHubRepositories(self)
+
+    @property
+    def comments(self) -> "AsyncGitHubComments":
+        """Get the asynchronous GitHub comments client."""
+        return AsyncGitHubComments(self)
+
 
 class GitHubIssues:
     _path_list = "/repos/%(owner_name)s/%(repository_name)s/issues?state=all"
@@ -177,13 +584,34 @@ class GitHubIssues:
         url = self._path_list % {"owner_name": owner_name, "repository_name": repository_name}
         return self.base_client.make_request("GET", url)
 
-    def detail(self, owner_name: str, repository_name: str, issue_number: int | str) -> GitHubResponse:
+    def paginate(
+        self, owner_name: str, repository_name: str, conditional: bool = False, **params: Any
+    ) -> Iterator[GitHubResponse]:
+        """Iterate over all the issue pages of a repository.
+
+        Args:
+            owner_name (str): The repository owner_name.
+            repository_name (str): The repository name.
+            conditional (bool): Whether to request the first page conditionally. Defaults to False.
+            **params: Additional query parameters to filter the issues.
+
+        Yields:
+            GitHubResponse: The response of each page from the GitHub API.
+
+        """
+        url = self._path_list % {"owner_name": owner_name, "repository_name": repository_name}
+        return self.base_client.paginate("GET", url, conditional=conditional, params=params)
+
+    def detail(
+        self, owner_name: str, repository_name: str, issue_number: int | str, use_reserve: bool = False
+    ) -> GitHubResponse:
         """Get details for an issue.
 
         Args:
             owner_name (str): The repository owner_name.
             repository_name (str): The repository name.
             issue_number (int | str): The issue number.
+            use_reserve (bool): Whether the request can spend the rate limit reserve. Defaults to False.
 
         Returns:
             GitHubResponse: The response from the GitHub API.
@@ -194,7 +622,7 @@ class GitHubIssues:
             "repository_name": repository_name,
             "issue_number": issue_number,
         }
-        return self.base_client.make_request("GET", url)
+        return self.base_client.make_request("GET", url, use_reserve=use_reserve)
 
 
 class GitHubRepositories:
@@ -217,19 +645,35 @@ class GitHubRepositories:
         url = self._path_list % {"username": username}
         return self.base_client.make_request("GET", url)
 
-    def detail(self, owner_name: str, repository_name: str) -> GitHubResponse:
+    def paginate(self, username: str, conditional: bool = False, **params: Any) -> Iterator[GitHubResponse]:
+        """Iterate over all the repository pages of a user.
+
+        Args:
+            username (str): The user's username.
+            conditional (bool): Whether to request the first page conditionally. Defaults to False.
+            **params: Additional query parameters to filter the repositories.
+
+        Yields:
+            GitHubResponse: The response of each page from the GitHub API.
+
+        """
+        url = self._path_list % {"username": username}
+        return self.base_client.paginate("GET", url, conditional=conditional, params=params)
+
+    def detail(self, owner_name: str, repository_name: str, use_reserve: bool = False) -> GitHubResponse:
         """Get details for a repository.
 
         Args:
             owner_name (str): The repository owner_name.
             repository_name (str): The repository name.
+            use_reserve (bool): Whether the request can spend the rate limit reserve. Defaults to False.
 
         Returns:
             GitHubResponse: The response from the GitHub API.
 
         """
         url = self._path_detail % {"owner_name": owner_name, "repository_name": repository_name}
-        return self.base_client.make_request("GET", url)
+        return self.base_client.make_request("GET", url, use_reserve=use_reserve)
 
 
 class GitHubComments:
@@ -258,13 +702,44 @@ class GitHubComments:
         }
         return self.base_client.make_request("GET", url)
 
-    def detail(self, owner_name: str, repository_name: str, comment_id: int | str) -> GitHubResponse:
+    def paginate(
+        self,
+        owner_name: str,
+        repository_name: str,
+        issue_number: int | str,
+        conditional: bool = False,
+        **params: Any,
+    ) -> Iterator[GitHubResponse]:
+        """Iterate over all the comment pages of an issue.
+
+        Args:
+            owner_name (str): The repository owner_name.
+            repository_name (str): The repository name.
+            issue_number (int | str): The issue number.
+            conditional (bool): Whether to request the first page conditionally. Defaults to False.
+            **params: Additional query parameters to filter the comments.
+
+        Yields:
+            GitHubResponse: The response of each page from the GitHub API.
+
+        """
+        url = self._path_list % {
+            "owner_name": owner_name,
+            "repository_name": repository_name,
+            "issue_number": issue_number,
+        }
+        return self.base_client.paginate("GET", url, conditional=conditional, params=params)
+
+    def detail(
+        self, owner_name: str, repository_name: str, comment_id: int | str, use_reserve: bool = False
+    ) -> GitHubResponse:
         """Get details for a comment.
 
         Args:
             owner_name (str): The repository owner_name.
             repository_name (str): The repository name.
             comment_id (int | str): The comment ID.
+            use_reserve (bool): Whether the request can spend the rate limit reserve. Defaults to False.
 
         Returns:
             GitHubResponse: The response from the GitHub API.
@@ -275,7 +750,212 @@ class GitHubComments:
             "repository_name": repository_name,
             "comment_id": comment_id,
         }
-        return self.base_client.make_request("GET", url)
+        return self.base_client.make_request("GET", url, use_reserve=use_reserve)
+
+
+class AsyncGitHubIssues:
+    """The asynchronous counterpart of `GitHubIssues`."""
+
+    _path_list = GitHubIssues._path_list
+    _path_detail = GitHubIssues._path_detail
+
+    def __init__(self, base_client: AsyncGitHubClient):
+        self.base_client = base_client
+
+    async def list(self, owner_name: str, repository_name: str) -> GitHubResponse:
+        """List issues for a repository, see `GitHubIssues.list`."""
+        url = self._path_list % {"owner_name": owner_name, "repository_name": repository_name}
+        return await self.base_client.make_request("GET", url)
+
+    def paginate(
+        self, owner_name: str, repository_name: str, conditional: bool = False, **params: Any
+    ) -> AsyncIterator[GitHubResponse]:
+        """Iterate over all the issue pages of a repository, see `GitHubIssues.paginate`."""
+        url = self._path_list % {"owner_name": owner_name, "repository_name": repository_name}
+        return self.base_client.paginate("GET", url, conditional=conditional, params=params)
+
+    async def detail(
+        self, owner_name: str, repository_name: str, issue_number: int | str, use_reserve: bool = False
+    ) -> GitHubResponse:
+        """Get details for an issue, see `GitHubIssues.detail`."""
+        url = self._path_detail % {
+            "owner_name": owner_name,
+            "repository_name": repository_name,
+            "issue_number": issue_number,
+        }
+        return await self.base_client.make_request("GET", url, use_reserve=use_reserve)
+
+
+class AsyncGitHubRepositories:
+    """The asynchronous counterpart of `GitHubRepositories`."""
+
+    _path_list = GitHubRepositories._path_list
+    _path_detail = GitHubRepositories._path_detail
+
+    def __init__(self, base_client: AsyncGitHubClient):
+        self.base_client = base_client
+
+    async def list(self, username: str) -> GitHubResponse:
+        """List repositories for a user, see `GitHubRepositories.list`."""
+        url = self._path_list % {"username": username}
+        return await self.base_client.make_request("GET", url)
+
+    def paginate(self, username: str, conditional: bool = False, **params: Any) -> AsyncIterator[GitHubResponse]:
+        """Iterate over all the repository pages of a user, see `GitHubRepositories.paginate`."""
+        url = self._path_list % {"username": username}
+        return self.base_client.paginate("GET", url, conditional=conditional, params=params)
+
+    async def detail(self, owner_name: str, repository_name: str, use_reserve: bool = False) -> GitHubResponse:
+        """Get details for a repository, see `GitHubRepositories.detail`."""
+        url = self._path_detail % {"owner_name": owner_name, "repository_name": repository_name}
+        return await self.base_client.make_request("GET", url, use_reserve=use_reserve)
+
+
+class AsyncGitHubComments:
+    """The asynchronous counterpart of `GitHubComments`."""
+
+    _path_list = GitHubComments._path_list
+    _path_detail = GitHubComments._path_detail
+
+    def __init__(self, base_client: AsyncGitHubClient):
+        self.base_client = base_client
+
+    async def list(self, owner_name: str, repository_name: str, issue_number: int | str) -> GitHubResponse:
+        """List comments for an issue, see `GitHubComments.list`."""
+        url = self._path_list % {
+            "owner_name": owner_name,
+            "repository_name": repository_name,
+            "issue_number": issue_number,
+        }
+        return await self.base_client.make_request("GET", url)
+
+    def paginate(
+        self,
+        owner_name: str,
+        repository_name: str,
+        issue_number: int | str,
+        conditional: bool = False,
+        **params: Any,
+    ) -> AsyncIterator[GitHubResponse]:
+        """Iterate over all the comment pages of an issue, see `GitHubComments.paginate`."""
+        url = self._path_list % {
+            "owner_name": owner_name,
+            "repository_name": repository_name,
+            "issue_number": issue_number,
+        }
+        return self.base_client.paginate("GET", url, conditional=conditional, params=params)
+
+    async def detail(
+        self, owner_name: str, repository_name: str, comment_id: int | str, use_reserve: bool = False
+    ) -> GitHubResponse:
+        """Get details for a comment, see `GitHubComments.detail`."""
+        url = self._path_detail % {
+            "owner_name": owner_name,
+            "repository_name": repository_name,
+            "comment_id": comment_id,
+        }
+        return await self.base_client.make_request("GET", url, use_reserve=use_reserve)
+
+
+class GitHubGraphQL:
+    _path = "/graphql"
+    issues_per_page = 50
+    # GitHub limits a query to 500,000 nodes, so the issues and their comments are kept well below it
+    comments_per_page = 50
+
+    def __init__(self, base_client: GitHubClient):
+        self.base_client = base_client
+
+    def query(self, query: str, **variables: Any) -> GitHubResponse:
+        """Run a GraphQL query, GitHub only accepts authenticated ones.
+
+        Args:
+            query (str): The GraphQL query.
+            **variables: The variables of the query.
+
+        Returns:
+            GitHubResponse: The response from the GitHub API, a response with errors is not ok.
+
+        """
+        response = self.base_client.make_request(
+            "POST", self._path, resource="graphql", json={"query": query, "variables": variables}
+        )
+
+        # GraphQL errors are reported with a `200 OK` status code
+        if response.is_ok and response.content.get("errors"):
+            return GitHubResponse(response.status_code, response.content, False)
+
+        return response
+
+    def paginate_issues(
+        self, owner_name: str, repository_name: str, since: Optional[str] = None
+    ) -> Iterator[GitHubResponse]:
+        """Iterate over the issue pages of a repository, each issue carrying all of its comments.
+
+        The issues are ordered by their last update, most recent first. A page is fetched with a single
+        request, only the issues with more comments than `comments_per_page` need extra requests.
+
+        Args:
+            owner_name (str): The repository owner_name.
+            repository_name (str): The repository name.
+            since (Optional[str]): Only the issues updated at or after this ISO 8601 timestamp. Defaults to None.
+
+        Yields:
+            GitHubResponse: The issues of each page, in the shape of the REST API issues with their comments
+                in the shape of the REST API comments under `comment_list`. A failed response is yielded
+                as is and ends the iteration.
+
+        """
+        variables = {
+            "owner": owner_name,
+            "name": repository_name,
+            "first": self.issues_per_page,
+            "after": None,
+            "since": since,
+            "commentsFirst": self.comments_per_page,
+        }
+
+        while True:
+            response = self.query(graphql.ISSUES_WITH_COMMENTS_QUERY, **variables)
+            if not response.is_ok:
+                yield response
+                return None
+
+            issues, page = response.content["data"]["repository"]["issues"], []
+            for node in issues["nodes"]:
+                comment_nodes, page_info = list(node["comments"]["nodes"]), node["comments"]["pageInfo"]
+
+                while page_info["hasNextPage"]:
+                    comments_response = self.query(
+                        graphql.ISSUE_COMMENTS_QUERY,
+                        owner=owner_name,
+                        name=repository_name,
+                        number=node["number"],
+                        first=self.comments_per_page,
+                        after=page_info["endCursor"],
+                    )
+                    if not comments_response.is_ok:
+                        yield comments_response
+                        return None
+
+                    comments = comments_response.content["data"]["repository"]["issue"]["comments"]
+                    comment_nodes.extend(comments["nodes"])
+                    page_info = comments["pageInfo"]
+
+                page.append(
+                    {
+                        **graphql.issue_from_node(node),
+                        "comment_list": [graphql.comment_from_node(comment_node) for comment_node in comment_nodes],
+                    }
+                )
+
+            yield GitHubResponse(response.status_code, page, True)
+
+            if not issues["pageInfo"]["hasNextPage"]:
+                return None
+
+            variables["after"] = issues["pageInfo"]["endCursor"]
 
 
 github_client = GitHubClient()
+async_github_client = AsyncGitHubClient(github_client, concurrency=settings.GITHUB_CLIENT_ASYNC_CONCURRENCY)
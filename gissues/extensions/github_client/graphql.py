@@ -0,0 +1,109 @@
+from typing import Any, Optional
+
+# The nodes are mapped to the shape of the REST API resources, so both sync modes share the transformers
+ISSUE_FIELDS = """
+    number
+    title
+    body
+    state
+    stateReason
+    closedAt
+    locked
+    activeLockReason
+    createdAt
+    updatedAt
+"""
+
+COMMENT_FIELDS = """
+    databaseId
+    body
+    createdAt
+    updatedAt
+"""
+
+ISSUES_WITH_COMMENTS_QUERY = f"""
+query IssuesWithComments(
+    $owner: String!, $name: String!, $first: Int!, $after: String, $since: DateTime, $commentsFirst: Int!
+) {{
+    repository(owner: $owner, name: $name) {{
+        issues(
+            first: $first, after: $after, filterBy: {{since: $since}}, orderBy: {{field: UPDATED_AT, direction: DESC}}
+        ) {{
+            pageInfo {{ hasNextPage endCursor }}
+            nodes {{
+                {ISSUE_FIELDS}
+                comments(first: $commentsFirst) {{
+                    totalCount
+                    pageInfo {{ hasNextPage endCursor }}
+                    nodes {{ {COMMENT_FIELDS} }}
+                }}
+            }}
+        }}
+    }}
+}}
+"""
+
+ISSUE_COMMENTS_QUERY = f"""
+query IssueComments($owner: String!, $name: String!, $number: Int!, $first: Int!, $after: String) {{
+    repository(owner: $owner, name: $name) {{
+        issue(number: $number) {{
+            comments(first: $first, after: $after) {{
+                pageInfo {{ hasNextPage endCursor }}
+                nodes {{ {COMMENT_FIELDS} }}
+            }}
+        }}
+    }}
+}}
+"""
+
+LOCK_REASONS = {
+    "OFF_TOPIC": "off_topic",
+    "TOO_HEATED": "too heated",
+    "RESOLVED": "resolved",
+    "SPAM": "spam",
+}
+
+
+def _lower(value: Optional[str]) -> Optional[str]:
+    return value.lower() if value is not None else None
+
+
+def issue_from_node(node: dict[str, Any]) -> dict[str, Any]:
+    """Map a GraphQL issue node to the shape of a REST API issue.
+
+    Args:
+        node (dict[str, Any]): The GraphQL issue node.
+
+    Returns:
+        dict[str, Any]: The issue as returned by the REST API.
+    """
+    return {
+        "number": node["number"],
+        "title": node["title"],
+        "body": node["body"],
+        "state": node["state"].lower(),
+        "state_reason": _lower(node["stateReason"]),
+        "closed_at": node["closedAt"],
+        "locked": node["locked"],
+        "active_lock_reason": LOCK_REASONS.get(node["activeLockReason"], _lower(node["activeLockReason"])),
+        "comments": node["comments"]["totalCount"],
+        "created_at": node["createdAt"],
+        "updated_at": node["updatedAt"],
+    }
+
+
+def comment_from_node(node: dict[str, Any]) -> dict[str, Any]:
+    """Map a GraphQL issue comment node to the shape of a REST API comment.
+
+    Args:
+        node (dict[str, Any]): The GraphQL issue comment node.
+
+    Returns:
+        dict[str, Any]: The comment as returned by the REST API.
+    """
+    return {
+        "id": node["databaseId"],
+        "body": node["body"],
+        "created_at": node["createdAt"],
+        "updated_at": node["updatedAt"],
+    }
@@ -0,0 +1,132 @@
+import uuid
+from typing import Any, Optional
+
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, cache, caches
+from django.core.cache.backends.redis import RedisCache
+
+from redis.exceptions import LockError
+from redis.lock import Lock
+
+from gissues.extensions.github_client.cache import Scope
+
+
+def _get_key(prefix: str, scope: Scope) -> str:
+    return f"github-api:{prefix}:{':'.join(map(str, scope))}"
+
+
+class Lease:
+    """A lease on a scope, so that a single task at a time syncs it across all the workers.
+
+    The lease expires after a timeout, so a worker that dies while holding it doesn't block the scope forever,
+    and a task that holds it for longer extends it as it goes.
+    It can be used as a context manager, which gives whether the lease was acquired and releases it on exit.
+    """
+
+    def __init__(self, scope: Scope, timeout: Optional[int] = None):
+        self.key = _get_key("lease", scope)
+        self.timeout = timeout if timeout is not None else settings.GITHUB_CLIENT_SYNC_LEASE_TIMEOUT
+        self.token = uuid.uuid4().hex
+        self.is_acquired = False
+
+        # On Redis, redis-py's lock compares the token and releases or extends the lease in a single script.
+        # The other backends, like the local memory one of the tests, compare and update the key separately.
+        self._lock: Optional[Lock] = None
+        backend = caches[DEFAULT_CACHE_ALIAS]
+        if isinstance(backend, RedisCache):
+            self._lock = Lock(
+                backend._cache.get_client(self.key, write=True),
+                backend.make_and_validate_key(self.key),
+                timeout=self.timeout,
+                thread_local=False,
+            )
+
+    def acquire(self) -> bool:
+        """Acquire the lease, unless another task holds it.
+
+        Returns:
+            bool: Whether the lease was acquired.
+
+        """
+        if self._lock is not None:
+            self.is_acquired = self._lock.acquire(blocking=False, token=self.token)
+        else:
+            # `add` only sets a missing key
+            self.is_acquired = cache.add(self.key, self.token, self.timeout)
+        return self.is_acquired
+
+    def extend(self) -> bool:
+        """Reset the timeout of the lease, unless it has expired and another task holds it by now.
+
+        Returns:
+            bool: Whether the lease is still held.
+
+        """
+        if not self.is_acquired:
+            return False
+
+        if self._lock is not None:
+            try:
+                self._lock.reacquire()
+            except LockError:
+                self.is_acquired = False
+        elif cache.get(self.key) == self.token:
+            cache.touch(self.key, self.timeout)
+        else:
+            self.is_acquired = False
+        return self.is_acquired
+
+    def release(self) -> None:
+        """Release the lease, unless it has expired and another task holds it by now."""
+        if self.is_acquired:
+            if self._lock is not None:
+                try:
+                    self._lock.release()
+                except LockError:
+                    pass
+            elif cache.get(self.key) == self.token:
+                cache.delete(self.key)
+        self.is_acquired = False
+
+    def __enter__(self) -> bool:
+        return self.acquire()
+
+    def __exit__(self, *args: Any) -> None:
+        self.release()
+
+
+def mark_queued(scope: Scope, timeout: Optional[int] = None) -> bool:
+    """Mark a scope as having a sync task in the queue, unless it already has one.
+
+    Args:
+        scope (Scope): The scope.
+        timeout (Optional[int]): The seconds after which the mark expires, in case the task is lost.
+            Defaults to `GITHUB_CLIENT_SYNC_LEASE_TIMEOUT`.
+
+    Returns:
+        bool: Whether the scope was marked, and the task should be queued.
+
+    """
+    timeout = timeout if timeout is not None else settings.GITHUB_CLIENT_SYNC_LEASE_TIMEOUT
+    return cache.add(_get_key("queued", scope), True, timeout)
+
+
+def keep_queued(scope: Scope, timeout: int) -> None:
+    """Keep the queued mark of a scope while its task waits to be retried.
+
+    Args:
+        scope (Scope): The scope.
+        timeout (int): The seconds after which the mark expires, in case the task is lost.
+
+    """
+    cache.set(_get_key("queued", scope), True, timeout)
+
+
+def clear_queued(scope: Scope) -> None:
+    """Clear the queued mark of a scope, once its task has finished or given up.
+
+    Args:
+        scope (Scope): The scope.
+
+    """
+    cache.delete(_get_key("queued", scope))
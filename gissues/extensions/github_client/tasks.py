@@ -1,163 +1,646 @@
+import asyncio
 import datetime
 import logging
+from itertools import groupby
+from operator import attrgetter
+from typing import Any, Callable, Iterable, Optional, TypeVar, cast
 
-from django.core.mail import send_mail
-
-from simple_history.utils import bulk_create_with_history, bulk_update_with_history
+from django.conf import settings
+from django.core.mail import send_mass_mail
+from django.db import transaction
+from django.db.models import F, Field, Max, Q
+from django.utils import timezone
 
 from gissues.celery import app
+from gissues.extensions.auth.models import PendingNotification, User, UserRepositoryFollow
+from gissues.extensions.github.dataclasses import CommentsDataclass, IssueDataclass
 from gissues.extensions.github.models import Comments, Issue, Repository
-from gissues.extensions.github.transformers import transform_comments, transform_issue
-from gissues.extensions.github_client.client import github_client
+from gissues.extensions.github.transformers import bulk_transform_comments, bulk_transform_issues
+from gissues.extensions.github_client.cache import Scope, issue_scope, repository_scope, response_cache
+from gissues.extensions.github_client.client import (
+    GitHubResponse,
+    RateLimitExceeded,
+    async_github_client,
+    github_client,
+)
+from gissues.extensions.github_client.locks import Lease, clear_queued, keep_queued, mark_queued
 
 logger = logging.getLogger(__name__)
 
+SyncedModel = TypeVar("SyncedModel", Issue, Comments)
 
-@app.task
-def send_email(subject: str, message: str, user_email: str) -> None:
-    send_mail(
-        subject,
-        message,
+ISSUE_SYNCED_FIELDS = [
+    "title",
+    "body",
+    "is_closed",
+    "closed_at",
+    "state_reason",
+    "is_locked",
+    "lock_reason",
+    "comment_count",
+    "created_at",
+    "updated_at",
+]
+COMMENT_SYNCED_FIELDS = ["body", "created_at", "updated_at"]
+
+
+class GitHubTask(app.Task):
+    """A task that is postponed until the GitHub API rate limit budget is available again.
+
+    The tasks deduplicated in the queue get the scopes they're marked with, see `mark_queued`, from their
+    arguments with `get_queued_scopes`. The marks are kept while a task waits to be retried, so the same
+    sync isn't queued again meanwhile, and they're cleared once it has finished or given up.
+    """
+
+    get_queued_scopes: Optional[Callable[..., list[Scope]]] = None
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        scopes = self.get_queued_scopes(*args, **kwargs) if self.get_queued_scopes else []
+        is_retried = False
+        try:
+            return super().__call__(*args, **kwargs)
+        except RateLimitExceeded as exc:
+            logger.info(f"Postponing {self.name} for {exc.wait} seconds due to GitHub API rate limit")
+            for scope in scopes:
+                keep_queued(scope, exc.wait + settings.GITHUB_CLIENT_SYNC_LEASE_TIMEOUT)
+            is_retried = True
+            raise self.retry(exc=exc, countdown=exc.wait, max_retries=None)
+        finally:
+            if not is_retried:
+                for scope in scopes:
+                    clear_queued(scope)
+
+
+def _notification_message(
+    owner_name: str, repository_name: str, issue: dict[str, Any], user_email: str
+) -> tuple[str, str, str, list[str]]:
+    return (
+        f"New Issue Notification on {owner_name}/{repository_name}",
+        "Hello,\n\n"
+        "A new issue has been created or updated in one of the repositories you're following.\n"
+        "Please check it out for more details.\n\n"
+        f"Repository: {owner_name}/{repository_name}\n"
+        f"Title: {issue['title']}\n"
+        f"Issue Number: {issue['number']}\n\n"
+        "Best regards,\n"
+        "Github Issues Tracker Team",
         "gissues@localhost.com",
         [user_email],
     )
-    return None
 
 
-@app.task
-def comment_adapter_task(owner: str, repository_name: str, issue_number: int | str):
-    comment_response = github_client.comments.list(owner, repository_name, issue_number)
+def _digest_message(user_email: str, issues: list[Issue]) -> tuple[str, str, str, list[str]]:
+    issue_lines = "".join(
+        f"- {issue.repository.owner_name}/{issue.repository.name} #{issue.number}: {issue.title}\n" for issue in issues
+    )
+    return (
+        f"{len(issues)} New Issue Notifications",
+        "Hello,\n\n"
+        "The following issues have been created or updated in the repositories you're following.\n"
+        "Please check them out for more details.\n\n"
+        f"{issue_lines}\n"
+        "Best regards,\n"
+        "Github Issues Tracker Team",
+        "gissues@localhost.com",
+        [user_email],
+    )
 
-    if not comment_response.is_ok:
-        logger.error(f"Failed to fetch comments for issue {issue_number} from {owner}/{repository_name}")
-        return None
 
-    comments = comment_response.content
+@app.task
+def notify_followers_task(owner_name: str, repository_name: str, issues: list[dict[str, Any]]) -> None:
+    """Notify the followers of a repository about its new or updated issues.
 
-    comments_mapping_with_id = Comments.objects.filter(issue__number=issue_number).in_bulk(field_name="comment_id")
+    The followers with immediate delivery are emailed right away, the others get the issues in their
+    next digest, see `send_notification_digests`.
 
-    bulk_create, bulk_update = [], []
-    for comment in comments:
-        old_comment = comments_mapping_with_id.get(comment["id"])
+    Args:
+        owner_name (str): The repository owner_name.
+        repository_name (str): The repository name.
+        issues (list[dict[str, Any]]): The `number`, `title`, `created_at` and `updated_at` of the issues.
 
-        if old_comment is None or old_comment.updated_at.isoformat().replace("+00:00", "Z") != comment["updated_at"]:
-            transformed_data = transform_comments(comment, issue_number)
+    """
+    followers = UserRepositoryFollow.objects.filter(
+        repository__owner_name=owner_name, repository__name=repository_name
+    ).values_list("user_id", "user__email", "user__notification_delivery", "created_at")
+
+    messages, digest_notifications = [], []
+    for user_id, user_email, notification_delivery, following_date in followers:
+        for issue in issues:
+            # Don't send email if the issue was created before the following date
+            if (
+                datetime.datetime.fromisoformat(issue["created_at"]) <= following_date
+                and datetime.datetime.fromisoformat(issue["updated_at"]) <= following_date
+            ):
+                continue
 
-            if old_comment:
-                obj = comments_mapping_with_id[transformed_data.comment_id]
-                obj.body = transformed_data.body
-                obj.created_at = transformed_data.created_at
-                obj.updated_at = transformed_data.updated_at
-                bulk_update.append(obj)
+            if notification_delivery == User.NotificationDelivery.DIGEST:
+                digest_notifications.append((user_id, issue["number"]))
             else:
-                bulk_create.append(Comments(**transformed_data.dict()))
+                messages.append(_notification_message(owner_name, repository_name, issue, user_email))
+
+    if digest_notifications:
+        issue_ids = dict(
+            Issue.objects.filter(
+                repository__owner_name=owner_name,
+                repository__name=repository_name,
+                number__in={issue_number for _, issue_number in digest_notifications},
+            ).values_list("number", "id")
+        )
+        # An issue already waiting for the digest of a user is not added twice
+        PendingNotification.objects.bulk_create(
+            [
+                PendingNotification(user_id=user_id, issue_id=issue_ids[issue_number])
+                for user_id, issue_number in digest_notifications
+                if issue_number in issue_ids
+            ],
+            ignore_conflicts=True,
+        )
 
-    bulk_create_with_history(bulk_create, Comments, batch_size=1000)
-    bulk_update_with_history(bulk_update, Comments, ["body", "created_at", "updated_at"], batch_size=1000)
+    # All the messages are sent over a single connection
+    send_mass_mail(messages)
     return None
 
 
-@app.task
-def issue_adapter_task(
-    owner_name: str, repository_name: str, following_date: datetime.datetime, user_email: str
+@app.task(name="gissues.extensions.github_client.tasks.send_notification_digests")
+def send_notification_digests() -> None:
+    """Send every user the issues collected for their digest since the previous one, in a single email."""
+    pending_notifications = PendingNotification.objects.select_related("user", "issue__repository").order_by(
+        "user_id", "issue__repository_id", "issue__number"
+    )
+
+    notification_ids: list[int] = []
+    messages: list[tuple[str, str, str, list[str]]] = []
+    for user, notifications in groupby(pending_notifications.iterator(chunk_size=2000), key=attrgetter("user")):
+        user_notifications = list(notifications)
+        notification_ids.extend(notification.id for notification in user_notifications)
+        messages.append(_digest_message(user.email, [notification.issue for notification in user_notifications]))
+
+    # All the digests are sent over a single connection, then only the notifications they contain are
+    # removed, the ones collected in the meantime wait for the next digest.
+    send_mass_mail(messages)
+    PendingNotification.objects.filter(id__in=notification_ids).delete()
+    return None
+
+
+def _apply_changes(
+    obj: Issue | Comments, transformed_data: IssueDataclass | CommentsDataclass, fields: list[str]
+) -> bool:
+    """Set the synced values on a stored object, unless none of them is a real change.
+
+    A new `updated_at` alone isn't a real change, GitHub also moves it for changes that aren't synced,
+    such as labels and reactions. It is still set, so the object can be stored without recording its history,
+    see `_upsert_with_history`. The values are converted by their model fields before they are compared,
+    so the formatting of the GitHub timestamps doesn't matter either.
+
+    Args:
+        obj (Issue | Comments): The stored object.
+        transformed_data (IssueDataclass | CommentsDataclass): The transformed GitHub data of the object.
+        fields (list[str]): The synced fields.
+
+    Returns:
+        bool: Whether the object has changed and must be updated.
+    """
+    # The synced fields are all concrete fields, not relations
+    model_fields = {field: cast("Field[Any, Any]", obj._meta.get_field(field)) for field in fields}
+    values = {field: model_fields[field].to_python(getattr(transformed_data, field)) for field in fields}
+    if all(getattr(obj, field) == value for field, value in values.items() if field != "updated_at"):
+        obj.updated_at = values["updated_at"]
+        return False
+
+    for field, value in values.items():
+        setattr(obj, field, value)
+    return True
+
+
+def _upsert_with_history(
+    model: type[SyncedModel],
+    created: list[SyncedModel],
+    updated: list[SyncedModel],
+    unique_fields: list[str],
+    update_fields: list[str],
+    touched: Iterable[SyncedModel] = (),
+) -> list[SyncedModel]:
+    """Insert or update objects with a single statement per batch, then record their history.
+
+    A row inserted by a concurrent sync since the objects were looked up is updated instead of
+    violating its unique constraint, its history is then recorded as created. The objects whose
+    `updated_at` alone has changed are only updated, without a history record, so the next syncs
+    don't compare them again.
+
+    Args:
+        model (type[SyncedModel]): The model of the objects, `Issue` or `Comments`.
+        created (list[SyncedModel]): The objects that didn't exist when they were looked up.
+        updated (list[SyncedModel]): The objects that existed, with their new values.
+        unique_fields (list[str]): The fields of the unique constraint the objects conflict on.
+        update_fields (list[str]): The fields updated on a conflict.
+        touched (Iterable[SyncedModel]): The stored objects with a new `updated_at` only. Defaults to ().
+
+    Returns:
+        list[SyncedModel]: The inserted and updated objects, with their primary keys.
+    """
+    touched_objs = list(touched)
+    if not created and not updated and not touched_objs:
+        return []
+
+    # The rows and their history are written together, or a failed sync would leave rows without history
+    with transaction.atomic():
+        objs = model.objects.bulk_create(
+            created + updated,
+            batch_size=1000,
+            update_conflicts=True,
+            unique_fields=unique_fields,
+            update_fields=update_fields,
+        )
+        model.history.bulk_history_create(created, batch_size=1000, default_change_reason=None)
+        model.history.bulk_history_create(updated, batch_size=1000, update=True, default_change_reason=None)
+        model.objects.bulk_update(touched_objs, ["updated_at"], batch_size=1000)
+    return objs
+
+
+def _store_comment_page(
+    owner: str, repository_name: str, issue_comments: Iterable[tuple[Issue, list[dict[str, Any]]]]
+) -> int:
+    """Store a page of GitHub comments, which may belong to several issues of a repository.
+
+    Only the new comments and the ones with a real change are written, see `_apply_changes`.
+
+    Args:
+        owner (str): The repository owner_name.
+        repository_name (str): The repository name.
+        issue_comments (Iterable[tuple[Issue, list[dict[str, Any]]]]): The issues and their GitHub comments.
+
+    Returns:
+        int: The number of unchanged comments that were skipped.
+
+    """
+    issue_comments = list(issue_comments)
+
+    comments_mapping_with_id = Comments.objects.filter(
+        comment_id__in=[comment["id"] for _, comments in issue_comments for comment in comments]
+    ).in_bulk(field_name="comment_id")
+
+    created, updated, touched, changed_issue_numbers, skipped = [], [], [], set(), 0
+    for issue, comments in issue_comments:
+        for transformed_data in bulk_transform_comments(comments, issue):
+            if obj := comments_mapping_with_id.get(transformed_data.comment_id):
+                updated_at = obj.updated_at
+                if not _apply_changes(obj, transformed_data, COMMENT_SYNCED_FIELDS):
+                    skipped += 1
+                    if obj.updated_at != updated_at:
+                        touched.append(obj)
+                        changed_issue_numbers.add(issue.number)
+                    continue
+                updated.append(Comments(**transformed_data.dict()))
+            else:
+                created.append(Comments(**transformed_data.dict()))
+
+            changed_issue_numbers.add(issue.number)
+
+    _upsert_with_history(Comments, created, updated, ["comment_id"], COMMENT_SYNCED_FIELDS, touched)
+    response_cache.invalidate(*(issue_scope(owner, repository_name, number) for number in changed_issue_numbers))
+
+    if skipped:
+        logger.info(f"Skipped {skipped} unchanged comments from {owner}/{repository_name}")
+    return skipped
+
+
+def _format_since(value: datetime.datetime) -> str:
+    return value.isoformat().replace("+00:00", "Z")
+
+
+def _get_comments_since(issues: list[Issue]) -> dict[int, dict[str, Any]]:
+    """Get the `since` parameter of the comment requests of issues, from their latest stored comment.
+
+    GitHub lists the comments oldest first, so a conditional request of the first page can't tell whether
+    a later page changed. Only the comments updated since the latest stored one are requested instead,
+    which usually fit in a single page. The latest one is requested again and skipped as unchanged.
+
+    Args:
+        issues (list[Issue]): The issues whose comments are synced.
+
+    Returns:
+        dict[int, dict[str, Any]]: The request parameters by issue number, empty for the issues without comments.
+
+    """
+    synced_at = dict(
+        Comments.objects.filter(issue__in=issues)
+        .values("issue")
+        .annotate(synced_at=Max("updated_at"))
+        .values_list("issue", "synced_at")
+    )
+    return {
+        issue.number: {"since": _format_since(synced_at[issue.pk])} if issue.pk in synced_at else {} for issue in issues
+    }
+
+
+def _store_comments(
+    owner: str, repository_name: str, issue: Issue, comment_responses: Iterable[GitHubResponse], lease: Lease
 ) -> None:
-    issue_response = github_client.issues.list(owner_name, repository_name)
+    """Store the comment pages of an issue, stopping at the first failed page.
+
+    Args:
+        owner (str): The repository owner_name.
+        repository_name (str): The repository name.
+        issue (Issue): The issue the comments belong to.
+        comment_responses (Iterable[GitHubResponse]): The comment pages of the issue.
+        lease (Lease): The lease on the issue, extended after every page.
 
-    if not issue_response.is_ok:
-        logger.error(f"Failed to fetch issues from {owner_name}/{repository_name}")
+    """
+    for comment_response in comment_responses:
+        if not comment_response.is_ok:
+            logger.error(f"Failed to fetch comments for issue {issue.number} from {owner}/{repository_name}")
+            return None
+
+        _store_comment_page(owner, repository_name, [(issue, comment_response.content)])
+
+        if not lease.extend():
+            logger.warning(f"Lost the lease on the comments for issue {issue.number} from {owner}/{repository_name}")
+            return None
+    return None
+
+
+def _get_comment_sync_scopes(owner: str, repository_name: str, issue_number: int | str) -> list[Scope]:
+    return [issue_scope(owner, repository_name, issue_number)]
+
+
+@app.task(base=GitHubTask, get_queued_scopes=staticmethod(_get_comment_sync_scopes))
+def comment_adapter_task(owner: str, repository_name: str, issue_number: int | str) -> None:
+    issue = Issue.objects.filter(
+        number=issue_number, repository__owner_name=owner, repository__name=repository_name
+    ).first()
+
+    if issue is None:
+        logger.error(f"Issue {issue_number} from {owner}/{repository_name} does not exist")
         return None
 
-    issues = issue_response.content
+    lease = Lease(issue_scope(owner, repository_name, issue_number))
+    with lease as is_acquired:
+        if not is_acquired:
+            logger.info(f"Comments for issue {issue_number} from {owner}/{repository_name} are already being synced")
+            return None
 
-    issues_mapping_with_number = Issue.objects.filter(
-        repository__owner_name=owner_name, repository__name=repository_name
-    ).in_bulk(field_name="number")
-
-    bulk_create, bulk_update = [], []
-    for issue in issues:
-        old_issue = issues_mapping_with_number.get(issue["number"])
-
-        if old_issue or old_issue.updated_at.isoformat().replace("+00:00", "Z") != issue["updated_at"]:
-            transformed_data = transform_issue(issue, repository_name, owner_name)
-
-            if old_issue:
-                obj = issues_mapping_with_number[transformed_data.number]
-                obj.title = transformed_data.title
-                obj.body = transformed_data.body
-                obj.is_closed = transformed_data.is_closed
-                obj.closed_at = transformed_data.closed_at
-                obj.state_reason = transformed_data.state_reason
-                obj.is_locked = transformed_data.is_locked
-                obj.lock_reason = transformed_data.lock_reason
-                obj.comment_count = transformed_data.comment_count
-                obj.created_at = transformed_data.created_at
-                obj.updated_at = transformed_data.updated_at
-                bulk_update.append(obj)
+        params = _get_comments_since([issue])[issue.number]
+        comment_responses = github_client.comments.paginate(owner, repository_name, issue_number, **params)
+        _store_comments(owner, repository_name, issue, comment_responses, lease)
+    return None
+
+
+def _get_bulk_comment_sync_scopes(owner: str, repository_name: str, issue_numbers: list[int]) -> list[Scope]:
+    return [issue_scope(owner, repository_name, issue_number) for issue_number in issue_numbers]
+
+
+@app.task(base=GitHubTask, get_queued_scopes=staticmethod(_get_bulk_comment_sync_scopes))
+def bulk_comment_adapter_task(owner: str, repository_name: str, issue_numbers: list[int]) -> None:
+    """Sync the comments of many issues of a repository, fetching them concurrently.
+
+    Args:
+        owner (str): The repository owner_name.
+        repository_name (str): The repository name.
+        issue_numbers (list[int]): The numbers of the issues.
+
+    """
+    issues = list(
+        Issue.objects.filter(repository__owner_name=owner, repository__name=repository_name, number__in=issue_numbers)
+    )
+
+    if len(issues) != len(set(issue_numbers)):
+        missing_numbers = set(issue_numbers) - {issue.number for issue in issues}
+        logger.error(f"Issues {sorted(missing_numbers)} from {owner}/{repository_name} do not exist")
+
+    # The issues whose comments are already being synced by another task are left to it
+    leases = {issue.number: Lease(issue_scope(owner, repository_name, issue.number)) for issue in issues}
+    issues = [issue for issue in issues if leases[issue.number].acquire()]
+    if len(issues) != len(leases):
+        synced_numbers = set(leases) - {issue.number for issue in issues}
+        logger.info(
+            f"Comments for issues {sorted(synced_numbers)} from {owner}/{repository_name} are already being synced"
+        )
+
+    async def fetch_comments(issue: Issue, params: dict[str, Any]) -> list[GitHubResponse]:
+        return [
+            comment_response
+            async for comment_response in async_github_client.comments.paginate(
+                owner, repository_name, issue.number, **params
+            )
+        ]
+
+    async def fetch_all_comments(params: dict[int, dict[str, Any]]) -> list[list[GitHubResponse]]:
+        return await asyncio.gather(*(fetch_comments(issue, params[issue.number]) for issue in issues))
+
+    try:
+        params = _get_comments_since(issues)
+        # Only the requests are concurrent, the comments are stored one issue after another
+        for issue, comment_responses in zip(issues, async_github_client.run(fetch_all_comments(params))):
+            _store_comments(owner, repository_name, issue, comment_responses, leases[issue.number])
+    finally:
+        for lease in leases.values():
+            lease.release()
+    return None
+
+
+def _get_next_sync(repository: Repository, has_changes: bool) -> dict[str, Any]:
+    """Get the sync interval and the next sync time of a repository, after a sync.
+
+    The interval shrinks after a sync that found changes and grows after one that didn't,
+    so busy repositories are polled more often than quiet ones, within the configured bounds.
+
+    Args:
+        repository (Repository): The synced repository.
+        has_changes (bool): Whether the sync created or updated any issues.
+
+    Returns:
+        dict[str, Any]: The `sync_interval` and `next_sync_at` of the repository.
+    """
+    interval = repository.sync_interval or datetime.timedelta(minutes=settings.ISSUE_SYNC_INITIAL_INTERVAL_IN_MINUTES)
+    if has_changes:
+        interval /= settings.ISSUE_SYNC_SPEEDUP_FACTOR
+    else:
+        interval *= settings.ISSUE_SYNC_BACKOFF_FACTOR
+
+    interval = min(
+        max(interval, datetime.timedelta(minutes=settings.ISSUE_SYNC_MIN_INTERVAL_IN_MINUTES)),
+        datetime.timedelta(minutes=settings.ISSUE_SYNC_MAX_INTERVAL_IN_MINUTES),
+    )
+    return {"sync_interval": interval, "next_sync_at": timezone.now() + interval}
+
+
+def _get_issue_sync_scopes(owner_name: str, repository_name: str, full_resync: bool = False) -> list[Scope]:
+    return [repository_scope(owner_name, repository_name)]
+
+
+@app.task(base=GitHubTask, get_queued_scopes=staticmethod(_get_issue_sync_scopes))
+def issue_adapter_task(owner_name: str, repository_name: str, full_resync: bool = False) -> None:
+    lease = Lease(repository_scope(owner_name, repository_name))
+    with lease as is_acquired:
+        if not is_acquired:
+            logger.info(f"Issues from {owner_name}/{repository_name} are already being synced")
+            return None
+
+        return _sync_issues(owner_name, repository_name, full_resync, lease)
+
+
+def _sync_issues(owner_name: str, repository_name: str, full_resync: bool, lease: Lease) -> None:
+    repository = Repository.objects.filter(owner_name=owner_name, name=repository_name).first()
+
+    if repository is None:
+        logger.error(f"Repository {owner_name}/{repository_name} does not exist")
+        return None
+
+    # The most recently updated issues come first, so an issue that is updated while the pages
+    # are being fetched can only be seen twice, not skipped. The requests aren't conditional, the cursor
+    # only moves once every page is synced, so a run that failed midway is retried from the same point.
+    params: dict[str, Any] = {"sort": "updated", "direction": "desc"}
+    if repository.issues_synced_at and not full_resync:
+        params["since"] = _format_since(repository.issues_synced_at)
+
+    # GraphQL pages carry the comments of their issues, so no further requests are needed for them
+    use_graphql = settings.GITHUB_CLIENT_SYNC_MODE == "graphql"
+    if use_graphql:
+        issue_responses = github_client.graphql.paginate_issues(owner_name, repository_name, since=params.get("since"))
+    else:
+        issue_responses = github_client.issues.paginate(owner_name, repository_name, **params)
+
+    issues_synced_at, changed_issues, skipped_issues = repository.issues_synced_at, [], 0
+    for issue_response in issue_responses:
+        if not issue_response.is_ok:
+            logger.error(f"Failed to fetch issues from {owner_name}/{repository_name}")
+            break
+
+        issues = issue_response.content
+
+        # Issue numbers are only unique per repository, so `in_bulk` can't be used here
+        issues_mapping_with_number = {
+            obj.number: obj
+            for obj in Issue.objects.filter(repository=repository, number__in=[issue["number"] for issue in issues])
+        }
+
+        changed_issues_page = []
+        for issue in issues:
+            issue_updated_at = datetime.datetime.fromisoformat(issue["updated_at"])
+
+            if issues_synced_at is None or issue_updated_at > issues_synced_at:
+                issues_synced_at = issue_updated_at
+
+            old_issue = issues_mapping_with_number.get(issue["number"])
+            if old_issue is None or old_issue.updated_at != issue_updated_at:
+                changed_issues_page.append(issue)
             else:
-                bulk_create.append(Issue(**transformed_data.dict()))
+                skipped_issues += 1
 
+        created, updated, touched, commented_issue_numbers = [], [], [], []
+        for transformed_data in bulk_transform_issues(changed_issues_page, repository):
+            # The comments of an issue may have changed even when the issue itself hasn't
             if transformed_data.comment_count > 0:
-                comment_adapter_task.apply_async(
-                    args=(owner_name, repository_name, issue["number"]),
-                )
+                commented_issue_numbers.append(transformed_data.number)
 
-            # Don't send email if the issue was created before the following date
-            converted_created_at = datetime.datetime.strptime(
-                transformed_data.created_at, "%Y-%m-%dT%H:%M:%SZ"
-            ).replace(tzinfo=datetime.timezone.utc)
-            converted_updated_at = datetime.datetime.strptime(
-                transformed_data.updated_at, "%Y-%m-%dT%H:%M:%SZ"
-            ).replace(tzinfo=datetime.timezone.utc)
-            if converted_created_at > following_date or converted_updated_at > following_date:
-                send_email.apply_async(
-                    args=(
-                        f"New Issue Notification on {owner_name}/{repository_name}",
-                        "Hello,\n\n"
-                        "A new issue has been created or updated in one of the repositories you're following.\n"
-                        "Please check it out for more details.\n\n"
-                        f"Repository: {owner_name}/{repository_name}\n"
-                        f"Title: {transformed_data.title}\n"
-                        f"Issue Number: {transformed_data.number}\n\n"
-                        "Best regards,\n"
-                        "Github Issues Tracker Team",
-                        user_email,
-                    ),
+            if obj := issues_mapping_with_number.get(transformed_data.number):
+                # Only the issues with a new `updated_at` are on the page, so it has always changed
+                if not _apply_changes(obj, transformed_data, ISSUE_SYNCED_FIELDS):
+                    skipped_issues += 1
+                    touched.append(obj)
+                    continue
+                updated.append(Issue(**transformed_data.dict()))
+            else:
+                created.append(Issue(**transformed_data.dict()))
+
+            changed_issues.append(
+                {
+                    "number": transformed_data.number,
+                    "title": transformed_data.title,
+                    "created_at": transformed_data.created_at,
+                    "updated_at": transformed_data.updated_at,
+                }
+            )
+
+        # Every changed issue of the page is written at once, so concurrent syncs of a repository don't conflict
+        stored_issues = _upsert_with_history(
+            Issue, created, updated, ["repository", "number"], ISSUE_SYNCED_FIELDS, touched
+        )
+
+        if stored_issues or touched:
+            response_cache.invalidate(repository_scope(owner_name, repository_name))
+
+        # Comments are synced once their issues are stored, over REST one task fetches them for the whole page
+        if use_graphql:
+            issues_with_number = {**issues_mapping_with_number, **{obj.number: obj for obj in stored_issues}}
+            _store_comment_page(
+                owner_name,
+                repository_name,
+                [
+                    (issues_with_number[issue["number"]], issue["comment_list"])
+                    for issue in changed_issues_page
+                    if issue["number"] in commented_issue_numbers
+                ],
+            )
+        elif commented_issue_numbers:
+            # The issues whose comments are still waiting in the queue are left to the queued task,
+            # it requests the comments updated since the latest stored one when it runs
+            queued_issue_numbers = [
+                number
+                for number in commented_issue_numbers
+                if mark_queued(issue_scope(owner_name, repository_name, number))
+            ]
+            if queued_issue_numbers:
+                bulk_comment_adapter_task.apply_async(
+                    args=(owner_name, repository_name, queued_issue_numbers),
                 )
 
-    bulk_create_with_history(bulk_create, Issue, batch_size=1000)
-    bulk_update_with_history(
-        bulk_update,
-        Issue,
-        [
-            "title",
-            "body",
-            "is_closed",
-            "closed_at",
-            "state_reason",
-            "is_locked",
-            "lock_reason",
-            "comment_count",
-            "created_at",
-            "updated_at",
-        ],
-        batch_size=1000,
-    )
+        # A full resync can take longer than the lease timeout, another run may only start once it has expired
+        if not lease.extend():
+            logger.warning(f"Lost the lease on the issues from {owner_name}/{repository_name}")
+            break
+    else:
+        # The cursor is moved only after every page is synced, so a failed run is retried from the same point,
+        # and as the next sync isn't scheduled either, at the next tick of `check_for_new_issues`.
+        Repository.objects.filter(pk=repository.pk).update(
+            issues_synced_at=issues_synced_at, **_get_next_sync(repository, has_changes=bool(changed_issues))
+        )
+
+    if skipped_issues:
+        logger.info(f"Skipped {skipped_issues} unchanged issues from {owner_name}/{repository_name}")
+
+    if changed_issues:
+        notify_followers_task.apply_async(args=(owner_name, repository_name, changed_issues))
     return None
 
 
 @app.task(name="gissues.extensions.github_client.tasks.check_for_new_issues")
 def check_for_new_issues() -> None:
-    repositories = (
-        Repository.objects.filter(
-            followers__isnull=False,
-        )
-        .prefetch_related("followers", "followers__user")
-        .values_list("owner_name", "name", "followers__created_at", "followers__user__email")
+    """Queue the syncs of the followed repositories that are due before the next tick.
+
+    The syncs due during the tick are delayed until their due time. The overdue ones, and the ones of
+    the repositories that were never synced, are spread evenly over the tick so they don't all start at once.
+    """
+    now = timezone.now()
+    tick = datetime.timedelta(minutes=settings.ISSUE_SYNC_SCHEDULER_TICK_IN_MINUTES)
+
+    # A repository is synced once, however many followers it has
+    repositories = list(
+        Repository.objects.filter(followers__isnull=False)
+        .filter(Q(next_sync_at__isnull=True) | Q(next_sync_at__lt=now + tick))
+        .distinct()
+        .order_by(F("next_sync_at").asc(nulls_first=True), "pk")
+        .values_list("owner_name", "name", "next_sync_at")
     )
+    overdue_count = sum(1 for *_, next_sync_at in repositories if next_sync_at is None or next_sync_at <= now)
+
+    # The overdue repositories come first
+    for index, (owner_name, repository_name, next_sync_at) in enumerate(repositories):
+        # The repositories that were never synced are always overdue
+        if index < overdue_count or next_sync_at is None:
+            countdown = tick.total_seconds() * index / overdue_count
+        else:
+            countdown = (next_sync_at - now).total_seconds()
+
+        # A repository whose sync is still queued, running or waiting to be retried isn't queued again,
+        # so a backlog can't snowball
+        if not mark_queued(repository_scope(owner_name, repository_name)):
+            logger.info(f"Issues from {owner_name}/{repository_name} are already queued for sync")
+            continue
 
-    for owner_name, repository_name, following_date, user_email in repositories:
         issue_adapter_task.apply_async(
-            args=(owner_name, repository_name, following_date, user_email),
+            args=(owner_name, repository_name),
+            countdown=countdown,
         )
 
     return None
@@ -1,7 +1,12 @@
+from rest_framework import permissions
+from rest_framework.decorators import action
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
 
+from gissues.extensions.github_client.cache import response_cache
+from gissues.extensions.github_client.client import github_client
+
 
 class MetaViewSet(GenericViewSet):
     def list(self, request: Request, *args, **kwargs) -> Response:
@@ -10,3 +15,15 @@ class MetaViewSet(GenericViewSet):
             "version": "0.1.0",
         }
         return Response(meta)
+
+    @action(detail=False, methods=["GET"], permission_classes=[permissions.IsAdminUser])
+    def metrics(self, request: Request) -> Response:
+        """This action exposes the runtime metrics of the current process."""
+        metrics = {
+            "github_client": {
+                "connection_pool": github_client.pool_stats(),
+                "rate_limit": github_client.rate_limit.status(),
+            },
+            "response_cache": response_cache.stats(),
+        }
+        return Response(metrics)
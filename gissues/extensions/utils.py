@@ -1,13 +1,16 @@
-from typing import Any, Optional, cast
+from typing import Any, Optional, Sequence, cast
 
 from django import urls
+from django.db.models import QuerySet
 from django.urls import URLPattern, URLResolver
 
-from rest_framework.pagination import CursorPagination, LimitOffsetPagination, PageNumberPagination
+from rest_framework import exceptions
+from rest_framework.pagination import BasePagination, CursorPagination, LimitOffsetPagination, PageNumberPagination
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.reverse import reverse
 from rest_framework.routers import APIRootView as BaseAPIRootView
+from rest_framework.settings import api_settings
 
 
 def pagination_factory(
@@ -42,11 +45,102 @@ def pagination_factory(
     """
     base = base or PageNumberPagination
     kwargs.setdefault("page_size_query_param", "page_size")
-    kwargs.setdefault("max_page_size", 99_999)
+    # Large enough for any client, small enough that a single page can't exhaust the memory of a worker
+    kwargs.setdefault("max_page_size", 100)
     kwargs.setdefault("page_query_param", "page")
     return type("FactoryPagination", (base,), kwargs)
 
 
+class SwitchablePagination(BasePagination):
+    """A pagination that lets the client choose the pagination style of each request.
+
+    The style is chosen with the `pagination` query parameter (e.g. ?pagination=cursor), requests without
+    it use the default style. Cursor pagination doesn't count the rows nor skip over the previous pages,
+    so deep pages are as fast as the first one. It always follows the default ordering of the view,
+    so it's rejected with the `ordering` query parameter, which could order by any non-unique field.
+    """
+
+    pagination_query_param = "pagination"
+    pagination_classes: dict[str, type[BasePagination]] = {}
+    default_pagination = "page"
+
+    def __init__(self) -> None:
+        self.paginator = self.pagination_classes[self.default_pagination]()
+
+    def paginate_queryset(self, queryset: QuerySet[Any], request: Request, view: Any = None) -> Optional[list[Any]]:
+        pagination = request.query_params.get(self.pagination_query_param, self.default_pagination)
+        if pagination not in self.pagination_classes:
+            raise exceptions.ValidationError(
+                {self.pagination_query_param: [f"Must be one of: {', '.join(self.pagination_classes)}."]}
+            )
+
+        if pagination == "cursor" and api_settings.ORDERING_PARAM in request.query_params:
+            raise exceptions.ValidationError(
+                {api_settings.ORDERING_PARAM: ["Can't be combined with the cursor pagination."]}
+            )
+
+        self.paginator = self.pagination_classes[pagination]()
+        return self.paginator.paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data: Any) -> Response:
+        return self.paginator.get_paginated_response(data)
+
+    def get_paginated_response_schema(self, schema: dict[str, Any]) -> dict[str, Any]:
+        return self.paginator.get_paginated_response_schema(schema)
+
+    def get_schema_operation_parameters(self, view: Any) -> list[dict[str, Any]]:
+        parameters: dict[str, dict[str, Any]] = {
+            self.pagination_query_param: {
+                "name": self.pagination_query_param,
+                "required": False,
+                "in": "query",
+                "description": (
+                    f"The pagination style, one of: {', '.join(self.pagination_classes)}. "
+                    "The cursor pagination can't be combined with an ordering."
+                ),
+                "schema": {"type": "string", "enum": list(self.pagination_classes)},
+            }
+        }
+        for pagination_class in self.pagination_classes.values():
+            for parameter in pagination_class().get_schema_operation_parameters(view):
+                parameters.setdefault(parameter["name"], parameter)
+
+        return list(parameters.values())
+
+
+def switchable_pagination_factory(paginations: Sequence[str] = ("page", "cursor"), **kwargs: Any) -> type:
+    """Creates a pagination class that lets the client choose between page number and cursor pagination.
+
+    The cursor pagination follows the `ordering` of the view, which should end with a unique field
+    and be backed by an index.
+
+    Args:
+        paginations (Sequence[str]): The pagination styles to offer, the first one is the default.
+            Defaults to ("page", "cursor").
+        **kwargs: The attributes to add to each pagination class, see `pagination_factory`.
+
+    Returns:
+        type: The pagination class.
+
+    Usage:
+    >>> from gissues.extensions.utils import switchable_pagination_factory
+    >>> class MyView(generics.ListAPIView):
+    ...     pagination_class = switchable_pagination_factory(page_size=10)
+    """
+    bases: dict[str, type[PageNumberPagination] | type[CursorPagination]] = {
+        "page": PageNumberPagination,
+        "cursor": CursorPagination,
+    }
+    pagination_classes = {
+        pagination: pagination_factory(base=bases[pagination], **kwargs) for pagination in paginations
+    }
+    return type(
+        "FactorySwitchablePagination",
+        (SwitchablePagination,),
+        {"pagination_classes": pagination_classes, "default_pagination": paginations[0]},
+    )
+
+
 class APIRootView(BaseAPIRootView):
     # Inspired by https://github.com/realsuayip/asu/blob/03ce9f4a6b8f4a0f153055c00d5689d14f6bdfe0/asu/views.py#L35
     def resolve_url(self, namespace: str, url: URLPattern) -> str | None:
@@ -10,6 +10,8 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/3.2/ref/settings/
 """
 
+import os
+import warnings
 from pathlib import Path
 
 from envanter import env
@@ -169,6 +171,17 @@ LOGGING = {
 
 GITHUB_CLIENT_URL = env.str("GITHUB_CLIENT_URL", "https://api.github.com").rstrip("/")
 GITHUB_CLIENT_AUTH_TOKEN = env.str("GITHUB_CLIENT_AUTH_TOKEN", "")
+GITHUB_CLIENT_POOL_CONNECTIONS = env.int("GITHUB_CLIENT_POOL_CONNECTIONS", 10)  # Number of hosts to keep pools for
+GITHUB_CLIENT_POOL_MAXSIZE = env.int("GITHUB_CLIENT_POOL_MAXSIZE", 10)  # Connections kept open per host
+GITHUB_CLIENT_POOL_BLOCK = env.bool("GITHUB_CLIENT_POOL_BLOCK", False)  # Wait for a free connection when pool is full
+GITHUB_CLIENT_KEEP_ALIVE = env.bool("GITHUB_CLIENT_KEEP_ALIVE", True)  # Enable TCP keep-alive on pooled connections
+GITHUB_CLIENT_VALIDATORS_CACHE_TIMEOUT = env.int("GITHUB_CLIENT_VALIDATORS_CACHE_TIMEOUT", 60 * 60 * 24 * 7)  # 1 week
+GITHUB_CLIENT_RATE_LIMIT_RESERVE = env.int("GITHUB_CLIENT_RATE_LIMIT_RESERVE", 100)  # Spent by the API views only
+GITHUB_CLIENT_ASYNC_CONCURRENCY = env.int("GITHUB_CLIENT_ASYNC_CONCURRENCY", 10)  # Requests in flight, up to pool size
+GITHUB_CLIENT_SYNC_MODE = env.str("GITHUB_CLIENT_SYNC_MODE", "rest")  # "rest" or "graphql", which needs a token
+GITHUB_CLIENT_SYNC_LEASE_TIMEOUT = env.int("GITHUB_CLIENT_SYNC_LEASE_TIMEOUT", 60 * 30)  # Extended after every page
+API_RESPONSE_CACHE_TIMEOUT = env.int("API_RESPONSE_CACHE_TIMEOUT", 60 * 60)  # 1 hour, syncs invalidate it sooner
+API_EXPORT_CHUNK_SIZE = env.int("API_EXPORT_CHUNK_SIZE", 2000)  # Rows fetched per query by the exports
 
 AUTH_USER_MODEL = "account.User"
 
@@ -235,7 +248,26 @@ SPECTACULAR_SETTINGS = {
     "SCHEMA_PATH_PREFIX": "/api",
 }
 
-CHECK_FOR_NEW_ISSUES_INTERVAL_IN_MINUTES = env.int("CHECK_FOR_NEW_ISSUES_INTERVAL_IN_MINUTES", 60)  # DEFAULT: 1 hour
+ISSUE_SYNC_INITIAL_INTERVAL_IN_MINUTES = env.int("ISSUE_SYNC_INITIAL_INTERVAL_IN_MINUTES", 60)  # DEFAULT: 1 hour
+ISSUE_SYNC_SCHEDULER_TICK_IN_MINUTES = env.int("ISSUE_SYNC_SCHEDULER_TICK_IN_MINUTES", 5)  # Due syncs queued this often
+ISSUE_SYNC_MIN_INTERVAL_IN_MINUTES = env.int("ISSUE_SYNC_MIN_INTERVAL_IN_MINUTES", 5)  # DEFAULT: 5 minutes
+ISSUE_SYNC_MAX_INTERVAL_IN_MINUTES = env.int("ISSUE_SYNC_MAX_INTERVAL_IN_MINUTES", 60 * 24)  # DEFAULT: 1 day
+ISSUE_SYNC_BACKOFF_FACTOR = env.float("ISSUE_SYNC_BACKOFF_FACTOR", 1.5)  # Interval growth after a sync without changes
+ISSUE_SYNC_SPEEDUP_FACTOR = env.float("ISSUE_SYNC_SPEEDUP_FACTOR", 2.0)  # Interval shrink after a sync with changes
+# Deprecated, every repository used to be checked at this interval, now it only sets the initial one
+if "CHECK_FOR_NEW_ISSUES_INTERVAL_IN_MINUTES" in os.environ:
+    warnings.warn(
+        "CHECK_FOR_NEW_ISSUES_INTERVAL_IN_MINUTES is deprecated, set ISSUE_SYNC_INITIAL_INTERVAL_IN_MINUTES instead.",
+        FutureWarning,
+    )
+    ISSUE_SYNC_INITIAL_INTERVAL_IN_MINUTES = env.int(
+        "ISSUE_SYNC_INITIAL_INTERVAL_IN_MINUTES", env.int("CHECK_FOR_NEW_ISSUES_INTERVAL_IN_MINUTES")
+    )
+NOTIFICATION_DIGEST_INTERVAL_IN_MINUTES = env.int("NOTIFICATION_DIGEST_INTERVAL_IN_MINUTES", 60 * 24)  # DEFAULT: 1 day
+HISTORY_COMPACTION_INTERVAL_IN_MINUTES = env.int("HISTORY_COMPACTION_INTERVAL_IN_MINUTES", 60 * 24)  # DEFAULT: 1 day
+HISTORY_RETENTION_DAYS = env.int("HISTORY_RETENTION_DAYS", 90)  # Older history is deleted, except the latest records
+HISTORY_COMPACTION_BATCH_SIZE = env.int("HISTORY_COMPACTION_BATCH_SIZE", 1000)  # Records deleted per transaction
+HISTORY_ARCHIVE_DIR = env.str("HISTORY_ARCHIVE_DIR", "")  # Archive the deleted history here, if set
 
 EMAIL_BACKEND = env.str("EMAIL_BACKEND", "django.core.mail.backends.console.EmailBackend")
 EMAIL_HOST = env.str("EMAIL_HOST", "localhost")
@@ -1,5 +1,7 @@
 from unittest.mock import Mock
 
+from django.core.cache import cache
+
 from rest_framework.test import APIClient
 
 import pytest
@@ -16,6 +18,13 @@ from gissues.tests.factories import (
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
 @pytest.fixture
 def mocked_github_client():
     mock_github_client = Mock(spec=GitHubClient)
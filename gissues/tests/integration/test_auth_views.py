@@ -31,3 +31,41 @@ def test_UserRepositoryFollowViewSet_list(api_client, user, repository_factory,
             "pushed_at": datetime.datetime.strftime(repository.pushed_at, "%Y-%m-%dT%H:%M:%S.%fZ"),
         }
     ]
+
+
+@pytest.mark.django_db
+def test_NotificationPreferenceView_retrieve(api_client, user):
+    api_client.force_authenticate(user=user)
+
+    response = api_client.get(reverse("api:notification-preferences"))
+
+    assert response.status_code == 200
+    assert response.data == {"notification_delivery": "immediate"}
+
+
+@pytest.mark.django_db
+def test_NotificationPreferenceView_update(api_client, user):
+    api_client.force_authenticate(user=user)
+
+    response = api_client.patch(reverse("api:notification-preferences"), {"notification_delivery": "digest"})
+
+    assert response.status_code == 200
+    assert response.data == {"notification_delivery": "digest"}
+    user.refresh_from_db()
+    assert user.notification_delivery == "digest"
+
+
+@pytest.mark.django_db
+def test_NotificationPreferenceView_update_with_invalid_delivery(api_client, user):
+    api_client.force_authenticate(user=user)
+
+    response = api_client.patch(reverse("api:notification-preferences"), {"notification_delivery": "weekly"})
+
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db
+def test_NotificationPreferenceView_unauthenticated(api_client):
+    response = api_client.get(reverse("api:notification-preferences"))
+
+    assert response.status_code == 403
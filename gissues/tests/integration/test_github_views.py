@@ -1,11 +1,28 @@
+import csv
 import datetime
+import io
+import json
+import time
 from unittest.mock import Mock, patch
 
+from django.contrib.postgres.search import SearchQuery
+from django.db import connection
+from django.utils.http import http_date
+
 from rest_framework.reverse import reverse
 
 import pytest
 
-from gissues.extensions.github_client.client import GitHubResponse
+from gissues.extensions.github.api.filters import SEARCH_CONFIG
+from gissues.extensions.github.models import Comments, Issue
+from gissues.extensions.github_client.cache import repository_scope, response_cache
+from gissues.extensions.github_client.client import GitHubResponse, github_client
+from gissues.extensions.github_client.tasks import comment_adapter_task, issue_adapter_task
+from gissues.tests.unit.test_github_client_tasks import github_comment, github_issue
+
+requires_postgresql = pytest.mark.skipif(
+    connection.vendor != "postgresql", reason="The full-text search is only available on PostgreSQL"
+)
 
 
 @pytest.mark.django_db
@@ -92,7 +109,7 @@ def test_repository_view_set_retrieve_with_non_existing_repository(mock_detail_c
         "pushed_at": "2021-05-25T10:00:00Z",
     }
 
-    mock_detail_client.assert_called_once_with(owner_name="gissues", repository_name="gissues")
+    mock_detail_client.assert_called_once_with(owner_name="gissues", repository_name="gissues", use_reserve=True)
 
 
 @pytest.mark.django_db
@@ -192,6 +209,75 @@ def test_issue_view_set_list(api_client, issue_factory):
     ]
 
 
+@pytest.mark.django_db
+def test_issue_view_set_list_with_cursor_pagination(api_client, issue_factory, django_assert_num_queries):
+    repository = issue_factory.create(number=1).repository
+    for number in range(2, 6):
+        issue_factory.create(number=number, repository=repository)
+    url = reverse(
+        "api:repository-issues-list",
+        kwargs={"repository_owner": repository.owner_name, "repository_name": repository.name},
+    )
+
+    numbers, next_url = [], f"{url}?pagination=cursor&page_size=2"
+    while next_url:
+        # Only the page, without counting the rows
+        with django_assert_num_queries(1):
+            response = api_client.get(next_url)
+
+        assert response.status_code == 200
+        assert "count" not in response.data
+        numbers.extend(issue["number"] for issue in response.data["results"])
+        next_url = response.data["next"]
+
+    assert numbers == sorted(repository.issues.values_list("number", flat=True))
+
+
+@pytest.mark.django_db
+def test_issue_view_set_list_with_cursor_pagination_rejects_ordering(api_client, repository):
+    url = reverse(
+        "api:repository-issues-list",
+        kwargs={"repository_owner": repository.owner_name, "repository_name": repository.name},
+    )
+
+    response = api_client.get(url, {"ordering": "title", "pagination": "cursor"})
+
+    assert response.status_code == 400
+    assert "ordering" in response.data
+
+
+@pytest.mark.django_db
+def test_issue_view_set_list_with_invalid_pagination(api_client, issue):
+    response = api_client.get(
+        reverse(
+            "api:repository-issues-list",
+            kwargs={"repository_owner": issue.repository.owner_name, "repository_name": issue.repository.name},
+        ),
+        {"pagination": "offset"},
+    )
+
+    assert response.status_code == 400
+    assert "pagination" in response.data
+
+
+@pytest.mark.django_db
+def test_issue_view_set_list_page_size_is_capped(api_client, issue_factory):
+    repository = issue_factory.create().repository
+    issue_factory.create_batch(100, repository=repository)
+
+    response = api_client.get(
+        reverse(
+            "api:repository-issues-list",
+            kwargs={"repository_owner": repository.owner_name, "repository_name": repository.name},
+        ),
+        {"page_size": 1000},
+    )
+
+    assert response.status_code == 200
+    assert response.data["count"] == 101
+    assert len(response.data["results"]) == 100
+
+
 @pytest.mark.django_db
 def test_issue_view_set_retrieve_with_already_existing_issue(api_client, issue_factory):
     issue = issue_factory.create()
@@ -270,7 +356,9 @@ def test_issue_view_set_retrieve_with_non_existing_issue(mock_detail_client, api
         "updated_at": "2021-05-25T10:00:00Z",
     }
 
-    mock_detail_client.assert_called_once_with(owner_name=repo.owner_name, repository_name=repo.name, issue_number="1")
+    mock_detail_client.assert_called_once_with(
+        owner_name=repo.owner_name, repository_name=repo.name, issue_number="1", use_reserve=True
+    )
 
 
 @pytest.mark.django_db
@@ -301,6 +389,31 @@ def test_comments_view_set_list(api_client, comments_factory):
     ]
 
 
+@pytest.mark.django_db
+def test_comments_view_set_list_with_cursor_pagination(api_client, issue, comments_factory):
+    created_at = datetime.datetime(2021, 5, 25, tzinfo=datetime.timezone.utc)
+    # Comments created at the same time are still paged through exactly once
+    comments = comments_factory.create_batch(5, issue=issue, created_at=created_at)
+    url = reverse(
+        "api:issue-comments-list",
+        kwargs={
+            "repository_owner": issue.repository.owner_name,
+            "repository_name": issue.repository.name,
+            "issue_number": issue.number,
+        },
+    )
+
+    comment_ids, next_url = [], f"{url}?pagination=cursor&page_size=2"
+    while next_url:
+        response = api_client.get(next_url)
+
+        assert response.status_code == 200
+        comment_ids.extend(comment["comment_id"] for comment in response.data["results"])
+        next_url = response.data["next"]
+
+    assert comment_ids == sorted(comment.comment_id for comment in comments)
+
+
 @pytest.mark.django_db
 def test_comments_view_set_retrieve_with_already_existing_comment(api_client, comments_factory):
     comment = comments_factory.create()
@@ -368,6 +481,7 @@ def test_comments_view_set_retrieve_with_non_existing_comment(mock_detail_client
         owner_name=issue.repository.owner_name,
         repository_name=issue.repository.name,
         comment_id="1",
+        use_reserve=True,
     )
 
 
@@ -395,13 +509,20 @@ def test_repository_view_set_history(api_client, repository_factory):
             "updated_at": datetime.datetime.strftime(repo.updated_at, "%Y-%m-%dT%H:%M:%S.%fZ"),
             "pushed_at": datetime.datetime.strftime(repo.pushed_at, "%Y-%m-%dT%H:%M:%S.%fZ"),
         },
-        "history": [
-            {
-                "history_id": repo.history.last().id,
-                "history_date": datetime.datetime.strftime(repo.history.last().history_date, "%Y-%m-%dT%H:%M:%S.%fZ"),
-                "changes": {"description": "This is a new repository."},
-            },
-        ],
+        "history": {
+            "count": 1,
+            "next": None,
+            "previous": None,
+            "results": [
+                {
+                    "history_id": repo.history.last().id,
+                    "history_date": datetime.datetime.strftime(
+                        repo.history.last().history_date, "%Y-%m-%dT%H:%M:%S.%fZ"
+                    ),
+                    "changes": {"description": "This is a new repository."},
+                },
+            ],
+        },
     }
 
 
@@ -439,13 +560,20 @@ def test_issue_view_set_history(api_client, issue_factory):
             "created_at": datetime.datetime.strftime(issue.created_at, "%Y-%m-%dT%H:%M:%S.%fZ"),
             "updated_at": datetime.datetime.strftime(issue.updated_at, "%Y-%m-%dT%H:%M:%S.%fZ"),
         },
-        "history": [
-            {
-                "history_id": issue.history.last().id,
-                "history_date": datetime.datetime.strftime(issue.history.last().history_date, "%Y-%m-%dT%H:%M:%S.%fZ"),
-                "changes": {"body": "This is a new issue."},
-            },
-        ],
+        "history": {
+            "count": 1,
+            "next": None,
+            "previous": None,
+            "results": [
+                {
+                    "history_id": issue.history.last().id,
+                    "history_date": datetime.datetime.strftime(
+                        issue.history.last().history_date, "%Y-%m-%dT%H:%M:%S.%fZ"
+                    ),
+                    "changes": {"body": "This is a new issue."},
+                },
+            ],
+        },
     }
 
 
@@ -477,13 +605,618 @@ def test_comments_view_set_history(api_client, comments_factory):
             "created_at": datetime.datetime.strftime(comment.created_at, "%Y-%m-%dT%H:%M:%S.%fZ"),
             "updated_at": datetime.datetime.strftime(comment.updated_at, "%Y-%m-%dT%H:%M:%S.%fZ"),
         },
-        "history": [
-            {
-                "history_id": comment.history.last().id,
-                "history_date": datetime.datetime.strftime(
-                    comment.history.last().history_date, "%Y-%m-%dT%H:%M:%S.%fZ"
-                ),
-                "changes": {"body": "This is a new comment."},
-            },
-        ],
+        "history": {
+            "count": 1,
+            "next": None,
+            "previous": None,
+            "results": [
+                {
+                    "history_id": comment.history.last().id,
+                    "history_date": datetime.datetime.strftime(
+                        comment.history.last().history_date, "%Y-%m-%dT%H:%M:%S.%fZ"
+                    ),
+                    "changes": {"body": "This is a new comment."},
+                },
+            ],
+        },
+    }
+
+
+@pytest.mark.django_db
+def test_issue_view_set_list_is_cached_until_synced(api_client, issue, django_assert_num_queries):
+    repository = issue.repository
+    url = reverse(
+        "api:repository-issues-list",
+        kwargs={"repository_owner": repository.owner_name, "repository_name": repository.name},
+    )
+    first_response = api_client.get(url)
+
+    with django_assert_num_queries(0):
+        cached_response = api_client.get(url)
+
+    assert cached_response.status_code == 200
+    assert cached_response.data == first_response.data
+    # Another query string is another response
+    assert api_client.get(url, {"page_size": 5}).data == first_response.data
+    assert response_cache.stats() == {"hits": 1, "misses": 2}
+
+    with (
+        patch("gissues.extensions.github_client.tasks.github_client") as mock_github_client,
+        patch("gissues.extensions.github_client.tasks.notify_followers_task"),
+    ):
+        mock_github_client.issues.paginate.return_value = iter(
+            [GitHubResponse(200, [github_issue(issue.number + 1)], True)]
+        )
+        issue_adapter_task(repository.owner_name, repository.name)
+
+    response = api_client.get(url)
+
+    assert response.data["count"] == 2
+
+
+@pytest.mark.django_db
+def test_comments_view_set_list_is_invalidated_by_comment_sync(api_client, issue, comments_factory):
+    comments_factory.create(issue=issue)
+    repository = issue.repository
+    url = reverse(
+        "api:issue-comments-list",
+        kwargs={
+            "repository_owner": repository.owner_name,
+            "repository_name": repository.name,
+            "issue_number": issue.number,
+        },
+    )
+    assert api_client.get(url).data["count"] == 1
+
+    with patch("gissues.extensions.github_client.tasks.github_client") as mock_github_client:
+        mock_github_client.comments.paginate.return_value = iter([GitHubResponse(200, [github_comment(10_000)], True)])
+        comment_adapter_task(repository.owner_name, repository.name, issue.number)
+
+    assert api_client.get(url).data["count"] == 2
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "validator_header, request_header", [("ETag", "HTTP_IF_NONE_MATCH"), ("Last-Modified", "HTTP_IF_MODIFIED_SINCE")]
+)
+def test_issue_view_set_list_conditional_get(
+    api_client, issue, django_assert_num_queries, validator_header, request_header
+):
+    repository = issue.repository
+    url = reverse(
+        "api:repository-issues-list",
+        kwargs={"repository_owner": repository.owner_name, "repository_name": repository.name},
+    )
+    # The second of the version is over, so the response can be validated by its last modification time too
+    with patch("gissues.extensions.github_client.api.views.time.time", return_value=time.time() + 1):
+        response = api_client.get(url)
+
+        assert response.status_code == 200
+        assert response.headers["ETag"]
+        assert response.headers["Last-Modified"]
+
+        with django_assert_num_queries(0):
+            not_modified_response = api_client.get(url, **{request_header: response.headers[validator_header]})
+
+    assert not_modified_response.status_code == 304
+    assert not_modified_response.content == b""
+    assert not_modified_response.headers["ETag"] == response.headers["ETag"]
+
+    # The last modification time has a one second precision
+    with patch("gissues.extensions.github_client.cache.time.time_ns", return_value=time.time_ns() + 1_000_000_000):
+        response_cache.invalidate(repository_scope(repository.owner_name, repository.name))
+
+    modified_response = api_client.get(url, **{request_header: response.headers[validator_header]})
+
+    assert modified_response.status_code == 200
+    assert modified_response.headers["ETag"] != response.headers["ETag"]
+
+
+@pytest.mark.django_db
+def test_issue_view_set_list_last_modified_with_invalidation_in_the_same_second(api_client, repository):
+    scope = repository_scope(repository.owner_name, repository.name)
+    url = reverse(
+        "api:repository-issues-list",
+        kwargs={"repository_owner": repository.owner_name, "repository_name": repository.name},
+    )
+    second = 1_700_000_000
+
+    def at(seconds):
+        return patch.multiple(time, time=Mock(return_value=seconds), time_ns=Mock(return_value=int(seconds * 1e9)))
+
+    with at(second + 0.2):
+        response_cache.invalidate(scope)
+    with at(second + 0.5):
+        response = api_client.get(url)
+
+    # Another invalidation can still fall within the second of the version
+    assert "Last-Modified" not in response.headers
+
+    with at(second + 0.7):
+        response_cache.invalidate(scope)
+    with at(second + 0.8):
+        modified_response = api_client.get(url, HTTP_IF_MODIFIED_SINCE=http_date(second))
+
+    assert modified_response.status_code == 200
+
+    with at(second + 1.5):
+        response = api_client.get(url)
+        not_modified_response = api_client.get(url, HTTP_IF_MODIFIED_SINCE=response.headers["Last-Modified"])
+
+    assert response.headers["Last-Modified"] == http_date(second)
+    assert not_modified_response.status_code == 304
+
+
+@pytest.mark.django_db
+def test_comments_view_set_retrieve_etag_depends_on_the_url(api_client, comments_factory):
+    first_comment = comments_factory.create()
+    second_comment = comments_factory.create(issue=first_comment.issue)
+    issue = first_comment.issue
+    etags = [
+        api_client.get(
+            reverse(
+                "api:issue-comments-detail",
+                kwargs={
+                    "repository_owner": issue.repository.owner_name,
+                    "repository_name": issue.repository.name,
+                    "issue_number": issue.number,
+                    "comment_id": comment.comment_id,
+                },
+            )
+        ).headers["ETag"]
+        for comment in (first_comment, second_comment)
+    ]
+
+    assert etags[0] != etags[1]
+
+
+def github_view_urls(comment):
+    issue, repository = comment.issue, comment.issue.repository
+    repository_kwargs = {"repository_owner": repository.owner_name}
+    issue_kwargs = {**repository_kwargs, "repository_name": repository.name}
+    comment_kwargs = {**issue_kwargs, "issue_number": issue.number}
+    return {
+        "repository-list": reverse("api:repository-list", kwargs=repository_kwargs),
+        "repository-detail": reverse("api:repository-detail", kwargs={**repository_kwargs, "name": repository.name}),
+        "repository-history": reverse("api:repository-history", kwargs={**repository_kwargs, "name": repository.name}),
+        "repository-issues-list": reverse("api:repository-issues-list", kwargs=issue_kwargs),
+        "repository-issues-detail": reverse(
+            "api:repository-issues-detail", kwargs={**issue_kwargs, "number": issue.number}
+        ),
+        "repository-issues-history": reverse(
+            "api:repository-issues-history", kwargs={**issue_kwargs, "number": issue.number}
+        ),
+        "issue-comments-list": reverse("api:issue-comments-list", kwargs=comment_kwargs),
+        "issue-comments-detail": reverse(
+            "api:issue-comments-detail", kwargs={**comment_kwargs, "comment_id": comment.comment_id}
+        ),
+        "issue-comments-history": reverse(
+            "api:issue-comments-history", kwargs={**comment_kwargs, "comment_id": comment.comment_id}
+        ),
     }
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "url_name, expected_num_queries",
+    [
+        # The count and the page
+        ("repository-list", 2),
+        ("repository-issues-list", 2),
+        ("issue-comments-list", 2),
+        # The object, its parents are joined
+        ("repository-detail", 1),
+        ("repository-issues-detail", 1),
+        ("issue-comments-detail", 1),
+        # The object and the history count, an empty history page isn't queried
+        ("repository-history", 2),
+        ("repository-issues-history", 2),
+        ("issue-comments-history", 2),
+    ],
+)
+def test_github_view_sets_num_queries(api_client, comments, django_assert_num_queries, url_name, expected_num_queries):
+    url = github_view_urls(comments)[url_name]
+
+    with django_assert_num_queries(expected_num_queries):
+        response = api_client.get(url)
+
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+def test_comments_view_set_list_with_same_issue_number_in_another_repository(
+    api_client, comments_factory, issue_factory
+):
+    comment = comments_factory.create()
+    other_issue = issue_factory.create(number=comment.issue.number)
+    comments_factory.create(issue=other_issue)
+
+    response = api_client.get(github_view_urls(comment)["issue-comments-list"])
+
+    assert response.status_code == 200
+    assert [result["comment_id"] for result in response.data["results"]] == [comment.comment_id]
+
+
+@pytest.mark.django_db
+def test_issue_view_set_list_with_non_existing_repository(api_client):
+    response = api_client.get(
+        reverse("api:repository-issues-list", kwargs={"repository_owner": "owner", "repository_name": "repository"})
+    )
+
+    assert response.status_code == 200
+    assert response.data["count"] == 0
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("num_updates", [1, 25])
+def test_issue_view_set_history_num_queries(api_client, issue_factory, django_assert_num_queries, num_updates):
+    issue = issue_factory.create(title="Title 0", body="Body")
+    for number in range(1, num_updates + 1):
+        issue.title = f"Title {number}"
+        issue.save()
+    url = reverse(
+        "api:repository-issues-history",
+        kwargs={
+            "repository_owner": issue.repository.owner_name,
+            "repository_name": issue.repository.name,
+            "number": issue.number,
+        },
+    )
+
+    # The object, the history count and the history page, however long the history is
+    with django_assert_num_queries(3):
+        response = api_client.get(url, {"page_size": 10})
+
+    assert response.status_code == 200
+    assert response.data["history"]["count"] == num_updates
+    assert [record["changes"] for record in response.data["history"]["results"]] == [
+        {"title": f"Title {number}"} for number in range(num_updates - 1, max(num_updates - 11, -1), -1)
+    ]
+
+
+@pytest.mark.django_db
+def test_issue_view_set_history_is_paginated(api_client, issue_factory):
+    issue = issue_factory.create(title="Title 0", is_closed=False)
+    for number in range(1, 4):
+        issue.title = f"Title {number}"
+        issue.is_closed = not issue.is_closed
+        issue.save()
+    url = reverse(
+        "api:repository-issues-history",
+        kwargs={
+            "repository_owner": issue.repository.owner_name,
+            "repository_name": issue.repository.name,
+            "number": issue.number,
+        },
+    )
+
+    first_page = api_client.get(url, {"page_size": 2}).data["history"]
+    second_page = api_client.get(first_page["next"]).data["history"]
+
+    assert first_page["count"] == 3
+    assert [record["changes"] for record in first_page["results"] + second_page["results"]] == [
+        {"title": "Title 2", "is_closed": False},
+        {"title": "Title 1", "is_closed": True},
+        {"title": "Title 0", "is_closed": False},
+    ]
+    assert second_page["next"] is None
+
+
+def issue_export_url(repository):
+    return reverse(
+        "api:repository-issues-export",
+        kwargs={"repository_owner": repository.owner_name, "repository_name": repository.name},
+    )
+
+
+@pytest.mark.django_db
+def test_issue_view_set_export_ndjson(api_client, repository, issue_factory, comments_factory):
+    issues = [issue_factory.create(repository=repository, number=number) for number in (2, 1)]
+    comment = comments_factory.create(issue=issues[1])
+    issue_factory.create(number=3)
+
+    response = api_client.get(issue_export_url(repository), {"include_comments": "true"})
+
+    assert response.status_code == 200
+    assert response["Content-Type"] == "application/x-ndjson"
+    assert response["Content-Disposition"] == (
+        f'attachment; filename="{repository.owner_name}-{repository.name}-issues.ndjson"'
+    )
+    lines = [json.loads(line) for line in b"".join(response.streaming_content).splitlines()]
+    assert [line["number"] for line in lines] == [1, 2]
+    assert lines[0]["title"] == issues[1].title
+    assert [comment_data["comment_id"] for comment_data in lines[0]["comments"]] == [comment.comment_id]
+    assert lines[1]["comments"] == []
+
+
+@pytest.mark.django_db
+def test_issue_view_set_export_csv(api_client, repository, issue_factory):
+    issue = issue_factory.create(repository=repository, title='A "quoted", title')
+
+    response = api_client.get(issue_export_url(repository), {"output": "csv"})
+
+    assert response.status_code == 200
+    assert response["Content-Type"] == "text/csv"
+    rows = list(csv.DictReader(io.StringIO(b"".join(response.streaming_content).decode())))
+    assert len(rows) == 1
+    assert rows[0]["number"] == str(issue.number)
+    assert rows[0]["title"] == issue.title
+    assert "comments" not in rows[0]
+
+
+@pytest.mark.django_db
+def test_issue_view_set_export_updated_since(api_client, repository, issue_factory):
+    updated_at = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+    issue_factory.create(repository=repository, number=1, updated_at=updated_at - datetime.timedelta(days=1))
+    issue_factory.create(repository=repository, number=2, updated_at=updated_at)
+
+    response = api_client.get(issue_export_url(repository), {"updated_since": updated_at.isoformat()})
+
+    assert [json.loads(line)["number"] for line in b"".join(response.streaming_content).splitlines()] == [2]
+
+
+@pytest.mark.django_db
+def test_issue_view_set_export_with_invalid_output(api_client, repository):
+    response = api_client.get(issue_export_url(repository), {"output": "xml"})
+
+    assert response.status_code == 400
+    assert "output" in response.data
+
+
+@pytest.mark.django_db
+def test_issue_view_set_export_num_queries(
+    api_client, settings, repository, issue_factory, comments_factory, django_assert_num_queries
+):
+    settings.API_EXPORT_CHUNK_SIZE = 2
+    for number in range(1, 6):
+        comments_factory.create(issue=issue_factory.create(repository=repository, number=number))
+
+    # The issues are fetched by chunks from a single cursor, the comments are prefetched for every chunk
+    with django_assert_num_queries(1 + 3):
+        response = api_client.get(issue_export_url(repository), {"include_comments": "true"})
+        lines = b"".join(response.streaming_content).splitlines()
+
+    assert len(lines) == 5
+
+
+@pytest.mark.django_db
+def test_issue_view_set_list_search(api_client, repository, issue_factory, comments_factory):
+    in_title = issue_factory.create(repository=repository, number=1, title="Crash on startup", body="")
+    in_body = issue_factory.create(repository=repository, number=2, title="Bug", body="It crashes on startup")
+    in_comments = issue_factory.create(repository=repository, number=3, title="Bug", body="")
+    comments_factory.create_batch(2, issue=in_comments, body="Same crash here")
+    issue_factory.create(repository=repository, number=4, title="Feature request", body="")
+    issue_factory.create(number=5, title="Crash in another repository")
+    url = reverse(
+        "api:repository-issues-list",
+        kwargs={"repository_owner": repository.owner_name, "repository_name": repository.name},
+    )
+
+    response = api_client.get(url, {"search": "crash"})
+
+    assert response.status_code == 200
+    assert [result["number"] for result in response.data["results"]] == [
+        in_title.number,
+        in_body.number,
+        in_comments.number,
+    ]
+
+
+@pytest.mark.django_db
+def test_issue_view_set_list_search_rejects_cursor_pagination(api_client, repository):
+    url = reverse(
+        "api:repository-issues-list",
+        kwargs={"repository_owner": repository.owner_name, "repository_name": repository.name},
+    )
+
+    response = api_client.get(url, {"search": "crash", "pagination": "cursor"})
+
+    assert response.status_code == 400
+    assert "search" in response.data
+
+
+@requires_postgresql
+@pytest.mark.django_db
+def test_issue_view_set_list_full_text_search(api_client, repository, issue_factory, comments_factory):
+    issue_factory.create(repository=repository, number=1, title="Crashes on startup", body="")
+    issue_factory.create(repository=repository, number=2, title="Crash", body="Only with the feature flag")
+    commented = issue_factory.create(repository=repository, number=3, title="Bug", body="")
+    comments_factory.create(issue=commented, body="It crashed on startup for me too")
+    issue_factory.create(repository=repository, number=4, title="Startup is slow", body="")
+    url = reverse(
+        "api:repository-issues-list",
+        kwargs={"repository_owner": repository.owner_name, "repository_name": repository.name},
+    )
+
+    # The terms are stemmed, and support the web search syntax
+    response = api_client.get(url, {"search": "crash -feature"})
+
+    assert [result["number"] for result in response.data["results"]] == [1, 3]
+
+
+@requires_postgresql
+@pytest.mark.django_db
+def test_issue_view_set_list_full_text_search_ranking(api_client, repository, issue_factory, comments_factory):
+    in_comments = issue_factory.create(repository=repository, number=1, title="Bug", body="")
+    comments_factory.create(issue=in_comments, body="The parser crashes")
+    in_body = issue_factory.create(repository=repository, number=2, title="Bug", body="The parser crashes")
+    in_title = issue_factory.create(repository=repository, number=3, title="The parser crashes", body="")
+    url = reverse(
+        "api:repository-issues-list",
+        kwargs={"repository_owner": repository.owner_name, "repository_name": repository.name},
+    )
+
+    ranked = api_client.get(url, {"search": "parser crash"})
+    ordered = api_client.get(url, {"search": "parser crash", "ordering": "number"})
+
+    assert [result["number"] for result in ranked.data["results"]] == [
+        in_title.number,
+        in_body.number,
+        in_comments.number,
+    ]
+    assert [result["number"] for result in ordered.data["results"]] == [1, 2, 3]
+
+
+@requires_postgresql
+@pytest.mark.django_db
+def test_search_vectors_are_computed_for_synced_rows(repository, issue_factory):
+    issue = issue_factory.create(repository=repository, number=1, title="Old title", body="")
+    with (
+        patch("gissues.extensions.github_client.tasks.github_client") as mock_github_client,
+        patch("gissues.extensions.github_client.tasks.notify_followers_task"),
+        patch("gissues.extensions.github_client.tasks.bulk_comment_adapter_task"),
+    ):
+        mock_github_client.issues.paginate.return_value = iter(
+            [
+                GitHubResponse(
+                    200,
+                    [
+                        github_issue(1, title="Crash on startup", updated_at="2030-01-01T00:00:00Z"),
+                        github_issue(2, title="Memory leak"),
+                    ],
+                    True,
+                )
+            ]
+        )
+        mock_github_client.comments.paginate.return_value = iter(
+            [GitHubResponse(200, [github_comment(10_000, body="Still leaking")], True)]
+        )
+        issue_adapter_task(repository.owner_name, repository.name)
+        comment_adapter_task(repository.owner_name, repository.name, 2)
+
+    # Both the inserted and the updated rows of the bulk upserts have their search vector
+    assert Issue.objects.filter(search_vector=SearchQuery("crash", config=SEARCH_CONFIG)).get() == issue
+    assert Issue.objects.filter(search_vector=SearchQuery("leak", config=SEARCH_CONFIG)).get().number == 2
+    assert Comments.objects.filter(search_vector=SearchQuery("leak", config=SEARCH_CONFIG)).get().comment_id == 10_000
+    assert not Issue.objects.filter(search_vector=SearchQuery("old", config=SEARCH_CONFIG)).exists()
+
+
+@pytest.mark.django_db
+def test_issue_view_set_list_without_search(api_client, repository, issue_factory):
+    issue_factory.create_batch(2, repository=repository)
+    url = reverse(
+        "api:repository-issues-list",
+        kwargs={"repository_owner": repository.owner_name, "repository_name": repository.name},
+    )
+
+    response = api_client.get(url, {"search": " "})
+
+    assert response.data["count"] == 2
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "params, expected_numbers",
+    [
+        ({"is_closed": "false"}, [1, 3]),
+        ({"is_closed": "true", "state_reason": "completed"}, [2]),
+        ({"is_locked": "true"}, [3]),
+        ({"updated_at__gte": "2024-01-02T00:00:00Z"}, [2, 3]),
+        ({"is_closed": "false", "updated_at__gte": "2024-01-02T00:00:00Z"}, [3]),
+        ({"created_at__lte": "2024-01-01T00:00:00Z"}, [1]),
+        ({"comment_count__gte": 1, "comment_count__lte": 5}, [2]),
+    ],
+)
+def test_issue_view_set_list_filters(api_client, repository, issue_factory, params, expected_numbers):
+    day = datetime.timedelta(days=1)
+    created_at = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+    for number, is_closed, state_reason, is_locked, comment_count in [
+        (1, False, None, False, 0),
+        (2, True, "completed", False, 5),
+        (3, False, "reopened", True, 10),
+    ]:
+        issue_factory.create(
+            repository=repository,
+            number=number,
+            is_closed=is_closed,
+            state_reason=state_reason,
+            is_locked=is_locked,
+            comment_count=comment_count,
+            created_at=created_at + (number - 1) * day,
+            updated_at=created_at + (number - 1) * day,
+        )
+    url = reverse(
+        "api:repository-issues-list",
+        kwargs={"repository_owner": repository.owner_name, "repository_name": repository.name},
+    )
+
+    response = api_client.get(url, params)
+
+    assert response.status_code == 200
+    assert [result["number"] for result in response.data["results"]] == expected_numbers
+
+
+@pytest.mark.django_db
+def test_issue_view_set_list_with_invalid_filter(api_client, repository):
+    url = reverse(
+        "api:repository-issues-list",
+        kwargs={"repository_owner": repository.owner_name, "repository_name": repository.name},
+    )
+
+    response = api_client.get(url, {"updated_at__gte": "yesterday"})
+
+    assert response.status_code == 400
+    assert "updated_at__gte" in response.data
+
+
+@pytest.mark.django_db
+def test_comments_view_set_list_filters(api_client, issue, comments_factory):
+    updated_at = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+    comments_factory.create(issue=issue, updated_at=updated_at - datetime.timedelta(days=1))
+    comment = comments_factory.create(issue=issue, updated_at=updated_at)
+    url = reverse(
+        "api:issue-comments-list",
+        kwargs={
+            "repository_owner": issue.repository.owner_name,
+            "repository_name": issue.repository.name,
+            "issue_number": issue.number,
+        },
+    )
+
+    response = api_client.get(url, {"updated_at__gte": updated_at.isoformat()})
+
+    assert response.status_code == 200
+    assert [result["comment_id"] for result in response.data["results"]] == [comment.comment_id]
+
+
+@patch("gissues.extensions.github_client.tasks.issue_adapter_task.retry")
+@patch("requests.Session.request")
+@pytest.mark.django_db
+def test_views_spend_rate_limit_reserve_left_by_syncs(mock_request, mock_retry, api_client, repository):
+    # Below the reserve of the test settings
+    reset = str(int(time.time()) + 60)
+    github_client.rate_limit.update(200, {"X-RateLimit-Remaining": "50", "X-RateLimit-Reset": reset})
+    mock_retry.side_effect = Exception("retry")
+    mock_request.return_value = Mock(
+        status_code=200,
+        ok=True,
+        links={},
+        headers={"X-RateLimit-Remaining": "49", "X-RateLimit-Reset": reset},
+        content=b"{}",
+        request=Mock(body=None),
+        json=Mock(
+            return_value={
+                "name": "gissues",
+                "owner": {"login": "gissues"},
+                "description": "",
+                "private": False,
+                "fork": False,
+                "created_at": "2021-05-25T10:00:00Z",
+                "updated_at": "2021-05-25T10:00:00Z",
+                "pushed_at": "2021-05-25T10:00:00Z",
+            }
+        ),
+    )
+
+    # The background sync stops at the reserve
+    with pytest.raises(Exception, match="retry"):
+        issue_adapter_task(repository.owner_name, repository.name)
+    mock_request.assert_not_called()
+
+    # While an API client can still spend it
+    response = api_client.get(
+        reverse("api:repository-detail", kwargs={"repository_owner": "gissues", "name": "gissues"})
+    )
+
+    assert response.status_code == 200
+    mock_request.assert_called_once()
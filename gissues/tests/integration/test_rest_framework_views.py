@@ -1,6 +1,7 @@
-import pytest
 from rest_framework.reverse import reverse
 
+import pytest
+
 
 @pytest.mark.django_db
 def test_meta_view_set_list(api_client):
@@ -11,3 +12,28 @@ def test_meta_view_set_list(api_client):
         "name": "gissues",
         "version": "0.1.0",
     }
+
+
+@pytest.mark.django_db
+def test_meta_view_set_metrics(api_client, user_factory):
+    api_client.force_authenticate(user=user_factory.create(is_staff=True))
+
+    response = api_client.get(reverse("api:meta-metrics"))
+
+    assert response.status_code == 200
+    assert response.data == {
+        "github_client": {
+            "connection_pool": {"hits": 0, "misses": 0},
+            "rate_limit": {"remaining": None, "reset": None, "blocked_until": None},
+        },
+        "response_cache": {"hits": 0, "misses": 0},
+    }
+
+
+@pytest.mark.django_db
+def test_meta_view_set_metrics_requires_admin(api_client, user_factory):
+    api_client.force_authenticate(user=user_factory.create(is_staff=False))
+
+    response = api_client.get(reverse("api:meta-metrics"))
+
+    assert response.status_code == 403
@@ -144,7 +144,17 @@ REST_FRAMEWORK = {
     "URL_FORMAT_OVERRIDE": None,
 }
 
-CHECK_FOR_NEW_ISSUES_INTERVAL_IN_MINUTES = 60  # DEFAULT: 1 hour
+ISSUE_SYNC_INITIAL_INTERVAL_IN_MINUTES = 60  # DEFAULT: 1 hour
+ISSUE_SYNC_SCHEDULER_TICK_IN_MINUTES = 5
+ISSUE_SYNC_MIN_INTERVAL_IN_MINUTES = 5
+ISSUE_SYNC_MAX_INTERVAL_IN_MINUTES = 60 * 24
+ISSUE_SYNC_BACKOFF_FACTOR = 1.5
+ISSUE_SYNC_SPEEDUP_FACTOR = 2.0
+NOTIFICATION_DIGEST_INTERVAL_IN_MINUTES = 60 * 24  # DEFAULT: 1 day
+HISTORY_COMPACTION_INTERVAL_IN_MINUTES = 60 * 24  # DEFAULT: 1 day
+HISTORY_RETENTION_DAYS = 90
+HISTORY_COMPACTION_BATCH_SIZE = 1000
+HISTORY_ARCHIVE_DIR = ""
 
 EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
 EMAIL_HOST = "localhost"
@@ -152,3 +162,14 @@ EMAIL_PORT = 25
 
 GITHUB_CLIENT_URL = "https://www.test.com"
 GITHUB_CLIENT_AUTH_TOKEN = ""
+GITHUB_CLIENT_POOL_CONNECTIONS = 10
+GITHUB_CLIENT_POOL_MAXSIZE = 10
+GITHUB_CLIENT_POOL_BLOCK = False
+GITHUB_CLIENT_KEEP_ALIVE = True
+GITHUB_CLIENT_VALIDATORS_CACHE_TIMEOUT = 60 * 60 * 24 * 7  # 1 week
+GITHUB_CLIENT_RATE_LIMIT_RESERVE = 100
+GITHUB_CLIENT_ASYNC_CONCURRENCY = 10
+GITHUB_CLIENT_SYNC_MODE = "rest"
+GITHUB_CLIENT_SYNC_LEASE_TIMEOUT = 60 * 30
+API_RESPONSE_CACHE_TIMEOUT = 60 * 60
+API_EXPORT_CHUNK_SIZE = 2000
@@ -1,3 +1,6 @@
+import asyncio
+import threading
+import time
 from unittest.mock import Mock, call, patch
 
 from rest_framework import exceptions, status
@@ -5,12 +8,21 @@ from rest_framework import exceptions, status
 import pytest
 from requests.exceptions import ConnectionError, Timeout
 
+from gissues.extensions.github_client import graphql
 from gissues.extensions.github_client.client import (
+    AsyncGitHubClient,
+    AsyncGitHubComments,
+    AsyncGitHubIssues,
+    AsyncGitHubRepositories,
     GitHubClient,
     GitHubComments,
+    GitHubGraphQL,
+    GitHubHTTPAdapter,
     GitHubIssues,
     GitHubRepositories,
     GitHubResponse,
+    RateLimitBudget,
+    RateLimitExceeded,
     ServiceUnavailable,
 )
 
@@ -111,6 +123,95 @@ def test_github_client_session_with_token(mock_session):
     mock_session.assert_called_once()
 
 
+@patch("gissues.extensions.github_client.client.requests.Session")
+def test_github_client_session_is_reused(mock_session):
+    mock_session.return_value.headers = {}
+
+    client = GitHubClient()
+
+    assert client.session is client.session
+    mock_session.assert_called_once()
+
+
+@patch("gissues.extensions.github_client.client.os.getpid")
+@patch("gissues.extensions.github_client.client.requests.Session")
+def test_github_client_session_is_rebuilt_after_fork(mock_session, mock_getpid):
+    mock_session.return_value.headers = {}
+    mock_getpid.return_value = 1
+
+    client = GitHubClient()
+    client.session
+
+    mock_getpid.return_value = 2
+    client.session
+
+    assert mock_session.call_count == 2
+
+
+def test_github_client_session_mounts_pooled_adapter():
+    client = GitHubClient()
+    client.pool_maxsize = 5
+    client.pool_block = True
+
+    adapter = client.session.get_adapter(client.client_url)
+
+    assert isinstance(adapter, GitHubHTTPAdapter)
+    assert adapter._pool_maxsize == 5
+    assert adapter._pool_block is True
+
+
+def test_github_client_close():
+    client = GitHubClient()
+    session = client.session
+
+    with patch.object(session, "close") as mock_close:
+        client.close()
+
+    mock_close.assert_called_once()
+    assert client.session is not session
+
+
+@pytest.mark.parametrize(
+    "keep_alive, expected_socket_options",
+    [
+        (True, True),
+        (False, False),
+    ],
+)
+def test_github_http_adapter_keep_alive(keep_alive, expected_socket_options):
+    adapter = GitHubHTTPAdapter(keep_alive=keep_alive)
+
+    assert ("socket_options" in adapter.poolmanager.connection_pool_kw) is expected_socket_options
+
+
+def test_github_http_adapter_pool_stats():
+    adapter = GitHubHTTPAdapter()
+    adapter.poolmanager.pools["pool-1"] = Mock(num_requests=5, num_connections=1)
+    adapter.poolmanager.pools["pool-2"] = Mock(num_requests=3, num_connections=2)
+
+    assert adapter.pool_stats() == {"hits": 5, "misses": 3}
+
+
+def test_github_client_pool_stats():
+    client = GitHubClient()
+
+    assert client.pool_stats() == {"hits": 0, "misses": 0}
+
+
+@patch("gissues.extensions.github_client.client.GitHubClient._log_request", return_value=None)
+def test_github_client_make_request_keeps_session_headers(mock_log_request):
+    client = GitHubClient()
+    client.client_token = "secret_token"
+    client.session.request = Mock(
+        return_value=Mock(status_code=200, ok=True, links={}, headers={}, request=Mock(body=None))
+    )
+
+    client.make_request("GET", "/test-endpoint")
+    client._mask_secret_info(mock_log_request.call_args.args[2])
+
+    assert client.session.headers["Authorization"] == "Bearer secret_token"
+
+
 @pytest.mark.parametrize(
     "data, expected_data",
     [
@@ -201,6 +302,8 @@ def test_github_client_make_request_success(
     mock_response.status_code = status_code
     mock_response.json.return_value = content
     mock_response.ok = is_ok
+    mock_response.links = {}
+    mock_response.headers = {}
 
     mock_session.request.return_value = mock_response
     mock_session.headers = {}
@@ -214,7 +317,7 @@ def test_github_client_make_request_success(
     assert response.content == content
     assert response.is_ok == is_ok
 
-    mock_github_response.assert_called_once_with(status_code=status_code, content=content, is_ok=is_ok)
+    mock_github_response.assert_called_once_with(status_code=status_code, content=content, is_ok=is_ok, links={})
     mock_session.request.assert_called_once_with("GET", "https://www.test.com/test-endpoint")
     mock_log_request.assert_called_once_with(
         "GET",
@@ -226,6 +329,156 @@ def test_github_client_make_request_success(
     )
 
 
+@patch("gissues.extensions.github_client.client.GitHubClient.session")
+@patch("gissues.extensions.github_client.client.GitHubClient._log_request", return_value=None)
+def test_github_client_make_request_parses_links(mock_log_request, mock_session):
+    mock_response = Mock(status_code=200, ok=True, headers={})
+    mock_response.request.body = None
+    mock_response.json.return_value = []
+    mock_response.links = {"next": {"url": "https://www.test.com/test-endpoint?page=2", "rel": "next"}}
+    mock_session.request.return_value = mock_response
+
+    client = GitHubClient()
+    response = client.make_request("GET", "https://www.test.com/test-endpoint?page=1")
+
+    assert response.links == {"next": "https://www.test.com/test-endpoint?page=2"}
+    mock_session.request.assert_called_once_with("GET", "https://www.test.com/test-endpoint?page=1")
+
+
+@patch("gissues.extensions.github_client.client.GitHubClient.make_request")
+def test_github_client_paginate(mock_make_request):
+    mock_make_request.side_effect = [
+        GitHubResponse(200, [{"id": 1}], True, {"next": "https://www.test.com/test-endpoint?page=2"}),
+        GitHubResponse(200, [{"id": 2}], True, {"next": "https://www.test.com/test-endpoint?page=3"}),
+        GitHubResponse(200, [{"id": 3}], True),
+    ]
+
+    client = GitHubClient()
+    pages = [response.content for response in client.paginate("GET", "/test-endpoint", params={"state": "all"})]
+
+    assert pages == [[{"id": 1}], [{"id": 2}], [{"id": 3}]]
+    assert mock_make_request.call_args_list == [
+        call("GET", "/test-endpoint", conditional=False, params={"per_page": 100, "state": "all"}),
+        call("GET", "https://www.test.com/test-endpoint?page=2"),
+        call("GET", "https://www.test.com/test-endpoint?page=3"),
+    ]
+
+
+@patch("gissues.extensions.github_client.client.GitHubClient.make_request")
+def test_github_client_paginate_conditional_first_page_only(mock_make_request):
+    mock_make_request.side_effect = [
+        GitHubResponse(200, [{"id": 1}], True, {"next": "https://www.test.com/test-endpoint?page=2"}),
+        GitHubResponse(200, [{"id": 2}], True),
+    ]
+
+    client = GitHubClient()
+    list(client.paginate("GET", "/test-endpoint", conditional=True))
+
+    assert mock_make_request.call_args_list == [
+        call("GET", "/test-endpoint", conditional=True, params={"per_page": 100}),
+        call("GET", "https://www.test.com/test-endpoint?page=2"),
+    ]
+
+
+@patch("gissues.extensions.github_client.client.GitHubClient.make_request")
+def test_github_client_paginate_stops_on_not_modified(mock_make_request):
+    mock_make_request.return_value = GitHubResponse(304, {}, True)
+
+    client = GitHubClient()
+    responses = list(client.paginate("GET", "/test-endpoint", conditional=True))
+
+    assert [response.is_not_modified for response in responses] == [True]
+
+
+@patch("gissues.extensions.github_client.client.GitHubClient.make_request")
+def test_github_client_paginate_stops_on_failure(mock_make_request):
+    mock_make_request.side_effect = [
+        GitHubResponse(500, {"message": "Internal Server Error"}, False, {"next": "https://www.test.com/?page=2"}),
+    ]
+
+    client = GitHubClient()
+    responses = list(client.paginate("GET", "/test-endpoint"))
+
+    assert [response.status_code for response in responses] == [500]
+    mock_make_request.assert_called_once()
+
+
+@patch("gissues.extensions.github_client.client.GitHubClient.make_request")
+def test_github_client_paginate_is_lazy(mock_make_request):
+    mock_make_request.return_value = GitHubResponse(200, [], True, {"next": "https://www.test.com/?page=2"})
+
+    client = GitHubClient()
+    next(client.paginate("GET", "/test-endpoint"))
+
+    mock_make_request.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "status_code, expected",
+    [
+        (200, False),
+        (304, True),
+    ],
+)
+def test_github_response_is_not_modified(status_code, expected):
+    assert GitHubResponse(status_code, {}, True).is_not_modified is expected
+
+
+@patch("gissues.extensions.github_client.client.GitHubClient._log_request", return_value=None)
+def test_github_client_make_request_stores_and_sends_validators(mock_log_request):
+    client = GitHubClient()
+    client.session.request = Mock(
+        return_value=Mock(
+            status_code=200,
+            ok=True,
+            links={},
+            content=b"[]",
+            headers={"ETag": '"etag"', "Last-Modified": "Tue, 25 May 2021 10:00:00 GMT"},
+            request=Mock(body=None),
+            json=Mock(return_value=[]),
+        )
+    )
+
+    client.make_request("GET", "/test-endpoint", conditional=True, params={"page": 1})
+
+    client.session.request.assert_called_with("GET", "https://www.test.com/test-endpoint", params={"page": 1})
+
+    client.session.request.return_value = Mock(
+        status_code=304, ok=True, links={}, content=b"", headers={}, request=Mock(body=None)
+    )
+    response = client.make_request("GET", "/test-endpoint", conditional=True, params={"page": 1})
+
+    assert response.is_not_modified is True
+    assert response.content == {}
+    client.session.request.assert_called_with(
+        "GET",
+        "https://www.test.com/test-endpoint",
+        params={"page": 1},
+        headers={"If-None-Match": '"etag"', "If-Modified-Since": "Tue, 25 May 2021 10:00:00 GMT"},
+    )
+
+
+@patch("gissues.extensions.github_client.client.GitHubClient._log_request", return_value=None)
+def test_github_client_make_request_without_conditional(mock_log_request):
+    client = GitHubClient()
+    client.session.request = Mock(
+        return_value=Mock(
+            status_code=200,
+            ok=True,
+            links={},
+            content=b"[]",
+            headers={"ETag": '"etag"'},
+            request=Mock(body=None),
+            json=Mock(return_value=[]),
+        )
+    )
+
+    client.make_request("GET", "/test-endpoint")
+    client.make_request("GET", "/test-endpoint", conditional=True)
+
+    client.session.request.assert_called_with("GET", "https://www.test.com/test-endpoint")
+
+
 @patch("gissues.extensions.github_client.client.GitHubIssues")
 def test_github_client_issues_property(mock_github_issues):
     client = GitHubClient()
@@ -269,7 +522,9 @@ def test_github_issues_detail(mocked_github_client):
     assert response.content == {"dummy": "data"}
     assert response.is_ok is True
 
-    mocked_github_client.make_request.assert_called_once_with("GET", "/repos/owner_name/repo/issues/1")
+    mocked_github_client.make_request.assert_called_once_with(
+        "GET", "/repos/owner_name/repo/issues/1", use_reserve=False
+    )
 
 
 def test_github_repositories_list(mocked_github_client):
@@ -291,7 +546,7 @@ def test_github_repositories_detail(mocked_github_client):
     assert response.content == {"dummy": "data"}
     assert response.is_ok is True
 
-    mocked_github_client.make_request.assert_called_once_with("GET", "/repos/owner_name/repo")
+    mocked_github_client.make_request.assert_called_once_with("GET", "/repos/owner_name/repo", use_reserve=False)
 
 
 def test_github_comments_list(mocked_github_client):
@@ -313,4 +568,395 @@ def test_github_comments_detail(mocked_github_client):
     assert response.content == {"dummy": "data"}
     assert response.is_ok is True
 
-    mocked_github_client.make_request.assert_called_once_with("GET", "/repos/owner_name/repo/issues/comments/1")
+    mocked_github_client.make_request.assert_called_once_with(
+        "GET", "/repos/owner_name/repo/issues/comments/1", use_reserve=False
+    )
+
+
+@pytest.mark.parametrize(
+    "client_class, args, expected_url",
+    [
+        (GitHubIssues, ("owner_name", "repo"), "/repos/owner_name/repo/issues?state=all"),
+        (GitHubRepositories, ("username",), "/users/username/repos"),
+        (GitHubComments, ("owner_name", "repo", 1), "/repos/owner_name/repo/issues/1/comments"),
+    ],
+)
+def test_github_sub_clients_paginate(mocked_github_client, client_class, args, expected_url):
+    client = client_class(mocked_github_client)
+    client.paginate(*args, conditional=True, sort="updated")
+
+    mocked_github_client.paginate.assert_called_once_with(
+        "GET", expected_url, conditional=True, params={"sort": "updated"}
+    )
+
+
+def test_rate_limit_budget_without_known_quota():
+    budget = RateLimitBudget(reserve=10)
+    budget.acquire()
+
+    assert budget.status() == {"remaining": None, "reset": None, "blocked_until": None}
+
+
+def test_rate_limit_budget_reserves_requests():
+    reset = int(time.time()) + 60
+    budget = RateLimitBudget(reserve=10)
+    budget.update(200, {"X-RateLimit-Remaining": "12", "X-RateLimit-Reset": str(reset)})
+
+    budget.acquire()
+    budget.acquire()
+
+    assert budget.status() == {"remaining": 10, "reset": reset, "blocked_until": None}
+
+    with pytest.raises(RateLimitExceeded) as exc_info:
+        budget.acquire()
+
+    assert 0 < exc_info.value.wait <= 60
+
+
+def test_rate_limit_budget_reserve_is_left_to_api_clients():
+    reset = int(time.time()) + 60
+    budget = RateLimitBudget(reserve=10)
+    budget.update(200, {"X-RateLimit-Remaining": "2", "X-RateLimit-Reset": str(reset)})
+
+    with pytest.raises(RateLimitExceeded):
+        budget.acquire()
+
+    budget.acquire(use_reserve=True)
+    budget.acquire(use_reserve=True)
+
+    assert budget.status()["remaining"] == 0
+
+    with pytest.raises(RateLimitExceeded):
+        budget.acquire(use_reserve=True)
+
+
+@pytest.mark.parametrize("use_reserve", [False, True])
+@patch("gissues.extensions.github_client.client.GitHubClient.make_request")
+def test_github_client_detail_can_use_reserve(mock_make_request, use_reserve):
+    client = GitHubClient()
+
+    client.repositories.detail("owner", "repo", use_reserve=use_reserve)
+    client.issues.detail("owner", "repo", 1, use_reserve=use_reserve)
+    client.comments.detail("owner", "repo", 1, use_reserve=use_reserve)
+
+    assert [call.kwargs for call in mock_make_request.call_args_list] == [{"use_reserve": use_reserve}] * 3
+
+
+def test_rate_limit_budget_resources_are_separate():
+    budget = RateLimitBudget(reserve=10)
+    budget.update(200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(int(time.time()) + 60)})
+
+    budget.acquire(resource="graphql")
+
+    with pytest.raises(RateLimitExceeded):
+        budget.acquire()
+
+
+def test_rate_limit_budget_after_reset():
+    budget = RateLimitBudget(reserve=10)
+    budget.update(200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(int(time.time()) - 1)})
+
+    budget.acquire()
+
+
+@pytest.mark.parametrize(
+    "status_code, headers, expected_wait",
+    [
+        (403, {"Retry-After": "30"}, 30),
+        (429, {"Retry-After": "30"}, 30),
+        (429, {}, 60),
+        (403, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1000120"}, 120),
+    ],
+)
+@patch("gissues.extensions.github_client.client.time.time", return_value=1000000)
+def test_rate_limit_budget_backoff(mock_time, status_code, headers, expected_wait):
+    budget = RateLimitBudget(reserve=0)
+    budget.update(status_code, headers)
+
+    with pytest.raises(RateLimitExceeded) as exc_info:
+        budget.acquire(resource="graphql")
+
+    assert expected_wait - 10 <= exc_info.value.wait <= expected_wait
+
+
+def test_rate_limit_budget_ignores_permission_errors():
+    budget = RateLimitBudget(reserve=0)
+    budget.update(403, {})
+
+    budget.acquire()
+
+
+@patch("gissues.extensions.github_client.client.GitHubClient._log_request", return_value=None)
+def test_github_client_make_request_uses_rate_limit(mock_log_request):
+    client = GitHubClient()
+    client.rate_limit = Mock(spec=RateLimitBudget)
+    response_headers = {"X-RateLimit-Remaining": "10"}
+    client.session.request = Mock(
+        return_value=Mock(status_code=200, ok=True, links={}, headers=response_headers, request=Mock(body=None))
+    )
+
+    client.make_request("GET", "/test-endpoint")
+
+    client.rate_limit.acquire.assert_called_once_with("core", use_reserve=False)
+    client.rate_limit.update.assert_called_once_with(200, response_headers, "core")
+
+
+def test_github_client_make_request_with_exceeded_rate_limit():
+    client = GitHubClient()
+    client.rate_limit = Mock(spec=RateLimitBudget)
+    client.rate_limit.acquire.side_effect = RateLimitExceeded(wait=10)
+    client.session.request = Mock()
+
+    with pytest.raises(RateLimitExceeded):
+        client.make_request("GET", "/test-endpoint")
+
+    client.session.request.assert_not_called()
+
+
+def test_async_github_client_make_request():
+    base_client = Mock(spec=GitHubClient)
+    base_client.make_request.return_value = GitHubResponse(200, {"id": 1}, True)
+    client = AsyncGitHubClient(base_client, concurrency=2)
+
+    response = client.run(client.make_request("GET", "/test-endpoint", conditional=True, params={"page": 1}))
+
+    assert response == base_client.make_request.return_value
+    base_client.make_request.assert_called_once_with("GET", "/test-endpoint", True, params={"page": 1})
+
+
+def test_async_github_client_bounds_concurrency():
+    lock, in_flight, max_in_flight = threading.Lock(), [0], [0]
+
+    def make_request(*args, **kwargs):
+        with lock:
+            in_flight[0] += 1
+            max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+        time.sleep(0.01)
+        with lock:
+            in_flight[0] -= 1
+        return GitHubResponse(200, {}, True)
+
+    base_client = Mock(spec=GitHubClient)
+    base_client.make_request.side_effect = make_request
+    client = AsyncGitHubClient(base_client, concurrency=3)
+
+    async def main():
+        return await asyncio.gather(*(client.make_request("GET", f"/test-endpoint/{i}") for i in range(10)))
+
+    # The semaphore is bound to the running event loop, so the client can be run more than once
+    for _ in range(2):
+        assert len(client.run(main())) == 10
+
+    assert base_client.make_request.call_count == 20
+    assert max_in_flight[0] == 3
+
+
+def test_async_github_client_paginate():
+    base_client = Mock(spec=GitHubClient, per_page=100)
+    base_client.make_request.side_effect = [
+        GitHubResponse(200, [{"id": 1}], True, {"next": "https://www.test.com/test-endpoint?page=2"}),
+        GitHubResponse(200, [{"id": 2}], True),
+    ]
+    client = AsyncGitHubClient(base_client, concurrency=2)
+
+    async def main():
+        return [response.content async for response in client.paginate("GET", "/test-endpoint", conditional=True)]
+
+    assert client.run(main()) == [[{"id": 1}], [{"id": 2}]]
+    assert base_client.make_request.call_args_list == [
+        call("GET", "/test-endpoint", True, params={"per_page": 100}),
+        call("GET", "https://www.test.com/test-endpoint?page=2", False),
+    ]
+
+
+def test_async_github_client_raises_rate_limit_exceeded():
+    base_client = Mock(spec=GitHubClient)
+    base_client.make_request.side_effect = RateLimitExceeded(wait=10)
+    client = AsyncGitHubClient(base_client, concurrency=2)
+
+    with pytest.raises(RateLimitExceeded):
+        client.run(client.make_request("GET", "/test-endpoint"))
+
+
+@pytest.mark.parametrize(
+    "property_name, client_class",
+    [("issues", AsyncGitHubIssues), ("repositories", AsyncGitHubRepositories), ("comments", AsyncGitHubComments)],
+)
+def test_async_github_client_sub_clients(property_name, client_class):
+    base_client = Mock(spec=GitHubClient)
+    base_client.make_request.return_value = GitHubResponse(200, {"id": 1}, True)
+    client = AsyncGitHubClient(base_client, concurrency=2)
+
+    sub_client = getattr(client, property_name)
+
+    assert isinstance(sub_client, client_class)
+    assert sub_client.base_client is client
+    assert client.run(client.comments.detail("owner_name", "repo", 1)).content == {"id": 1}
+
+
+def graphql_issue_node(number, comment_nodes=(), has_next_comments=False, **kwargs):
+    return {
+        "number": number,
+        "title": f"Issue {number}",
+        "body": "This is an issue.",
+        "state": "CLOSED",
+        "stateReason": "NOT_PLANNED",
+        "closedAt": "2021-05-26T10:00:00Z",
+        "locked": True,
+        "activeLockReason": "TOO_HEATED",
+        "createdAt": "2021-05-25T10:00:00Z",
+        "updatedAt": "2021-05-26T10:00:00Z",
+        "comments": {
+            "totalCount": len(comment_nodes) + has_next_comments,
+            "pageInfo": {"hasNextPage": has_next_comments, "endCursor": "comments-cursor"},
+            "nodes": list(comment_nodes),
+        },
+        **kwargs,
+    }
+
+
+def graphql_comment_node(comment_id):
+    return {
+        "databaseId": comment_id,
+        "body": "This is a comment.",
+        "createdAt": "2021-05-25T10:00:00Z",
+        "updatedAt": "2021-05-25T10:00:00Z",
+    }
+
+
+def test_graphql_issue_from_node():
+    assert graphql.issue_from_node(graphql_issue_node(1, [graphql_comment_node(1)])) == {
+        "number": 1,
+        "title": "Issue 1",
+        "body": "This is an issue.",
+        "state": "closed",
+        "state_reason": "not_planned",
+        "closed_at": "2021-05-26T10:00:00Z",
+        "locked": True,
+        "active_lock_reason": "too heated",
+        "comments": 1,
+        "created_at": "2021-05-25T10:00:00Z",
+        "updated_at": "2021-05-26T10:00:00Z",
+    }
+
+
+@pytest.mark.parametrize(
+    "lock_reason, expected_lock_reason",
+    [(None, None), ("OFF_TOPIC", "off_topic"), ("RESOLVED", "resolved"), ("SPAM", "spam")],
+)
+def test_graphql_issue_from_node_lock_reason(lock_reason, expected_lock_reason):
+    node = graphql_issue_node(1, activeLockReason=lock_reason, stateReason=None, state="OPEN")
+
+    issue = graphql.issue_from_node(node)
+
+    assert issue["active_lock_reason"] == expected_lock_reason
+    assert issue["state"] == "open"
+    assert issue["state_reason"] is None
+
+
+def test_graphql_comment_from_node():
+    assert graphql.comment_from_node(graphql_comment_node(1)) == {
+        "id": 1,
+        "body": "This is a comment.",
+        "created_at": "2021-05-25T10:00:00Z",
+        "updated_at": "2021-05-25T10:00:00Z",
+    }
+
+
+def test_github_client_graphql_property():
+    client = GitHubClient()
+
+    assert isinstance(client.graphql, GitHubGraphQL)
+    assert client.graphql.base_client is client
+
+
+def test_github_graphql_query(mocked_github_client):
+    mocked_github_client.make_request.return_value = GitHubResponse(200, {"data": {}}, True)
+    client = GitHubGraphQL(mocked_github_client)
+
+    response = client.query("query { viewer { login } }", first=1)
+
+    assert response.is_ok
+    mocked_github_client.make_request.assert_called_once_with(
+        "POST",
+        "/graphql",
+        resource="graphql",
+        json={"query": "query { viewer { login } }", "variables": {"first": 1}},
+    )
+
+
+def test_github_graphql_query_with_errors(mocked_github_client):
+    content = {"data": None, "errors": [{"message": "Could not resolve to a Repository."}]}
+    mocked_github_client.make_request.return_value = GitHubResponse(200, content, True)
+    client = GitHubGraphQL(mocked_github_client)
+
+    response = client.query("query { viewer { login } }")
+
+    assert response == GitHubResponse(200, content, False)
+
+
+def graphql_issues_response(nodes, has_next_page=False):
+    content = {
+        "data": {
+            "repository": {
+                "issues": {"pageInfo": {"hasNextPage": has_next_page, "endCursor": "issues-cursor"}, "nodes": nodes}
+            }
+        }
+    }
+    return GitHubResponse(200, content, True)
+
+
+def graphql_comments_response(nodes, has_next_page=False):
+    content = {
+        "data": {
+            "repository": {
+                "issue": {
+                    "comments": {
+                        "pageInfo": {"hasNextPage": has_next_page, "endCursor": "next-comments-cursor"},
+                        "nodes": nodes,
+                    }
+                }
+            }
+        }
+    }
+    return GitHubResponse(200, content, True)
+
+
+def test_github_graphql_paginate_issues(mocked_github_client):
+    mocked_github_client.make_request.side_effect = [
+        graphql_issues_response(
+            [graphql_issue_node(1, [graphql_comment_node(1)], has_next_comments=True), graphql_issue_node(2)],
+            has_next_page=True,
+        ),
+        graphql_comments_response([graphql_comment_node(2)], has_next_page=True),
+        graphql_comments_response([graphql_comment_node(3)]),
+        graphql_issues_response([graphql_issue_node(3, [graphql_comment_node(4)])]),
+    ]
+    client = GitHubGraphQL(mocked_github_client)
+
+    pages = [
+        response.content for response in client.paginate_issues("owner_name", "repo", since="2021-05-25T10:00:00Z")
+    ]
+
+    assert [[issue["number"] for issue in page] for page in pages] == [[1, 2], [3]]
+    assert [[comment["id"] for comment in issue["comment_list"]] for page in pages for issue in page] == [
+        [1, 2, 3],
+        [],
+        [4],
+    ]
+    variables = [kwargs["json"]["variables"] for _, kwargs in mocked_github_client.make_request.call_args_list]
+    assert [variables[0]["after"], variables[3]["after"]] == [None, "issues-cursor"]
+    assert variables[0]["since"] == "2021-05-25T10:00:00Z"
+    assert [variables[1]["after"], variables[2]["after"]] == ["comments-cursor", "next-comments-cursor"]
+    assert variables[1]["number"] == 1
+
+
+def test_github_graphql_paginate_issues_stops_on_failure(mocked_github_client):
+    failed_response = GitHubResponse(502, {"message": "Bad Gateway"}, False)
+    mocked_github_client.make_request.side_effect = [
+        graphql_issues_response([graphql_issue_node(1, has_next_comments=True)], has_next_page=True),
+        failed_response,
+    ]
+    client = GitHubGraphQL(mocked_github_client)
+
+    assert list(client.paginate_issues("owner_name", "repo")) == [failed_response]
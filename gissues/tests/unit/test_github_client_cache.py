@@ -0,0 +1,85 @@
+from unittest.mock import Mock
+
+import pytest
+
+from gissues.extensions.github_client.cache import ResponseCache, issue_scope, owner_scope, repository_scope
+
+
+def mock_request(full_path="/api/repositories/owner/", version="alpha"):
+    return Mock(get_full_path=Mock(return_value=full_path), version=version)
+
+
+def test_scopes():
+    assert owner_scope("owner") == ("owner", "owner")
+    assert repository_scope("owner", "repo") == ("repository", "owner", "repo")
+    assert issue_scope("owner", "repo", 1) == issue_scope("owner", "repo", "1") == ("issue", "owner", "repo", "1")
+
+
+def test_response_cache_version_is_stable_until_invalidated():
+    response_cache = ResponseCache(timeout=60)
+    scope = repository_scope("owner", "repo")
+
+    version = response_cache.get_version(scope)
+
+    assert response_cache.get_version(scope) == version
+
+    response_cache.invalidate(scope)
+
+    assert response_cache.get_version(scope) > version
+
+
+def test_response_cache_invalidate_is_targeted():
+    response_cache = ResponseCache(timeout=60)
+    scope, other_scope = repository_scope("owner", "repo"), repository_scope("owner", "other-repo")
+    request = mock_request()
+    key, other_key = response_cache.get_key(scope, request), response_cache.get_key(other_scope, request)
+
+    response_cache.invalidate(scope)
+
+    assert response_cache.get_key(scope, request) != key
+    assert response_cache.get_key(other_scope, request) == other_key
+
+
+@pytest.mark.parametrize(
+    "other_request",
+    [
+        mock_request(full_path="/api/repositories/owner/?page=2"),
+        mock_request(full_path="/api/repositories/other-owner/"),
+        mock_request(version="beta"),
+    ],
+)
+def test_response_cache_key_depends_on_the_request(other_request):
+    response_cache = ResponseCache(timeout=60)
+    scope = owner_scope("owner")
+
+    assert response_cache.get_key(scope, mock_request()) == response_cache.get_key(scope, mock_request())
+    assert response_cache.get_key(scope, mock_request()) != response_cache.get_key(scope, other_request)
+
+
+def test_response_cache_get_and_set():
+    response_cache = ResponseCache(timeout=60)
+    key = response_cache.get_key(owner_scope("owner"), mock_request())
+
+    assert response_cache.get(key) is None
+
+    response_cache.set(key, {"count": 0, "results": []})
+
+    assert response_cache.get(key) == {"count": 0, "results": []}
+    assert response_cache.stats() == {"hits": 1, "misses": 1}
+
+
+def test_response_cache_stats_without_requests():
+    assert ResponseCache(timeout=60).stats() == {"hits": 0, "misses": 0}
+
+
+def test_response_cache_get_etag():
+    response_cache = ResponseCache(timeout=60)
+    key = response_cache.get_key(owner_scope("owner"), mock_request())
+
+    etag = response_cache.get_etag(key)
+
+    assert etag == f'"{key.rsplit(":", 1)[-1]}"'
+    assert (
+        response_cache.get_key(owner_scope("owner"), mock_request(), response_cache.get_version(owner_scope("owner")))
+        == key
+    )
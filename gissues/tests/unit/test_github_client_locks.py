@@ -0,0 +1,157 @@
+from unittest.mock import ANY, patch
+
+from django.core.cache import cache
+from django.core.cache.backends.redis import RedisCache
+
+from redis import Redis
+from redis.lock import Lock
+
+from gissues.extensions.github_client.cache import issue_scope, repository_scope
+from gissues.extensions.github_client.locks import Lease, clear_queued, keep_queued, mark_queued
+
+
+def test_lease_is_held_by_a_single_task():
+    scope = repository_scope("owner", "repo")
+    lease, other_lease = Lease(scope), Lease(scope)
+
+    assert lease.acquire()
+    assert not other_lease.acquire()
+    assert Lease(issue_scope("owner", "repo", 1)).acquire()
+
+    lease.release()
+
+    assert other_lease.acquire()
+
+
+def test_lease_release_keeps_lease_of_another_task():
+    scope = repository_scope("owner", "repo")
+    lease, other_lease = Lease(scope), Lease(scope)
+    lease.acquire()
+    # The lease expires and another task acquires it
+    cache.delete(lease.key)
+    other_lease.acquire()
+
+    lease.release()
+
+    assert cache.get(other_lease.key) == other_lease.token
+    assert not Lease(scope).acquire()
+
+
+def test_lease_release_without_acquire():
+    scope = repository_scope("owner", "repo")
+    lease, other_lease = Lease(scope), Lease(scope)
+    lease.acquire()
+
+    other_lease.release()
+
+    assert not Lease(scope).acquire()
+
+
+def test_lease_as_context_manager():
+    scope = repository_scope("owner", "repo")
+
+    with Lease(scope) as is_acquired:
+        assert is_acquired
+
+        with Lease(scope) as is_other_acquired:
+            assert not is_other_acquired
+
+        assert not Lease(scope).acquire()
+
+    assert Lease(scope).acquire()
+
+
+def test_lease_extend():
+    scope = repository_scope("owner", "repo")
+    lease = Lease(scope, timeout=42)
+
+    assert not lease.extend()
+
+    lease.acquire()
+    with patch("gissues.extensions.github_client.locks.cache.touch") as mock_touch:
+        assert lease.extend()
+
+    mock_touch.assert_called_once_with(lease.key, 42)
+
+
+def test_lease_extend_keeps_lease_of_another_task():
+    scope = repository_scope("owner", "repo")
+    lease, other_lease = Lease(scope), Lease(scope)
+    lease.acquire()
+    # The lease expires and another task acquires it
+    cache.delete(lease.key)
+    other_lease.acquire()
+
+    assert not lease.extend()
+    assert not lease.is_acquired
+
+    lease.release()
+
+    assert cache.get(other_lease.key) == other_lease.token
+
+
+@patch.object(Redis, "evalsha", return_value=1)
+@patch.object(Redis, "set", return_value=True)
+def test_lease_on_redis_compares_token_in_scripts(mock_set, mock_evalsha):
+    backend = RedisCache("redis://localhost:6379", {})
+    with patch("gissues.extensions.github_client.locks.caches", {"default": backend}):
+        lease = Lease(repository_scope("owner", "repo"), timeout=42)
+    key = backend.make_and_validate_key(lease.key)
+
+    assert lease.acquire()
+    mock_set.assert_called_once_with(key, lease.token.encode(), nx=True, px=42000)
+
+    assert lease.extend()
+    mock_evalsha.assert_called_once_with(Lock.lua_reacquire.sha, 1, key, lease.token.encode(), 42000)
+
+    lease.release()
+    mock_evalsha.assert_called_with(Lock.lua_release.sha, 1, key, lease.token.encode())
+    assert not lease.is_acquired
+
+
+@patch.object(Redis, "evalsha", return_value=0)
+@patch.object(Redis, "set", return_value=True)
+def test_lease_on_redis_after_expiry(mock_set, mock_evalsha):
+    backend = RedisCache("redis://localhost:6379", {})
+    with patch("gissues.extensions.github_client.locks.caches", {"default": backend}):
+        lease = Lease(repository_scope("owner", "repo"))
+    lease.acquire()
+
+    # The scripts find the token of another task under the key
+    assert not lease.extend()
+    assert not lease.is_acquired
+
+    lease.release()
+
+    assert mock_evalsha.call_count == 1
+
+
+def test_lease_timeout(settings):
+    settings.GITHUB_CLIENT_SYNC_LEASE_TIMEOUT = 42
+
+    assert Lease(repository_scope("owner", "repo")).timeout == 42
+    assert Lease(repository_scope("owner", "repo"), timeout=1).timeout == 1
+
+
+def test_mark_queued():
+    scope = repository_scope("owner", "repo")
+
+    assert mark_queued(scope)
+    assert not mark_queued(scope)
+    assert mark_queued(repository_scope("owner", "other-repo"))
+
+    clear_queued(scope)
+
+    assert mark_queued(scope)
+
+
+def test_keep_queued():
+    scope = repository_scope("owner", "repo")
+    mark_queued(scope, timeout=1)
+
+    with patch("gissues.extensions.github_client.locks.cache.set") as mock_set:
+        keep_queued(scope, timeout=3600)
+
+    mock_set.assert_called_once_with(ANY, True, 3600)
+    keep_queued(scope, timeout=3600)
+    assert not mark_queued(scope)
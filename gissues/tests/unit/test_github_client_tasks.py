@@ -0,0 +1,953 @@
+import datetime
+from unittest.mock import Mock, patch
+
+from django.core.cache import cache
+from django.db import DatabaseError
+from django.utils import timezone
+
+import pytest
+
+from gissues.extensions.auth.models import PendingNotification, User
+from gissues.extensions.github.models import Comments, Issue
+from gissues.extensions.github_client.cache import issue_scope, repository_scope, response_cache
+from gissues.extensions.github_client.client import AsyncGitHubClient, GitHubClient, GitHubResponse, RateLimitExceeded
+from gissues.extensions.github_client.locks import Lease, clear_queued, mark_queued
+from gissues.extensions.github_client.tasks import (
+    bulk_comment_adapter_task,
+    check_for_new_issues,
+    comment_adapter_task,
+    issue_adapter_task,
+    notify_followers_task,
+    send_notification_digests,
+)
+
+
+def github_issue(number, **kwargs):
+    return {
+        "title": f"Issue {number}",
+        "number": number,
+        "body": "This is an issue.",
+        "state": "open",
+        "comments": 0,
+        "closed_at": None,
+        "state_reason": None,
+        "locked": False,
+        "active_lock_reason": None,
+        "created_at": "2021-05-25T10:00:00Z",
+        "updated_at": "2021-05-25T10:00:00Z",
+        **kwargs,
+    }
+
+
+def github_comment(comment_id, **kwargs):
+    return {
+        "id": comment_id,
+        "body": "This is a comment.",
+        "created_at": "2021-05-25T10:00:00Z",
+        "updated_at": "2021-05-25T10:00:00Z",
+        **kwargs,
+    }
+
+
+@patch("gissues.extensions.github_client.tasks.notify_followers_task")
+@patch("gissues.extensions.github_client.tasks.bulk_comment_adapter_task")
+@patch("gissues.extensions.github_client.tasks.github_client")
+@pytest.mark.django_db
+def test_issue_adapter_task_syncs_every_page(mock_github_client, mock_comment_task, mock_notify_task, repository):
+    mock_github_client.issues.paginate.return_value = iter(
+        [
+            GitHubResponse(200, [github_issue(1), github_issue(2, comments=3)], True),
+            GitHubResponse(200, [github_issue(3)], True),
+        ]
+    )
+
+    issue_adapter_task(repository.owner_name, repository.name)
+
+    assert sorted(Issue.objects.filter(repository=repository).values_list("number", flat=True)) == [1, 2, 3]
+    mock_github_client.issues.paginate.assert_called_once_with(
+        repository.owner_name, repository.name, sort="updated", direction="desc"
+    )
+    mock_comment_task.apply_async.assert_called_once_with(args=(repository.owner_name, repository.name, [2]))
+    mock_notify_task.apply_async.assert_called_once_with(
+        args=(
+            repository.owner_name,
+            repository.name,
+            [
+                {
+                    "number": number,
+                    "title": f"Issue {number}",
+                    "created_at": "2021-05-25T10:00:00Z",
+                    "updated_at": "2021-05-25T10:00:00Z",
+                }
+                for number in (1, 2, 3)
+            ],
+        )
+    )
+
+
+@patch("gissues.extensions.github_client.tasks.notify_followers_task")
+@patch("gissues.extensions.github_client.tasks.github_client")
+@pytest.mark.django_db
+def test_issue_adapter_task_updates_changed_issues(mock_github_client, mock_notify_task, issue_factory):
+    issue = issue_factory.create(updated_at=datetime.datetime(2021, 5, 25, 10, tzinfo=datetime.timezone.utc))
+    mock_github_client.issues.paginate.return_value = iter(
+        [
+            GitHubResponse(200, [github_issue(issue.number, title="Updated", updated_at="2021-05-26T10:00:00Z")], True),
+        ]
+    )
+
+    issue_adapter_task(issue.repository.owner_name, issue.repository.name)
+
+    issue.refresh_from_db()
+    assert issue.title == "Updated"
+    mock_notify_task.apply_async.assert_called_once()
+
+
+@patch("gissues.extensions.github_client.tasks.notify_followers_task")
+@patch("gissues.extensions.github_client.tasks.github_client")
+@pytest.mark.django_db
+def test_issue_adapter_task_skips_unchanged_issues(mock_github_client, mock_notify_task, issue_factory, caplog):
+    issue = issue_factory.create(
+        title="Issue",
+        body="This is an issue.",
+        is_closed=False,
+        closed_at=None,
+        state_reason=None,
+        is_locked=False,
+        lock_reason=None,
+        comment_count=0,
+        created_at=datetime.datetime(2021, 5, 25, 10, tzinfo=datetime.timezone.utc),
+        updated_at=datetime.datetime(2021, 5, 25, 10, tzinfo=datetime.timezone.utc),
+    )
+    # Only `updated_at` has changed, and the timestamps are formatted differently
+    mock_github_client.issues.paginate.return_value = iter(
+        [
+            GitHubResponse(
+                200,
+                [
+                    github_issue(
+                        issue.number,
+                        title="Issue",
+                        created_at="2021-05-25T10:00:00.000+00:00",
+                        updated_at="2021-05-26T10:00:00Z",
+                    )
+                ],
+                True,
+            ),
+        ]
+    )
+
+    with caplog.at_level("INFO"):
+        issue_adapter_task(issue.repository.owner_name, issue.repository.name)
+
+    # The new `updated_at` is stored, without recording it in the history
+    issue.refresh_from_db()
+    assert issue.updated_at == datetime.datetime(2021, 5, 26, 10, tzinfo=datetime.timezone.utc)
+    assert issue.history.count() == 1
+    assert f"Skipped 1 unchanged issues from {issue.repository.owner_name}/{issue.repository.name}" in caplog.text
+    mock_notify_task.apply_async.assert_not_called()
+
+
+@patch("gissues.extensions.github_client.tasks.notify_followers_task")
+@patch("gissues.extensions.github_client.tasks.github_client")
+@pytest.mark.django_db(transaction=True)
+def test_issue_adapter_task_writes_issues_with_their_history(mock_github_client, mock_notify_task, repository):
+    mock_github_client.issues.paginate.return_value = iter([GitHubResponse(200, [github_issue(1)], True)])
+
+    with (
+        patch("simple_history.manager.HistoryManager.bulk_history_create", side_effect=DatabaseError("history")),
+        pytest.raises(DatabaseError),
+    ):
+        issue_adapter_task(repository.owner_name, repository.name)
+
+    # The upsert is rolled back, so the next sync doesn't skip the issue as unchanged
+    assert not Issue.objects.exists()
+
+
+@patch("gissues.extensions.github_client.tasks.notify_followers_task")
+@patch("gissues.extensions.github_client.tasks.github_client")
+@pytest.mark.django_db
+def test_issue_adapter_task_upserts_issues_created_concurrently(mock_github_client, mock_notify_task, issue_factory):
+    repository = issue_factory.create(number=1).repository
+    mock_github_client.issues.paginate.return_value = iter(
+        [GitHubResponse(200, [github_issue(1, title="Synced"), github_issue(2)], True)]
+    )
+
+    # Another sync stores the first issue between the existing issues lookup and the insert
+    with patch("gissues.extensions.github_client.tasks.Issue.objects.filter", return_value=Issue.objects.none()):
+        issue_adapter_task(repository.owner_name, repository.name)
+
+    issue = Issue.objects.get(repository=repository, number=1)
+    assert issue.title == "Synced"
+    assert Issue.objects.filter(repository=repository).count() == 2
+    assert issue.history.count() == 2
+    assert issue.history.latest().title == "Synced"
+
+
+@patch("gissues.extensions.github_client.tasks.github_client")
+@pytest.mark.django_db
+def test_issue_adapter_task_skips_repository_being_synced(mock_github_client, repository):
+    scope = repository_scope(repository.owner_name, repository.name)
+    mark_queued(scope)
+
+    with Lease(scope):
+        issue_adapter_task(repository.owner_name, repository.name)
+
+    mock_github_client.issues.paginate.assert_not_called()
+    # The queued mark is cleared even though the sync is skipped
+    assert mark_queued(scope)
+    assert Lease(scope).acquire()
+
+
+@patch("gissues.extensions.github_client.tasks.issue_adapter_task.retry")
+@patch("gissues.extensions.github_client.tasks.github_client")
+@pytest.mark.django_db
+def test_issue_adapter_task_stays_queued_until_retried(
+    mock_github_client, mock_retry, repository, user_repository_follow_factory
+):
+    user_repository_follow_factory.create(repository=repository)
+    scope = repository_scope(repository.owner_name, repository.name)
+    mark_queued(scope)
+    mock_github_client.issues.paginate.side_effect = RateLimitExceeded(wait=3600)
+    mock_retry.side_effect = Exception("retry")
+
+    with pytest.raises(Exception, match="retry"):
+        issue_adapter_task(repository.owner_name, repository.name)
+
+    # The postponed task is still queued, so the scheduler doesn't queue the same sync on every tick
+    with patch("gissues.extensions.github_client.tasks.issue_adapter_task.apply_async") as mock_apply_async:
+        check_for_new_issues()
+    mock_apply_async.assert_not_called()
+
+    mock_github_client.issues.paginate.side_effect = None
+    mock_github_client.issues.paginate.return_value = iter([GitHubResponse(200, [], True)])
+    issue_adapter_task(repository.owner_name, repository.name)
+
+    assert mark_queued(scope)
+
+
+@patch("gissues.extensions.github_client.tasks.notify_followers_task")
+@patch("gissues.extensions.github_client.tasks.bulk_comment_adapter_task")
+@patch("gissues.extensions.github_client.tasks.github_client")
+@pytest.mark.django_db
+def test_issue_adapter_task_skips_queued_comment_syncs(
+    mock_github_client, mock_comment_task, mock_notify_task, repository
+):
+    mark_queued(issue_scope(repository.owner_name, repository.name, 1))
+    mock_github_client.issues.paginate.return_value = iter(
+        [GitHubResponse(200, [github_issue(1, comments=1), github_issue(2, comments=1)], True)]
+    )
+
+    issue_adapter_task(repository.owner_name, repository.name)
+
+    mock_comment_task.apply_async.assert_called_once_with(args=(repository.owner_name, repository.name, [2]))
+    assert not mark_queued(issue_scope(repository.owner_name, repository.name, 2))
+
+
+@patch("gissues.extensions.github_client.tasks.github_client")
+@pytest.mark.django_db
+def test_issue_adapter_task_stops_on_failed_page(mock_github_client, repository):
+    mock_github_client.issues.paginate.return_value = iter([GitHubResponse(500, {"message": "Error"}, False)])
+
+    issue_adapter_task(repository.owner_name, repository.name)
+
+    assert Issue.objects.count() == 0
+
+
+@patch("gissues.extensions.github_client.tasks.notify_followers_task")
+@patch("gissues.extensions.github_client.tasks.github_client")
+@pytest.mark.django_db
+def test_issue_adapter_task_moves_sync_cursor(mock_github_client, mock_notify_task, repository):
+    mock_github_client.issues.paginate.return_value = iter(
+        [
+            GitHubResponse(
+                200,
+                [
+                    github_issue(2, updated_at="2021-05-27T10:00:00Z"),
+                    github_issue(1, updated_at="2021-05-26T10:00:00Z"),
+                ],
+                True,
+            ),
+        ]
+    )
+
+    issue_adapter_task(repository.owner_name, repository.name)
+
+    repository.refresh_from_db()
+    assert repository.issues_synced_at == datetime.datetime(2021, 5, 27, 10, tzinfo=datetime.timezone.utc)
+
+
+@patch("gissues.extensions.github_client.tasks.github_client")
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "full_resync, expected_params",
+    [
+        (False, {"sort": "updated", "direction": "desc", "since": "2021-05-27T10:00:00Z"}),
+        (True, {"sort": "updated", "direction": "desc"}),
+    ],
+)
+def test_issue_adapter_task_requests_issues_since_sync_cursor(
+    mock_github_client, repository_factory, full_resync, expected_params
+):
+    synced_at = datetime.datetime(2021, 5, 27, 10, tzinfo=datetime.timezone.utc)
+    repository = repository_factory.create(issues_synced_at=synced_at)
+    mock_github_client.issues.paginate.return_value = iter([GitHubResponse(200, [], True)])
+
+    issue_adapter_task(repository.owner_name, repository.name, full_resync=full_resync)
+
+    mock_github_client.issues.paginate.assert_called_once_with(
+        repository.owner_name, repository.name, **expected_params
+    )
+    repository.refresh_from_db()
+    assert repository.issues_synced_at == synced_at
+
+
+@patch("gissues.extensions.github_client.tasks.notify_followers_task")
+@patch("gissues.extensions.github_client.tasks.github_client")
+@pytest.mark.django_db
+def test_issue_adapter_task_keeps_sync_cursor_on_failure(mock_github_client, mock_notify_task, repository):
+    mock_github_client.issues.paginate.return_value = iter(
+        [
+            GitHubResponse(200, [github_issue(1, updated_at="2021-05-27T10:00:00Z")], True),
+            GitHubResponse(500, {"message": "Error"}, False),
+        ]
+    )
+
+    issue_adapter_task(repository.owner_name, repository.name)
+
+    repository.refresh_from_db()
+    assert repository.issues_synced_at is None
+    # The issues of the synced pages are still notified
+    mock_notify_task.apply_async.assert_called_once()
+
+
+@patch("gissues.extensions.github_client.tasks.notify_followers_task")
+@patch("gissues.extensions.github_client.tasks.github_client")
+@pytest.mark.django_db
+def test_issue_adapter_task_stops_on_lost_lease(mock_github_client, mock_notify_task, repository, caplog):
+    scope = repository_scope(repository.owner_name, repository.name)
+    other_lease = Lease(scope)
+
+    def issue_responses():
+        yield GitHubResponse(200, [github_issue(1, updated_at="2021-05-27T10:00:00Z")], True)
+        # The lease expires while the page is synced, and another run acquires it
+        cache.delete(other_lease.key)
+        other_lease.acquire()
+        yield GitHubResponse(200, [github_issue(2, updated_at="2021-05-26T10:00:00Z")], True)
+        yield GitHubResponse(200, [github_issue(3, updated_at="2021-05-25T10:00:00Z")], True)
+
+    mock_github_client.issues.paginate.return_value = issue_responses()
+
+    issue_adapter_task(repository.owner_name, repository.name)
+
+    assert sorted(Issue.objects.filter(repository=repository).values_list("number", flat=True)) == [1, 2]
+    assert "Lost the lease" in caplog.text
+    repository.refresh_from_db()
+    assert repository.issues_synced_at is None
+    assert cache.get(other_lease.key) == other_lease.token
+
+
+@patch("gissues.extensions.github_client.tasks.notify_followers_task")
+@patch("gissues.extensions.github_client.tasks.github_client")
+@pytest.mark.django_db
+def test_issue_adapter_task_extends_lease_after_every_page(mock_github_client, mock_notify_task, repository):
+    mock_github_client.issues.paginate.return_value = iter(
+        [GitHubResponse(200, [github_issue(1)], True), GitHubResponse(200, [github_issue(2)], True)]
+    )
+
+    with patch.object(Lease, "extend", autospec=True, return_value=True) as mock_extend:
+        issue_adapter_task(repository.owner_name, repository.name)
+
+    assert mock_extend.call_count == 2
+
+
+@patch("gissues.extensions.github_client.tasks.github_client")
+@pytest.mark.django_db
+def test_issue_adapter_task_without_changed_issues(mock_github_client, repository_factory, django_assert_num_queries):
+    repository = repository_factory.create()
+    mock_github_client.issues.paginate.return_value = iter([GitHubResponse(200, [], True)])
+
+    # Only the repository lookup and the scheduling of the next sync
+    with django_assert_num_queries(2):
+        issue_adapter_task(repository.owner_name, repository.name)
+
+    repository.refresh_from_db()
+    assert repository.sync_interval == datetime.timedelta(minutes=90)
+
+
+@patch("gissues.extensions.github_client.tasks.notify_followers_task")
+@pytest.mark.django_db
+def test_issue_adapter_task_resumes_after_failed_page(mock_notify_task, repository_factory):
+    synced_at = datetime.datetime(2021, 5, 27, 10, tzinfo=datetime.timezone.utc)
+    repository = repository_factory.create(issues_synced_at=synced_at)
+    pages = [[github_issue(2, updated_at="2021-05-29T10:00:00Z")], [github_issue(1, updated_at="2021-05-28T10:00:00Z")]]
+    failures = [GitHubResponse(500, {}, False)]
+    client = GitHubClient()
+
+    def make_request(method, endpoint, conditional=False, params=None, **kwargs):
+        # The validators of the first page would be stored by then, so a conditional request would be answered
+        # as not modified
+        if conditional:
+            return GitHubResponse(304, {}, True)
+        if params is not None:
+            return GitHubResponse(200, pages[0], True, {"next": "https://www.test.com/page/1"})
+        return failures.pop() if failures else GitHubResponse(200, pages[1], True)
+
+    client.make_request = Mock(side_effect=make_request)
+
+    with patch("gissues.extensions.github_client.tasks.github_client", client):
+        issue_adapter_task(repository.owner_name, repository.name)
+        repository.refresh_from_db()
+        assert repository.issues_synced_at == synced_at
+
+        issue_adapter_task(repository.owner_name, repository.name)
+
+    # The second run requests the same issues again, and syncs those of the failed page
+    assert client.make_request.call_args_list[0] == client.make_request.call_args_list[2]
+    assert sorted(Issue.objects.filter(repository=repository).values_list("number", flat=True)) == [1, 2]
+    repository.refresh_from_db()
+    assert repository.issues_synced_at == datetime.datetime(2021, 5, 29, 10, tzinfo=datetime.timezone.utc)
+
+
+@patch("gissues.extensions.github_client.tasks.github_client")
+@pytest.mark.django_db
+def test_issue_adapter_task_with_non_existing_repository(mock_github_client):
+    issue_adapter_task("owner", "repository")
+
+    mock_github_client.issues.paginate.assert_not_called()
+
+
+@patch("gissues.extensions.github_client.tasks.github_client")
+@pytest.mark.django_db
+def test_comment_adapter_task_syncs_every_page(mock_github_client, issue):
+    mock_github_client.comments.paginate.return_value = iter(
+        [
+            GitHubResponse(200, [github_comment(1), github_comment(2)], True),
+            GitHubResponse(200, [github_comment(3)], True),
+        ]
+    )
+
+    comment_adapter_task(issue.repository.owner_name, issue.repository.name, issue.number)
+
+    assert sorted(Comments.objects.filter(issue=issue).values_list("comment_id", flat=True)) == [1, 2, 3]
+
+
+@patch("gissues.extensions.github_client.tasks.github_client")
+@pytest.mark.django_db
+def test_comment_adapter_task_skips_unchanged_comments(mock_github_client, issue, comments_factory, caplog):
+    comment = comments_factory.create(
+        comment_id=1,
+        body="This is a comment.",
+        issue=issue,
+        created_at=datetime.datetime(2021, 5, 25, 10, tzinfo=datetime.timezone.utc),
+        updated_at=datetime.datetime(2021, 5, 25, 10, tzinfo=datetime.timezone.utc),
+    )
+    mock_github_client.comments.paginate.return_value = iter(
+        [
+            GitHubResponse(
+                200,
+                [github_comment(1, updated_at="2021-05-25T10:00:00.000+00:00"), github_comment(2, body="Edited.")],
+                True,
+            ),
+        ]
+    )
+
+    with caplog.at_level("INFO"):
+        comment_adapter_task(issue.repository.owner_name, issue.repository.name, issue.number)
+
+    assert comment.history.count() == 1
+    assert Comments.objects.get(comment_id=2).body == "Edited."
+    assert f"Skipped 1 unchanged comments from {issue.repository.owner_name}/{issue.repository.name}" in caplog.text
+
+
+@patch("gissues.extensions.github_client.tasks.github_client")
+@pytest.mark.django_db
+def test_comment_adapter_task_stores_new_updated_at_without_history(mock_github_client, issue, comments_factory):
+    comment = comments_factory.create(
+        comment_id=1,
+        body="This is a comment.",
+        issue=issue,
+        created_at=datetime.datetime(2021, 5, 25, 10, tzinfo=datetime.timezone.utc),
+        updated_at=datetime.datetime(2021, 5, 25, 10, tzinfo=datetime.timezone.utc),
+    )
+    mock_github_client.comments.paginate.return_value = iter(
+        [GitHubResponse(200, [github_comment(1, updated_at="2021-05-26T10:00:00Z")], True)]
+    )
+    scope = issue_scope(issue.repository.owner_name, issue.repository.name, issue.number)
+    version = response_cache.get_version(scope)
+
+    comment_adapter_task(issue.repository.owner_name, issue.repository.name, issue.number)
+
+    comment.refresh_from_db()
+    assert comment.updated_at == datetime.datetime(2021, 5, 26, 10, tzinfo=datetime.timezone.utc)
+    assert comment.history.count() == 1
+    # The stored comments are served with their `updated_at`
+    assert response_cache.get_version(scope) != version
+
+
+@patch("gissues.extensions.github_client.tasks.github_client")
+@pytest.mark.django_db
+def test_comment_adapter_task_skips_issue_being_synced(mock_github_client, issue):
+    with Lease(issue_scope(issue.repository.owner_name, issue.repository.name, issue.number)):
+        comment_adapter_task(issue.repository.owner_name, issue.repository.name, issue.number)
+
+    mock_github_client.comments.paginate.assert_not_called()
+
+
+def github_client_with_comments(comments, per_page):
+    """Get a client serving the comments of an issue oldest first like GitHub, with an unchanged first page."""
+    client, listed = GitHubClient(), []
+
+    def make_request(method, endpoint, conditional=False, params=None, **kwargs):
+        if params is None:
+            page = int(endpoint.rsplit("/", 1)[1])
+        elif conditional:
+            return GitHubResponse(304, {}, True)
+        else:
+            page = 0
+            listed[:] = [comment for comment in comments if comment["updated_at"] >= params.get("since", "")]
+
+        links = {"next": f"https://www.test.com/page/{page + 1}"} if (page + 1) * per_page < len(listed) else {}
+        return GitHubResponse(200, listed[page * per_page : (page + 1) * per_page], True, links)
+
+    client.per_page = per_page
+    client.make_request = Mock(side_effect=make_request)
+    return client
+
+
+@pytest.mark.django_db
+def test_comment_adapter_task_syncs_new_comment_on_later_page(issue, comments_factory):
+    for comment_id in (1, 2):
+        comments_factory.create(
+            comment_id=comment_id,
+            body="This is a comment.",
+            issue=issue,
+            created_at=datetime.datetime(2021, 5, 25, 10, comment_id, tzinfo=datetime.timezone.utc),
+            updated_at=datetime.datetime(2021, 5, 25, 10, comment_id, tzinfo=datetime.timezone.utc),
+        )
+    github_client = github_client_with_comments(
+        [
+            github_comment(comment_id, created_at=f"2021-05-25T10:0{comment_id}:00Z", updated_at=updated_at)
+            for comment_id, updated_at in [
+                (1, "2021-05-25T10:01:00Z"),
+                (2, "2021-05-25T10:02:00Z"),
+                (3, "2021-05-25T10:03:00Z"),
+            ]
+        ],
+        per_page=1,
+    )
+
+    with patch("gissues.extensions.github_client.tasks.github_client", github_client):
+        comment_adapter_task(issue.repository.owner_name, issue.repository.name, issue.number)
+
+    # Only the comments updated since the latest stored one are requested, the new one is on their second page
+    assert github_client.make_request.call_args_list[0].kwargs["params"] == {
+        "per_page": 1,
+        "since": "2021-05-25T10:02:00Z",
+    }
+    assert sorted(Comments.objects.filter(issue=issue).values_list("comment_id", flat=True)) == [1, 2, 3]
+
+
+@patch("gissues.extensions.github_client.tasks.github_client")
+@pytest.mark.django_db
+def test_comment_adapter_task_requests_all_comments_of_new_issue(mock_github_client, issue):
+    mock_github_client.comments.paginate.return_value = iter([GitHubResponse(200, [], True)])
+
+    comment_adapter_task(issue.repository.owner_name, issue.repository.name, issue.number)
+
+    mock_github_client.comments.paginate.assert_called_once_with(
+        issue.repository.owner_name, issue.repository.name, issue.number
+    )
+
+
+@patch("gissues.extensions.github_client.tasks.github_client")
+@pytest.mark.django_db
+def test_comment_adapter_task_with_non_existing_issue(mock_github_client, issue):
+    comment_adapter_task("owner", issue.repository.name, issue.number)
+
+    mock_github_client.comments.paginate.assert_not_called()
+
+
+def async_github_client_with_pages(pages):
+    base_client = Mock(spec=GitHubClient, per_page=100)
+    base_client.make_request.side_effect = lambda method, endpoint, *args, **kwargs: pages[endpoint]
+    return AsyncGitHubClient(base_client, concurrency=2)
+
+
+@pytest.mark.django_db
+def test_bulk_comment_adapter_task_syncs_every_issue(issue_factory, comments_factory):
+    first_issue = issue_factory.create(number=1)
+    second_issue = issue_factory.create(number=2, repository=first_issue.repository)
+    third_issue = issue_factory.create(number=3, repository=first_issue.repository)
+    comments_factory.create(
+        comment_id=5, issue=second_issue, updated_at=datetime.datetime(2021, 5, 25, 10, tzinfo=datetime.timezone.utc)
+    )
+    repository = first_issue.repository
+    path = f"/repos/{repository.owner_name}/{repository.name}/issues/%s/comments"
+    async_github_client = async_github_client_with_pages(
+        {
+            path % 1: GitHubResponse(200, [github_comment(1)], True, {"next": "https://www.test.com/page-2"}),
+            "https://www.test.com/page-2": GitHubResponse(200, [github_comment(2)], True),
+            path % 2: GitHubResponse(200, [], True),
+            path % 3: GitHubResponse(200, [github_comment(3)], True),
+        }
+    )
+
+    with patch("gissues.extensions.github_client.tasks.async_github_client", async_github_client):
+        bulk_comment_adapter_task(repository.owner_name, repository.name, [1, 2, 3, 4])
+
+    assert sorted(Comments.objects.filter(issue=first_issue).values_list("comment_id", flat=True)) == [1, 2]
+    assert list(Comments.objects.filter(issue=second_issue).values_list("comment_id", flat=True)) == [5]
+    assert list(Comments.objects.filter(issue=third_issue).values_list("comment_id", flat=True)) == [3]
+    assert async_github_client.base_client.make_request.call_count == 4
+    # Only the comments updated since the latest stored one are requested
+    requested_params = {
+        call.args[1]: call.kwargs.get("params") for call in async_github_client.base_client.make_request.call_args_list
+    }
+    assert requested_params[path % 1] == {"per_page": 100}
+    assert requested_params[path % 2] == {"per_page": 100, "since": "2021-05-25T10:00:00Z"}
+
+
+@pytest.mark.django_db
+def test_bulk_comment_adapter_task_skips_issues_being_synced(issue_factory):
+    first_issue = issue_factory.create(number=1)
+    repository = first_issue.repository
+    issue_factory.create(number=2, repository=repository)
+    path = f"/repos/{repository.owner_name}/{repository.name}/issues/%s/comments"
+    async_github_client = async_github_client_with_pages({path % 2: GitHubResponse(200, [github_comment(2)], True)})
+    for number in (1, 2):
+        mark_queued(issue_scope(repository.owner_name, repository.name, number))
+
+    with Lease(issue_scope(repository.owner_name, repository.name, 1)):
+        with patch("gissues.extensions.github_client.tasks.async_github_client", async_github_client):
+            bulk_comment_adapter_task(repository.owner_name, repository.name, [1, 2])
+
+    assert list(Comments.objects.filter(issue__repository=repository).values_list("comment_id", flat=True)) == [2]
+    assert async_github_client.base_client.make_request.call_count == 1
+    # The queued marks of every issue are cleared once the task has finished
+    assert mark_queued(issue_scope(repository.owner_name, repository.name, 1))
+    assert mark_queued(issue_scope(repository.owner_name, repository.name, 2))
+    # The leases of the synced issues are released
+    assert Lease(issue_scope(repository.owner_name, repository.name, 2)).acquire()
+
+
+@pytest.mark.django_db
+def test_bulk_comment_adapter_task_is_postponed_on_rate_limit(issue):
+    mark_queued(issue_scope(issue.repository.owner_name, issue.repository.name, issue.number))
+    exc = RateLimitExceeded(wait=42)
+    async_github_client = AsyncGitHubClient(Mock(spec=GitHubClient, per_page=100), concurrency=2)
+    async_github_client.base_client.make_request.side_effect = exc
+
+    with (
+        patch("gissues.extensions.github_client.tasks.async_github_client", async_github_client),
+        patch.object(bulk_comment_adapter_task, "retry", side_effect=Exception("retry")) as mock_retry,
+        pytest.raises(Exception, match="retry"),
+    ):
+        bulk_comment_adapter_task(issue.repository.owner_name, issue.repository.name, [issue.number])
+
+    mock_retry.assert_called_once_with(exc=exc, countdown=42, max_retries=None)
+    assert not Comments.objects.filter(issue=issue).exists()
+    # The postponed task is still queued
+    assert not mark_queued(issue_scope(issue.repository.owner_name, issue.repository.name, issue.number))
+
+
+@patch("gissues.extensions.github_client.tasks.notify_followers_task")
+@patch("gissues.extensions.github_client.tasks.bulk_comment_adapter_task")
+@patch("gissues.extensions.github_client.tasks.github_client")
+@pytest.mark.django_db
+@pytest.mark.parametrize("page_size", [1, 50])
+def test_issue_adapter_task_queries_per_page(
+    mock_github_client, mock_comment_task, mock_notify_task, issue_factory, django_assert_num_queries, page_size
+):
+    repository = issue_factory.create(number=0).repository
+    issue_factory.create(number=1, repository=repository)
+    mock_github_client.issues.paginate.return_value = iter(
+        [
+            # The first page updates an issue and creates the rest, the second page only creates
+            GitHubResponse(200, [github_issue(number) for number in range(1, page_size + 2)], True),
+            GitHubResponse(200, [github_issue(number) for number in range(page_size + 2, 2 * page_size + 2)], True),
+        ]
+    )
+
+    # The repository lookup and the cursor update, then for each page: the existing issues lookup,
+    # the issues upsert and their history insert in a transaction, a savepoint within the test, plus the
+    # history insert of the update on the first page.
+    with django_assert_num_queries(2 + 2 * (3 + 2) + 1):
+        issue_adapter_task(repository.owner_name, repository.name)
+
+    assert Issue.objects.filter(repository=repository).count() == 2 * page_size + 2
+
+
+@patch("gissues.extensions.github_client.tasks.notify_followers_task")
+@patch("gissues.extensions.github_client.tasks.bulk_comment_adapter_task")
+@patch("gissues.extensions.github_client.tasks.github_client")
+@pytest.mark.django_db
+def test_issue_adapter_task_in_graphql_mode(
+    mock_github_client,
+    mock_comment_task,
+    mock_notify_task,
+    issue,
+    comments_factory,
+    settings,
+    django_assert_num_queries,
+):
+    settings.GITHUB_CLIENT_SYNC_MODE = "graphql"
+    repository = issue.repository
+    comments_factory.create(comment_id=1, issue=issue)
+    mock_github_client.graphql.paginate_issues.return_value = iter(
+        [
+            GitHubResponse(
+                200,
+                [
+                    {
+                        **github_issue(issue.number, comments=2),
+                        "comment_list": [github_comment(1, body="Edited."), github_comment(2)],
+                    },
+                    {**github_issue(issue.number + 1, comments=1), "comment_list": [github_comment(3)]},
+                    {**github_issue(issue.number + 2), "comment_list": []},
+                ],
+                True,
+            ),
+        ]
+    )
+
+    # The repository lookup and the cursor update, the issues lookup and upsert, then the comments
+    # lookup and upsert, each upsert with the history inserts of its created and updated rows in a
+    # transaction, a savepoint within the test.
+    with django_assert_num_queries(2 + (4 + 2) + (4 + 2)):
+        issue_adapter_task(repository.owner_name, repository.name)
+
+    mock_github_client.graphql.paginate_issues.assert_called_once_with(
+        repository.owner_name, repository.name, since=None
+    )
+    mock_github_client.issues.paginate.assert_not_called()
+    mock_comment_task.apply_async.assert_not_called()
+    assert Comments.objects.get(comment_id=1).body == "Edited."
+    assert sorted(Comments.objects.filter(issue__repository=repository).values_list("comment_id", flat=True)) == [
+        1,
+        2,
+        3,
+    ]
+
+
+@patch("gissues.extensions.github_client.tasks.github_client")
+@pytest.mark.django_db
+@pytest.mark.parametrize("page_size", [1, 50])
+def test_comment_adapter_task_queries_per_page(
+    mock_github_client, issue, comments_factory, django_assert_num_queries, page_size
+):
+    comments_factory.create(comment_id=1, issue=issue)
+    mock_github_client.comments.paginate.return_value = iter(
+        [
+            GitHubResponse(200, [github_comment(comment_id) for comment_id in range(1, page_size + 2)], True),
+            GitHubResponse(
+                200, [github_comment(comment_id) for comment_id in range(page_size + 2, 2 * page_size + 2)], True
+            ),
+        ]
+    )
+
+    # The issue and its latest comment lookups, then for each page: the existing comments lookup, the comments
+    # upsert and their history insert in a transaction, a savepoint within the test, plus the history insert
+    # of the update on the first page.
+    with django_assert_num_queries(2 + 2 * (3 + 2) + 1):
+        comment_adapter_task(issue.repository.owner_name, issue.repository.name, issue.number)
+
+    assert Comments.objects.filter(issue=issue).count() == 2 * page_size + 1
+
+
+@patch("gissues.extensions.github_client.tasks.comment_adapter_task.retry")
+@patch("gissues.extensions.github_client.tasks.github_client")
+@pytest.mark.django_db
+def test_github_task_is_postponed_on_rate_limit(mock_github_client, mock_retry, issue):
+    exc = RateLimitExceeded(wait=42)
+    mock_github_client.comments.paginate.side_effect = exc
+    mock_retry.side_effect = Exception("retry")
+
+    with pytest.raises(Exception, match="retry"):
+        comment_adapter_task(issue.repository.owner_name, issue.repository.name, issue.number)
+
+    mock_retry.assert_called_once_with(exc=exc, countdown=42, max_retries=None)
+
+
+@patch("gissues.extensions.github_client.tasks.issue_adapter_task")
+@pytest.mark.django_db
+def test_check_for_new_issues_syncs_each_repository_once(
+    mock_issue_task, repository_factory, user_repository_follow_factory
+):
+    followed_repository, other_repository = repository_factory.create_batch(2)
+    user_repository_follow_factory.create_batch(3, repository=followed_repository)
+    repository_factory.create()
+
+    user_repository_follow_factory.create(repository=other_repository)
+
+    check_for_new_issues()
+
+    assert sorted(call.kwargs["args"] for call in mock_issue_task.apply_async.call_args_list) == sorted(
+        [
+            (followed_repository.owner_name, followed_repository.name),
+            (other_repository.owner_name, other_repository.name),
+        ]
+    )
+
+
+@patch("gissues.extensions.github_client.tasks.issue_adapter_task")
+@pytest.mark.django_db
+def test_check_for_new_issues_queues_due_repositories(
+    mock_issue_task, repository_factory, user_repository_follow_factory
+):
+    now = timezone.now()
+    never_synced, overdue, due, later = repository_factory.create_batch(4)
+    overdue.next_sync_at = now - datetime.timedelta(hours=1)
+    due.next_sync_at = now + datetime.timedelta(minutes=3)
+    later.next_sync_at = now + datetime.timedelta(minutes=10)
+    for repository in (never_synced, overdue, due, later):
+        repository.save()
+        user_repository_follow_factory.create(repository=repository)
+
+    with patch("gissues.extensions.github_client.tasks.timezone.now", return_value=now):
+        check_for_new_issues()
+
+    # The overdue repositories are spread over the 5 minutes tick, the due one waits for its time
+    assert [call.kwargs for call in mock_issue_task.apply_async.call_args_list] == [
+        {"args": (never_synced.owner_name, never_synced.name), "countdown": 0},
+        {"args": (overdue.owner_name, overdue.name), "countdown": 150},
+        {"args": (due.owner_name, due.name), "countdown": 180},
+    ]
+
+
+@patch("gissues.extensions.github_client.tasks.notify_followers_task")
+@patch("gissues.extensions.github_client.tasks.bulk_comment_adapter_task")
+@patch("gissues.extensions.github_client.tasks.github_client")
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "sync_interval, issues, expected_interval",
+    [
+        # The first interval is ISSUE_SYNC_INITIAL_INTERVAL_IN_MINUTES
+        (None, [github_issue(1)], 30),
+        (None, [], 90),
+        (datetime.timedelta(minutes=60 * 20), [], 60 * 24),
+        (datetime.timedelta(minutes=8), [github_issue(1)], 5),
+    ],
+)
+def test_issue_adapter_task_adapts_sync_interval(
+    mock_github_client, mock_comment_task, mock_notify_task, repository, sync_interval, issues, expected_interval
+):
+    repository.sync_interval = sync_interval
+    repository.save()
+    mock_github_client.issues.paginate.return_value = iter([GitHubResponse(200, issues, True)])
+
+    issue_adapter_task(repository.owner_name, repository.name)
+
+    repository.refresh_from_db()
+    assert repository.sync_interval == datetime.timedelta(minutes=expected_interval)
+    assert repository.next_sync_at - timezone.now() <= repository.sync_interval
+
+
+@patch("gissues.extensions.github_client.tasks.issue_adapter_task")
+@pytest.mark.django_db
+def test_check_for_new_issues_skips_queued_repositories(mock_issue_task, repository, user_repository_follow):
+    check_for_new_issues()
+    check_for_new_issues()
+
+    mock_issue_task.apply_async.assert_called_once_with(args=(repository.owner_name, repository.name), countdown=0)
+
+    # Once the task has finished, the repository can be queued again
+    clear_queued(repository_scope(repository.owner_name, repository.name))
+    check_for_new_issues()
+
+    assert mock_issue_task.apply_async.call_count == 2
+
+
+@pytest.mark.django_db
+def test_notify_followers_task(mailoutbox, repository, user_repository_follow_factory, django_assert_num_queries):
+    old_follow = user_repository_follow_factory.create(repository=repository)
+    old_follow.created_at = datetime.datetime(2021, 1, 1, tzinfo=datetime.timezone.utc)
+    old_follow.save()
+    new_follow = user_repository_follow_factory.create(repository=repository)
+    new_follow.created_at = datetime.datetime(2021, 6, 1, tzinfo=datetime.timezone.utc)
+    new_follow.save()
+
+    issues = [
+        {"number": 1, "title": "Old", "created_at": "2021-05-25T10:00:00Z", "updated_at": "2021-05-25T10:00:00Z"},
+        {"number": 2, "title": "New", "created_at": "2021-05-25T10:00:00Z", "updated_at": "2021-06-02T10:00:00Z"},
+    ]
+
+    with django_assert_num_queries(1):
+        notify_followers_task(repository.owner_name, repository.name, issues)
+
+    assert sorted((mail.to[0], "Title: New" in mail.body) for mail in mailoutbox) == sorted(
+        [
+            (old_follow.user.email, False),
+            (old_follow.user.email, True),
+            (new_follow.user.email, True),
+        ]
+    )
+
+
+@pytest.mark.django_db
+def test_notify_followers_task_collects_digest_notifications(
+    mailoutbox, issue_factory, user_factory, user_repository_follow_factory, django_assert_num_queries
+):
+    first_issue = issue_factory.create(title="First")
+    second_issue = issue_factory.create(title="Second", repository=first_issue.repository)
+    repository = first_issue.repository
+    immediate_follow = user_repository_follow_factory.create(repository=repository)
+    digest_follow = user_repository_follow_factory.create(
+        repository=repository, user=user_factory.create(notification_delivery=User.NotificationDelivery.DIGEST)
+    )
+    issues = [
+        {
+            "number": issue.number,
+            "title": issue.title,
+            "created_at": "2100-01-01T10:00:00Z",
+            "updated_at": "2100-01-01T10:00:00Z",
+        }
+        for issue in (first_issue, second_issue)
+    ]
+
+    # The followers lookup, the issues lookup and the pending notifications insert
+    with django_assert_num_queries(3):
+        notify_followers_task(repository.owner_name, repository.name, issues)
+
+    # An issue changed again before the digest is sent is not collected twice
+    notify_followers_task(repository.owner_name, repository.name, issues[:1])
+
+    assert [mail.to[0] for mail in mailoutbox] == [immediate_follow.user.email] * 3
+    assert sorted(
+        PendingNotification.objects.filter(user=digest_follow.user).values_list("issue__number", flat=True)
+    ) == sorted([first_issue.number, second_issue.number])
+
+
+@pytest.mark.django_db
+def test_send_notification_digests(mailoutbox, issue_factory, user_factory, django_assert_num_queries):
+    first_user, second_user = user_factory.create_batch(2, notification_delivery=User.NotificationDelivery.DIGEST)
+    first_issue, second_issue = issue_factory.create_batch(2)
+    PendingNotification.objects.bulk_create(
+        [
+            PendingNotification(user=first_user, issue=first_issue),
+            PendingNotification(user=first_user, issue=second_issue),
+            PendingNotification(user=second_user, issue=second_issue),
+        ]
+    )
+
+    # The pending notifications lookup and their deletion
+    with django_assert_num_queries(2):
+        send_notification_digests()
+
+    assert sorted((mail.to[0], mail.subject) for mail in mailoutbox) == sorted(
+        [(first_user.email, "2 New Issue Notifications"), (second_user.email, "1 New Issue Notifications")]
+    )
+    first_digest = next(mail for mail in mailoutbox if mail.to[0] == first_user.email)
+    for issue in (first_issue, second_issue):
+        assert (
+            f"- {issue.repository.owner_name}/{issue.repository.name} #{issue.number}: {issue.title}"
+            in first_digest.body
+        )
+    assert not PendingNotification.objects.exists()
+
+
+@pytest.mark.django_db
+def test_send_notification_digests_without_pending_notifications(mailoutbox):
+    send_notification_digests()
+
+    assert mailoutbox == []
@@ -1,4 +1,4 @@
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from rest_framework import serializers
 
@@ -57,7 +57,7 @@ def test_get_object_from_github():
 
     assert obj == {"key": "value"}
 
-    mock_func.assert_called_once_with(key="value")
+    mock_func.assert_called_once_with(key="value", use_reserve=True)
 
 
 def test_get_object_from_github_raises_exception():
@@ -73,7 +73,7 @@ def test_get_object_from_github_raises_exception():
 
     assert str(exc_info.value) == "Not Found"
 
-    mock_func.assert_called_once_with(key="value")
+    mock_func.assert_called_once_with(key="value", use_reserve=True)
 
 
 def test_get_object_or_sync_existing_object():
@@ -93,7 +93,8 @@ def test_get_object_or_sync_existing_object():
     mock_qs.filter.return_value.first.assert_called_once()
 
 
-def test_get_object_or_sync_new_object():
+@patch("gissues.extensions.github_client.api.views.response_cache")
+def test_get_object_or_sync_new_object(mock_response_cache):
     mock_qs = Mock()
     mock_qs.filter.return_value.first.return_value = None
 
@@ -107,16 +108,18 @@ def test_get_object_or_sync_new_object():
     transform_function = Mock()
     transform_function.return_value.dict.return_value = {"key": "value"}
     viewset.transform_function = transform_function
+    viewset.get_cache_scope = Mock(return_value=("owner", "owner_name"))
     viewset.kwargs = {"number": 1}
     viewset.lookup_field = "number"
 
     obj = viewset.get_object_or_sync({"number": 1})
 
     assert obj == viewset.model.objects.create.return_value
+    mock_response_cache.invalidate.assert_called_once_with(("owner", "owner_name"))
 
     mock_qs.filter.assert_called_once_with(number=1)
     mock_qs.filter.return_value.first.assert_called_once()
-    mock_func.assert_called_once_with(number=1)
+    mock_func.assert_called_once_with(number=1, use_reserve=True)
     viewset.transform_function.assert_called_once_with({"key": "value"})
     viewset.model.objects.create.assert_called_once_with(key="value")
 
@@ -151,3 +154,10 @@ def test_get_object_from_github_not_implemented():
         str(exc_info.value)
         == "You must define a 'client_detail_function' method in your viewset to use the 'get_object_from_github' method."
     )
+
+
+def test_get_cache_scope_not_implemented():
+    viewset = BaseGitHubClientViewSet()
+
+    with pytest.raises(NotImplementedError):
+        viewset.get_cache_scope()
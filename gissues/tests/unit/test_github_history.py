@@ -0,0 +1,142 @@
+import gzip
+import json
+from io import StringIO
+from unittest.mock import call, patch
+
+from django.core.management import call_command
+from django.utils import timezone
+
+import pytest
+
+from gissues.extensions.github.history import compact_history
+from gissues.extensions.github.models import Comments, Issue, Repository
+from gissues.extensions.github.tasks import compact_history_task
+from gissues.extensions.github_client.cache import issue_scope, owner_scope, repository_scope
+
+
+def create_history(issue, ages_in_days):
+    """Update an issue once per age, dating each history record that many days back."""
+    for age in ages_in_days:
+        issue.title = f"{issue.title}."
+        issue.save()
+        issue.history.filter(history_id=issue.history.latest().history_id).update(
+            history_date=timezone.now() - timezone.timedelta(days=age)
+        )
+
+
+@pytest.mark.django_db
+def test_compact_history_keeps_recent_and_latest_records(issue):
+    Issue.history.update(history_date=timezone.now() - timezone.timedelta(days=100))
+    create_history(issue, [95, 10])
+    recent_ids = list(issue.history.values_list("history_id", flat=True)[:1])
+
+    deleted = compact_history(Issue.history.model, timezone.now() - timezone.timedelta(days=90), batch_size=1000)
+
+    assert deleted == 2
+    assert list(issue.history.values_list("history_id", flat=True)) == recent_ids
+
+
+@pytest.mark.django_db
+def test_compact_history_keeps_latest_record_of_old_objects(issue_factory):
+    issue = issue_factory.create()
+    Issue.history.update(history_date=timezone.now() - timezone.timedelta(days=100))
+
+    deleted = compact_history(Issue.history.model, timezone.now() - timezone.timedelta(days=90), batch_size=1000)
+
+    assert deleted == 0
+    assert issue.history.count() == 1
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("batch_size", [1, 2, 1000])
+def test_compact_history_in_batches(issue, batch_size, django_assert_num_queries):
+    Issue.history.update(history_date=timezone.now() - timezone.timedelta(days=100))
+    create_history(issue, [100, 100, 100, 100])
+
+    # Every batch selects and deletes its records in its own transaction, a savepoint within the test,
+    # then the last one finds nothing left
+    num_batches = -(-4 // batch_size)
+    with django_assert_num_queries(num_batches * 4 + 3):
+        deleted = compact_history(Issue.history.model, timezone.now() - timezone.timedelta(days=90), batch_size)
+
+    assert deleted == 4
+    assert issue.history.count() == 1
+
+
+@pytest.mark.django_db
+def test_compact_history_archives_deleted_records(issue, tmp_path):
+    Issue.history.update(history_date=timezone.now() - timezone.timedelta(days=100))
+    create_history(issue, [100, 100])
+    expired_ids = list(issue.history.order_by("history_id").values_list("history_id", flat=True)[:2])
+
+    compact_history(
+        Issue.history.model, timezone.now() - timezone.timedelta(days=90), batch_size=1, archive_dir=tmp_path
+    )
+
+    (archive_path,) = tmp_path.iterdir()
+    assert archive_path.name.startswith(f"{Issue.history.model._meta.db_table}-")
+    with gzip.open(archive_path, "rt") as archive:
+        records = [json.loads(line) for line in archive]
+    assert [record["history_id"] for record in records] == expired_ids
+    assert all(record["id"] == issue.id for record in records)
+
+
+@pytest.mark.django_db
+def test_compact_history_command(issue, settings):
+    settings.HISTORY_RETENTION_DAYS = 30
+    Issue.history.update(history_date=timezone.now() - timezone.timedelta(days=50))
+    create_history(issue, [20, 10])
+    out = StringIO()
+
+    call_command("compact_history", stdout=out)
+
+    assert issue.history.count() == 2
+    assert "Deleted 1 github.HistoricalIssue records" in out.getvalue()
+    assert "Deleted 0 github.HistoricalComments records" in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_compact_history_invalidates_scopes_once_deleted(issue):
+    Issue.history.update(history_date=timezone.now() - timezone.timedelta(days=100))
+    create_history(issue, [100])
+    expired_id = issue.history.earliest().history_id
+    remaining_counts = []
+
+    with patch("gissues.extensions.github.history.response_cache") as mock_response_cache:
+        mock_response_cache.invalidate.side_effect = lambda *scopes: remaining_counts.append(issue.history.count())
+        compact_history(
+            Issue.history.model,
+            timezone.now() - timezone.timedelta(days=90),
+            batch_size=1000,
+            get_scopes=lambda batch: [
+                ("record", history_id) for history_id in batch.values_list("history_id", flat=True)
+            ],
+        )
+
+    assert mock_response_cache.invalidate.call_args_list == [call(("record", expired_id))]
+    assert remaining_counts == [1]
+
+
+@pytest.mark.django_db
+def test_compact_history_task_invalidates_cached_responses(issue, comments_factory):
+    comment = comments_factory.create(issue=issue)
+    repository = issue.repository
+    for obj in (repository, issue, comment):
+        obj.save()
+    for model in (Repository, Issue, Comments):
+        model.history.update(history_date=timezone.now() - timezone.timedelta(days=100))
+
+    with patch("gissues.extensions.github.history.response_cache") as mock_response_cache:
+        deleted = compact_history_task(retention_days=90, batch_size=1000)
+
+    assert deleted == {
+        "github.HistoricalRepository": 1,
+        "github.HistoricalIssue": 1,
+        "github.HistoricalComments": 1,
+    }
+    # The scopes the history of every object is served with
+    assert mock_response_cache.invalidate.call_args_list == [
+        call(owner_scope(repository.owner_name)),
+        call(repository_scope(repository.owner_name, repository.name)),
+        call(issue_scope(repository.owner_name, repository.name, issue.number)),
+    ]
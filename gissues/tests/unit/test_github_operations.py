@@ -0,0 +1,77 @@
+from unittest.mock import Mock
+
+from django.db import NotSupportedError, models
+from django.db.migrations.loader import MigrationLoader
+
+import pytest
+
+from gissues.extensions.github.operations import AddIndexConcurrently, AlterUniqueConstraintConcurrently
+
+
+def postgresql_schema_editor(in_atomic_block=False):
+    schema_editor = Mock()
+    schema_editor.connection.vendor = "postgresql"
+    schema_editor.connection.alias = "default"
+    schema_editor.connection.in_atomic_block = in_atomic_block
+    schema_editor.quote_name = lambda name: f'"{name}"'
+    return schema_editor
+
+
+@pytest.fixture
+def from_state():
+    return MigrationLoader(None).project_state(("github", "0003_repository_issues_synced_at"))
+
+
+def test_alter_unique_constraint_concurrently_on_postgresql(from_state):
+    operation = AlterUniqueConstraintConcurrently(
+        model_name="issue",
+        constraint=models.UniqueConstraint(fields=("repository", "number"), name="unique_issue"),
+    )
+    to_state = from_state.clone()
+    operation.state_forwards("github", to_state)
+    schema_editor = postgresql_schema_editor()
+
+    operation.database_forwards("github", schema_editor, from_state, to_state)
+
+    assert [call.args[0] for call in schema_editor.execute.call_args_list] == [
+        'DROP INDEX CONCURRENTLY IF EXISTS "unique_issue_new"',
+        'CREATE UNIQUE INDEX CONCURRENTLY "unique_issue_new" ON "github_issue" ("repository_id", "number")',
+        'ALTER TABLE "github_issue" DROP CONSTRAINT "unique_issue", '
+        'ADD CONSTRAINT "unique_issue" UNIQUE USING INDEX "unique_issue_new"',
+    ]
+
+    schema_editor.execute.reset_mock()
+    operation.database_backwards("github", schema_editor, to_state, from_state)
+
+    assert schema_editor.execute.call_args_list[1].args[0] == (
+        'CREATE UNIQUE INDEX CONCURRENTLY "unique_issue_new" ON "github_issue" ("number", "repository_id")'
+    )
+
+
+def test_alter_unique_constraint_concurrently_in_transaction(from_state):
+    operation = AlterUniqueConstraintConcurrently(
+        model_name="repository",
+        constraint=models.UniqueConstraint(fields=("owner_name", "name"), name="unique_repository"),
+    )
+    to_state = from_state.clone()
+    operation.state_forwards("github", to_state)
+    schema_editor = postgresql_schema_editor(in_atomic_block=True)
+
+    with pytest.raises(NotSupportedError):
+        operation.database_forwards("github", schema_editor, from_state, to_state)
+
+    schema_editor.execute.assert_not_called()
+
+
+@pytest.mark.parametrize("vendor, kwargs", [("postgresql", {"concurrently": True}), ("sqlite", {})])
+def test_add_index_concurrently(from_state, vendor, kwargs):
+    index = models.Index(fields=["issue", "updated_at"], name="comment_issue_updated_idx")
+    operation = AddIndexConcurrently(model_name="comments", index=index)
+    to_state = from_state.clone()
+    operation.state_forwards("github", to_state)
+    schema_editor = postgresql_schema_editor()
+    schema_editor.connection.vendor = vendor
+
+    operation.database_forwards("github", schema_editor, from_state, to_state)
+
+    schema_editor.add_index.assert_called_once_with(to_state.apps.get_model("github", "comments"), index, **kwargs)
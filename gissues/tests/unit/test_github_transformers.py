@@ -7,7 +7,13 @@ import pytest
 
 from gissues.extensions.github.dataclasses import BaseDataclass
 from gissues.extensions.github.models import Issue, Repository
-from gissues.extensions.github.transformers import transform_comments, transform_issue, transform_repository
+from gissues.extensions.github.transformers import (
+    bulk_transform_comments,
+    bulk_transform_issues,
+    transform_comments,
+    transform_issue,
+    transform_repository,
+)
 
 
 def test_base_dataclass_dict():
@@ -96,14 +102,19 @@ def test_transform_comments(mock_get_object_or_404, issue_factory):
         "created_at": "2021-05-25T10:00:00Z",
         "updated_at": "2021-05-25T10:00:00Z",
     }
-    transformed_comment = transform_comments(comment, issue.number)
+    transformed_comment = transform_comments(comment, issue.number, issue.repository.name, issue.repository.owner_name)
     assert transformed_comment.body == comment["body"]
     assert transformed_comment.issue == issue
     assert transformed_comment.comment_id == comment["id"]
     assert transformed_comment.created_at == comment["created_at"]
     assert transformed_comment.updated_at == comment["updated_at"]
 
-    mock_get_object_or_404.assert_called_once_with(Issue, number=issue.number)
+    mock_get_object_or_404.assert_called_once_with(
+        Issue,
+        number=issue.number,
+        repository__name=issue.repository.name,
+        repository__owner_name=issue.repository.owner_name,
+    )
 
 
 @patch("gissues.extensions.github.transformers.get_object_or_404")
@@ -117,7 +128,12 @@ def test_transform_comments(mock_get_object_or_404, issue_factory):
             {"issue": {}, "repository_name": "gissues", "owner_name": "gissues"},
             {"name": "gissues", "owner_name": "gissues"},
         ),
-        (transform_comments, Issue, {"comment": {}, "issue_number": 1}, {"number": 1}),
+        (
+            transform_comments,
+            Issue,
+            {"comment": {}, "issue_number": 1, "repository_name": "gissues", "owner_name": "gissues"},
+            {"number": 1, "repository__name": "gissues", "repository__owner_name": "gissues"},
+        ),
     ],
 )
 def test_transformers_with_http404(mock_get_object_or_404, func, model, func_args, get_object_or_404_kwargs):
@@ -127,3 +143,52 @@ def test_transformers_with_http404(mock_get_object_or_404, func, model, func_arg
         func(**func_args)
 
     mock_get_object_or_404.assert_called_once_with(model, **get_object_or_404_kwargs)
+
+
+@pytest.mark.django_db
+def test_bulk_transform_issues(repository_factory, django_assert_num_queries):
+    repository = repository_factory.create()
+    issues = [
+        {
+            "title": f"Issue {number}",
+            "number": number,
+            "body": "This is an issue.",
+            "state": "closed",
+            "comments": 1,
+            "closed_at": "2021-05-26T10:00:00Z",
+            "state_reason": "completed",
+            "locked": False,
+            "active_lock_reason": None,
+            "created_at": "2021-05-25T10:00:00Z",
+            "updated_at": "2021-05-26T10:00:00Z",
+        }
+        for number in range(1, 4)
+    ]
+
+    with django_assert_num_queries(0):
+        transformed_issues = bulk_transform_issues(issues, repository)
+
+    assert [transformed_issue.number for transformed_issue in transformed_issues] == [1, 2, 3]
+    assert all(transformed_issue.repository == repository for transformed_issue in transformed_issues)
+    assert transformed_issues[0].is_closed is True
+    assert transformed_issues[0].comment_count == 1
+
+
+@pytest.mark.django_db
+def test_bulk_transform_comments(issue_factory, django_assert_num_queries):
+    issue = issue_factory.create()
+    comments = [
+        {
+            "id": comment_id,
+            "body": "This is a comment",
+            "created_at": "2021-05-25T10:00:00Z",
+            "updated_at": "2021-05-25T10:00:00Z",
+        }
+        for comment_id in range(1, 4)
+    ]
+
+    with django_assert_num_queries(0):
+        transformed_comments = bulk_transform_comments(comments, issue)
+
+    assert [transformed_comment.comment_id for transformed_comment in transformed_comments] == [1, 2, 3]
+    assert all(transformed_comment.issue == issue for transformed_comment in transformed_comments)
@@ -4,8 +4,13 @@ from django.http import HttpRequest
 from django.urls import NoReverseMatch
 from django.urls.resolvers import URLPattern, URLResolver
 
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
 import pytest
 
+from gissues.extensions.utils import SwitchablePagination, switchable_pagination_factory
+
 
 @patch("gissues.extensions.utils.reverse")
 def test_resolve_url(mock_reverse, api_root_view):
@@ -158,3 +163,41 @@ def test_api_root_view_get(mock_get_routes, api_root_view):
     response = api_root_view.get(Mock())
 
     assert response.data == {"test": ("test", "http://test.com")}
+
+
+def test_switchable_pagination_factory():
+    pagination_class = switchable_pagination_factory(page_size=10)
+
+    assert issubclass(pagination_class, SwitchablePagination)
+    assert pagination_class.default_pagination == "page"
+    assert issubclass(pagination_class.pagination_classes["page"], PageNumberPagination)
+    assert issubclass(pagination_class.pagination_classes["cursor"], CursorPagination)
+    for paginator_class in pagination_class.pagination_classes.values():
+        assert paginator_class.page_size == 10
+        assert paginator_class.max_page_size == 100
+
+
+def test_switchable_pagination_schema_operation_parameters():
+    paginator = switchable_pagination_factory(page_size=10)()
+
+    parameters = paginator.get_schema_operation_parameters(Mock())
+
+    assert [parameter["name"] for parameter in parameters] == ["pagination", "page", "page_size", "cursor"]
+    assert parameters[0]["schema"]["enum"] == ["page", "cursor"]
+
+
+@pytest.mark.parametrize("pagination", ["page", "cursor"])
+def test_switchable_pagination_with_ordering(pagination):
+    paginator = switchable_pagination_factory(page_size=10)()
+    request = Mock(query_params={"pagination": pagination, "ordering": "title"})
+
+    with patch.object(paginator.pagination_classes[pagination], "paginate_queryset") as mock_paginate_queryset:
+        if pagination == "cursor":
+            # The ordering could be on a non-unique field, the cursor would skip or repeat rows
+            with pytest.raises(ValidationError) as exc_info:
+                paginator.paginate_queryset(Mock(), request)
+            assert "ordering" in exc_info.value.detail
+            mock_paginate_queryset.assert_not_called()
+        else:
+            paginator.paginate_queryset(Mock(), request)
+            mock_paginate_queryset.assert_called_once()